@@ -0,0 +1,141 @@
+"""
+Concurrent-connection throughput of the asyncio server versus the Flask app
+on Werkzeug's threaded server. Each server runs in its own process and is
+driven by the same asyncio client: N connections (kept alive where the
+server allows it), each playing games by sending guess requests back to back.
+
+Run with: python -m benchmarks.bench_async_server --connections 16 64 256
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+from src.word_list import get_word_list
+
+# Werkzeug answers with HTTP/1.0 unless told otherwise; the client below also
+# reconnects whenever a server closes the connection
+FLASK_SERVER = (
+    "import logging, sys; from flask import Flask; from src.web import init_api; "
+    "from werkzeug.serving import WSGIRequestHandler; "
+    "WSGIRequestHandler.protocol_version = 'HTTP/1.1'; "
+    "logging.getLogger('werkzeug').setLevel(logging.ERROR); "
+    "init_api(Flask('bench')).run(port=int(sys.argv[1]), threaded=True)"
+)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(kind: str, port: int) -> subprocess.Popen:
+    if kind == "async":
+        # Keep benchmark games out of the real results log
+        results = os.path.join(tempfile.mkdtemp(prefix="wordle-bench-"), "results.jsonl")
+        command = [sys.executable, "-m", "src.async_server", "--port", str(port), "--results", results]
+    else:
+        command = [sys.executable, "-c", FLASK_SERVER, str(port)]
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return process
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError(f"{kind} server did not start")
+
+
+async def request(reader, writer, method, path, body=None):
+    payload = json.dumps(body).encode() if body is not None else b""
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: bench\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload
+    )
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    length = 0
+    keep_alive = True
+    for line in head.lower().split(b"\r\n"):
+        if line.startswith(b"content-length:"):
+            length = int(line.split(b":", 1)[1])
+        elif line.startswith(b"connection:"):
+            keep_alive = b"close" not in line
+    return json.loads(await reader.readexactly(length)), keep_alive
+
+
+class Connection:
+    """A client connection that reconnects when the server closes it."""
+
+    def __init__(self, port):
+        self.port = port
+        self.streams = None
+
+    async def request(self, method, path, body=None):
+        if self.streams is None:
+            self.streams = await asyncio.open_connection("127.0.0.1", self.port)
+        payload, keep_alive = await request(*self.streams, method, path, body)
+        if not keep_alive:
+            self.close()
+        return payload
+
+    def close(self):
+        if self.streams is not None:
+            self.streams[1].close()
+            self.streams = None
+
+
+async def client(port, guesses, seed, deadline, counts):
+    rng = random.Random(seed)
+    connection = Connection(port)
+    game_id = None
+    try:
+        while time.perf_counter() < deadline:
+            if game_id is None:
+                game_id = (await connection.request("POST", "/api/games"))["id"]
+            state = await connection.request("POST", f"/api/games/{game_id}/guess",
+                                             {"guess": rng.choice(guesses)})
+            counts.append(1)
+            if state.get("over", True):
+                game_id = None
+    finally:
+        connection.close()
+
+
+async def drive(port, connections, seconds, guesses):
+    counts = []
+    deadline = time.perf_counter() + seconds
+    await asyncio.gather(*(client(port, guesses, i, deadline, counts) for i in range(connections)))
+    return len(counts) / seconds
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare async and Flask server throughput.")
+    parser.add_argument("--connections", type=int, nargs="+", default=[16, 64])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args(argv)
+
+    guesses = list(get_word_list().allowed_guesses)
+    for kind in ("flask", "async"):
+        port = free_port()
+        process = start_server(kind, port)
+        try:
+            for connections in args.connections:
+                rate = asyncio.run(drive(port, connections, args.seconds, guesses))
+                print(f"{kind:<6} {connections:4d} connections: {rate:8,.0f} guesses/sec")
+        finally:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Candidate filtering with the bitset ConstraintIndex versus a linear scan
+that rescores every answer, over histories of one to three guesses.
+
+Run with: python -m benchmarks.bench_constraint_index
+"""
+import random
+import time
+
+from src.constraint_index import get_constraint_index
+from src.feedback import score_guess
+from src.word_list import get_word_list
+
+
+def naive_filter(words, history):
+    return [w for w in words if all(score_guess(g, w) == statuses for g, statuses in history)]
+
+
+def main(histories=200, seed=0):
+    word_list = get_word_list()
+    answers = list(word_list.answers)
+    guesses = word_list.guess_words()
+
+    start = time.perf_counter()
+    index = get_constraint_index(word_list)
+    print(f"index build: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    rng = random.Random(seed)
+    for length in (1, 2, 3):
+        cases = []
+        for _ in range(histories):
+            answer = rng.choice(answers)
+            cases.append([(g, score_guess(g, answer)) for g in rng.sample(guesses, length)])
+
+        start = time.perf_counter()
+        indexed = [index.candidates(history) for history in cases]
+        index_time = (time.perf_counter() - start) / histories
+
+        start = time.perf_counter()
+        naive = [naive_filter(answers, history) for history in cases[:20]]
+        naive_time = (time.perf_counter() - start) / 20
+
+        assert indexed[:20] == naive
+        print(f"{length} guess(es): index {index_time * 1e6:8.1f} us, naive {naive_time * 1e6:9.1f} us "
+              f"({naive_time / index_time:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
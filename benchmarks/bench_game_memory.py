@@ -0,0 +1,73 @@
+"""
+Bytes per live game for WordleGame versus CompactGame, each holding three
+guesses, measured with tracemalloc.
+
+Run with: python -m benchmarks.bench_game_memory
+"""
+import random
+import tracemalloc
+
+from src.game import WordleGame
+from src.game_state import CompactGame
+from src.word_list import get_word_list
+
+
+class LegacyWordleGame:
+    """The per-game footprint before this change: a dict, stats counters and
+    a fresh WordList per game (its contents are shared here to isolate the
+    per-game cost)."""
+
+    def __init__(self, word, word_list):
+        self.word = word.lower()
+        self.attempts = []
+        self.max_attempts = 6
+        self.game_over = False
+        self.games_played = 0
+        self.games_won = 0
+        self.current_streak = 0
+        self.max_streak = 0
+        self.word_list = word_list
+
+
+def bytes_per_game(create, n_games):
+    tracemalloc.start()
+    games = [create(i) for i in range(n_games)]
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del games
+    return used / n_games
+
+
+def main(n_games=100_000, seed=0):
+    word_list = get_word_list()
+    rng = random.Random(seed)
+    answers = [rng.choice(word_list.answers) for _ in range(n_games)]
+    guesses = [[rng.choice(word_list.allowed_guesses) for _ in range(3)] for _ in range(n_games)]
+
+    def legacy(i):
+        game = LegacyWordleGame(answers[i], word_list)
+        game.attempts.extend(guess.lower() for guess in guesses[i])
+        return game
+
+    def current(i):
+        game = WordleGame(answers[i], word_list)
+        for guess in guesses[i]:
+            game.make_guess(guess)
+        return game
+
+    def compact(i):
+        game = CompactGame.for_word(answers[i], word_list)
+        for guess in guesses[i]:
+            game.make_guess(guess, word_list)
+        return game
+
+    def serialized(i):
+        return compact(i).to_bytes()
+
+    for label, create in (("legacy", legacy), ("WordleGame", current),
+                          ("CompactGame", compact), ("serialized", serialized)):
+        print(f"{label:<12} {bytes_per_game(create, n_games):8.1f} bytes/game")
+
+
+if __name__ == "__main__":
+    main()
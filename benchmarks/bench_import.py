@@ -0,0 +1,68 @@
+"""
+Import time of the headless core versus the front-ends, measured with
+python -X importtime in fresh interpreters, plus a check that the core pulls
+in none of the GUI / web frameworks.
+
+Run with: python -m benchmarks.bench_import [--runs 5] [--core-target 50]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+CORE = ["src.game", "src.word_list", "src.service", "src.simulator", "src.game_state"]
+FRONT_ENDS = ["src.ui.app", "src.web"]
+FRAMEWORKS = ("kivy", "flask", "werkzeug", "numpy")
+
+
+def import_profile(modules: list[str]) -> tuple[float, set[str]]:
+    """
+    Import modules in a fresh interpreter.
+    Returns:
+        tuple[float, set[str]]: Total cumulative import time in ms and the
+            top-level packages that were imported.
+    """
+    code = "; ".join(f"import {module}" for module in modules)
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, check=True,
+        env={"KIVY_NO_ARGS": "1", "KIVY_NO_CONSOLELOG": "1", "KIVY_NO_FILELOG": "1"},
+    ).stderr
+    total = 0
+    packages = set()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Each requested module's cumulative time covers everything it
+        # imported that was not loaded already (interpreter startup excluded)
+        if name.strip() in modules:
+            total += int(cumulative)
+        packages.add(name.strip().split(".")[0])
+    return total / 1000, packages
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measure import times.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--core-target", type=float, help="fail if the core takes longer than this many ms")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for label, modules in [("core", CORE)] + [(module, [module]) for module in FRONT_ENDS]:
+        results = [import_profile(modules) for _ in range(args.runs)]
+        median = statistics.median(ms for ms, _ in results)
+        frameworks = sorted(set(FRAMEWORKS) & results[0][1])
+        print(f"{label:<12} median {median:7.1f} ms  frameworks: {', '.join(frameworks) or 'none'}")
+        if label == "core":
+            if frameworks:
+                print("the core must not import GUI or web frameworks")
+                failed = True
+            if args.core_target is not None and median > args.core_target:
+                print(f"core import is above the {args.core_target} ms target")
+                failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
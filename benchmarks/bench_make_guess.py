@@ -0,0 +1,69 @@
+"""
+Micro-benchmark for WordleGame.make_guess, before and after the two-pass
+letter-count scorer. The old scorer over-reports repeated letters, so the
+Counter-based reference scorer is also timed as the baseline for a correct
+implementation.
+
+Run with: python -m benchmarks.bench_make_guess
+"""
+import random
+import time
+
+from src.feedback import score_guess
+from src.game import WordleGame
+from src.word_list import get_word_list
+
+
+def legacy_make_guess(game, guess):
+    """The original scorer, which rescanned the word for every letter."""
+    guess = guess.lower()
+    result = []
+    for i, letter in enumerate(guess):
+        if letter == game.word[i]:
+            result.append((letter.upper(), 'correct'))
+        elif letter in game.word:
+            result.append((letter.upper(), 'present'))
+        else:
+            result.append((letter.upper(), 'absent'))
+    game.attempts.append(guess)
+    return result
+
+
+def reference_make_guess(game, guess):
+    """A straightforward correct scorer built on the reference implementation."""
+    guess = guess.lower()
+    result = [(letter.upper(), status) for letter, status in zip(guess, score_guess(guess, game.word))]
+    game.attempts.append(guess)
+    return result
+
+
+def calls_per_second(make_guess, games, guesses, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for game, guess in zip(games, guesses):
+            make_guess(game, guess)
+        best = min(best, time.perf_counter() - start)
+        for game in games:
+            game.attempts.clear()
+    return len(guesses) / best
+
+
+def main(pairs=100_000, seed=0):
+    word_list = get_word_list()
+    rng = random.Random(seed)
+    answers = list(word_list.answers)
+    all_words = word_list.guess_words()
+    games = [WordleGame(rng.choice(answers), word_list) for _ in range(pairs)]
+    guesses = [rng.choice(all_words) for _ in range(pairs)]
+
+    before = calls_per_second(legacy_make_guess, games, guesses)
+    reference = calls_per_second(reference_make_guess, games, guesses)
+    after = calls_per_second(WordleGame.make_guess, games, guesses)
+    print(f"before:    {before:12,.0f} calls/sec (over-reports repeated letters)")
+    print(f"reference: {reference:12,.0f} calls/sec")
+    print(f"after:     {after:12,.0f} calls/sec ({after / before:.2f}x before, {after / reference:.2f}x reference)")
+
+
+if __name__ == "__main__":
+    main()
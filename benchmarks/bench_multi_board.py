@@ -0,0 +1,73 @@
+"""
+Per-guess latency of a multi-board game: one WordleGame per board, each
+scored with make_guess() and followed by its own keyboard update pass,
+versus MultiBoardGame scoring every unsolved board in one batched call and
+updating the whole (boards, 26) keyboard in one scatter. Also reports the
+memory each form needs to hold a game's state.
+
+Run with: python -m benchmarks.bench_multi_board
+"""
+import random
+import statistics
+import time
+import tracemalloc
+
+from src.game import WordleGame
+from src.multi_board import MultiBoardGame
+from src.word_list import get_word_list
+
+GAMES = 200
+STATUS_RANK = {"absent": 0, "present": 1, "correct": 2}
+
+
+class PerBoardGame:
+    """N independent games, with one keyboard dict per board."""
+
+    def __init__(self, words, word_list):
+        self.games = [WordleGame(word, word_list) for word in words]
+        self.keyboards = [{} for _ in words]
+
+    def make_guess(self, guess):
+        for game, keyboard in zip(self.games, self.keyboards):
+            if game.is_won():
+                continue
+            for letter, status in game.make_guess(guess):
+                rank = STATUS_RANK[status]
+                if keyboard.get(letter, -1) < rank:
+                    keyboard[letter] = rank
+
+
+def per_guess_us(create, boards, word_list, guesses):
+    rng = random.Random(boards)
+    times = []
+    for _ in range(GAMES):
+        game = create(rng.sample(word_list.answers, boards), word_list)
+        for guess in rng.sample(guesses, boards + 5):
+            start = time.perf_counter()
+            game.make_guess(guess)
+            times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1e6
+
+
+def state_bytes(create, boards, word_list):
+    words = random.Random(0).sample(word_list.answers, boards)
+    tracemalloc.start()
+    game = create(words, word_list)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del game
+    return used
+
+
+def main():
+    word_list = get_word_list()
+    guesses = list(word_list.answers)
+    for boards in (8, 32):
+        for label, create in [("per-board", PerBoardGame), ("batched", MultiBoardGame)]:
+            micros = per_guess_us(create, boards, word_list, guesses)
+            size = state_bytes(create, boards, word_list)
+            print(f"{boards:>2} boards  {label:<9}  {micros:7.1f} us per guess  {size:7d} bytes of state")
+
+
+if __name__ == "__main__":
+    main()
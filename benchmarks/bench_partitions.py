@@ -0,0 +1,94 @@
+"""
+Load time and memory of each word-length partition, loaded on its own the
+way get_word_list() loads it the first time a game of that length starts.
+
+Only the 5-letter lists ship in data/; a length without a partition on
+disk is measured on a synthetic one (random words, as many as the 5-letter
+lists hold) so every length gets comparable numbers. Each partition is
+timed from the text lists and from its compiled words.bin; memory is what
+tracemalloc sees the loaded WordList allocate. The pattern table column is
+the size the solver's table would take for that length (built on demand,
+never here).
+
+Run with: python -m benchmarks.bench_partitions
+"""
+from pathlib import Path
+import random
+import shutil
+import statistics
+import string
+import tempfile
+import time
+import tracemalloc
+
+from src.batch_scoring import pattern_dtype
+from src.packed_words import COMPILED_FILE, compile_word_lists, read_word_file
+from src.word_list import (
+    ALLOWED_GUESSES_FILE, ANSWERS_FILE, SUPPORTED_LENGTHS, WORD_LENGTH, WordList, partition_dir,
+)
+
+REPEATS = 5
+
+
+def synthesize_partition(data_dir: Path, word_length: int, n_answers: int, n_allowed: int):
+    rng = random.Random(word_length)
+    words = set()
+    while len(words) < n_answers + n_allowed:
+        words.add("".join(rng.choices(string.ascii_lowercase, k=word_length)))
+    words = sorted(words)
+    rng.shuffle(words)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    (data_dir / ANSWERS_FILE).write_text("\n".join(sorted(words[:n_answers])) + "\n")
+    (data_dir / ALLOWED_GUESSES_FILE).write_text("\n".join(sorted(words[n_answers:])) + "\n")
+
+
+def measure(data_dir: Path, word_length: int) -> tuple[float, int]:
+    """Median load time (ms) and bytes allocated by one loaded WordList."""
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        WordList(data_dir, word_length)
+        times.append((time.perf_counter() - start) * 1000)
+    tracemalloc.start()
+    word_list = WordList(data_dir, word_length)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del word_list
+    return statistics.median(times), used
+
+
+def main():
+    base = partition_dir(WORD_LENGTH)
+    n_answers = len(read_word_file(base / ANSWERS_FILE))
+    n_allowed = len(read_word_file(base / ALLOWED_GUESSES_FILE))
+
+    print(f"{'length':>6} {'source':>9} {'words':>6} {'text ms':>8} {'text KB':>8} "
+          f"{'bin ms':>7} {'bin KB':>7} {'table MB':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for word_length in SUPPORTED_LENGTHS:
+            # Measure a copy so compiling words.bin never touches data/
+            data_dir = Path(tmp) / f"words-{word_length}"
+            source = partition_dir(word_length)
+            if (source / ANSWERS_FILE).exists():
+                data_dir.mkdir()
+                for name in (ANSWERS_FILE, ALLOWED_GUESSES_FILE):
+                    shutil.copy(source / name, data_dir / name)
+                origin = "data"
+            else:
+                synthesize_partition(data_dir, word_length, n_answers, n_allowed)
+                origin = "synthetic"
+
+            text_ms, text_bytes = measure(data_dir, word_length)
+            answers = read_word_file(data_dir / ANSWERS_FILE)
+            allowed = read_word_file(data_dir / ALLOWED_GUESSES_FILE)
+            compile_word_lists(answers, allowed, data_dir / COMPILED_FILE, word_length)
+            bin_ms, bin_bytes = measure(data_dir, word_length)
+
+            words = len(answers) + len(allowed)
+            table_mb = words * len(answers) * pattern_dtype(word_length).itemsize / 1e6
+            print(f"{word_length:>6} {origin:>9} {words:>6} {text_ms:>8.2f} {text_bytes / 1024:>8.0f} "
+                  f"{bin_ms:>7.2f} {bin_bytes / 1024:>7.0f} {table_mb:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
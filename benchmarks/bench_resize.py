@@ -0,0 +1,69 @@
+"""
+Cost of a drag-resize gesture: the old handler, which resized the grid and
+every tile on each on_resize event, versus coalescing the events into one
+relayout per frame.
+
+A drag is simulated as FRAMES frames with EVENTS_PER_FRAME resize events
+each (window managers deliver resize events faster than the frame rate).
+
+Run with: python -m benchmarks.bench_resize
+"""
+import os
+import time
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+
+from kivy.clock import Clock
+from kivy.lang import Builder
+from kivy.metrics import dp
+
+from src.ui.app import KV_FILE, NUM_ATTEMPTS, WORD_LENGTH, WordleGameUI
+
+FRAMES = 30
+EVENTS_PER_FRAME = 8
+
+
+def legacy_on_window_resize(ui, width, height):
+    """WordleGameUI._on_window_resize before resize events were coalesced."""
+    tile_size = min(dp(62), (width - dp(100)) / WORD_LENGTH)
+    grid_width = (tile_size * WORD_LENGTH) + ((WORD_LENGTH - 1) * dp(5))
+    grid_height = (tile_size * NUM_ATTEMPTS) + ((NUM_ATTEMPTS - 1) * dp(5))
+    ui.tile_grid.size = (grid_width, grid_height)
+    for row in ui.tiles:
+        for tile in row:
+            tile.size = (tile_size, tile_size)
+
+
+def drag(ui, on_resize):
+    """Resize from 300 px to 420 px wide and back, one frame at a time."""
+    widths = [300 + i for i in range(0, 120, 1)] + [420 - i for i in range(0, 120, 1)]
+    start = time.process_time()
+    for frame in range(FRAMES):
+        for event in range(EVENTS_PER_FRAME):
+            width = widths[(frame * EVENTS_PER_FRAME + event) % len(widths)]
+            on_resize(width, 700)
+        Clock.tick_draw()
+    return time.process_time() - start
+
+
+def main():
+    Builder.load_file(str(KV_FILE))
+    events = FRAMES * EVENTS_PER_FRAME
+    for label, make_handler in [
+        ("legacy", lambda ui: lambda width, height: legacy_on_window_resize(ui, width, height)),
+        ("coalesced", lambda ui: lambda width, height: ui._on_window_resize(None, width, height)),
+    ]:
+        ui = WordleGameUI()
+        tile_updates = [0]
+        for tile in ui.tile_grid.iter_tiles():
+            tile.fbind("size", lambda *args: tile_updates.__setitem__(0, tile_updates[0] + 1))
+        Clock.tick()
+        seconds = drag(ui, make_handler(ui))
+        relayouts = ui.resize_stats["relayouts"] if label == "coalesced" else events
+        print(f"{label:<10} {events} resize events over {FRAMES} frames: {relayouts} relayouts, "
+              f"{tile_updates[0]} tile resizes, {seconds * 1000:6.1f} ms CPU")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Cost of revealing one row of five tiles: the old per-tile approach (two
+Clock.schedule_once lambdas and a fresh Animation chain per tile, plus a
+fixed 1.5 s timer for the game over check) versus the RevealScheduler's
+single per-frame callback over precomputed timelines.
+
+Reports CPU time per reveal, the clock events and Animation objects created,
+and how long after the last tile settles the game over check runs.
+
+Run with: python -m benchmarks.bench_reveal
+"""
+import os
+import time
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+
+from kivy.animation import Animation
+from kivy.clock import Clock
+
+from src.ui.reveal import RevealScheduler
+from src.ui.tile import Tile
+
+STATUSES = ["correct", "present", "absent", "absent", "present"]
+
+
+class Counters:
+    def __init__(self):
+        self.events = 0
+        self.animations = 0
+        self.settled = None
+        self.checked = None
+
+
+def legacy_reveal(tiles, counters):
+    """WordleGameUI.animate_reveal_tiles and on_enter before the scheduler."""
+    def schedule_once(callback, timeout):
+        counters.events += 1
+        Clock.schedule_once(callback, timeout)
+
+    def animate_reveal_tile(tile, status):
+        anim1 = Animation(opacity=0, duration=0.15)
+        anim2 = Animation(opacity=1, duration=0.15)
+        counters.animations += 2
+        anim1.bind(on_complete=lambda anim, tile: tile.set_status(status))
+        anim = anim1 + anim2
+        anim.bind(on_complete=lambda *args: setattr(counters, "settled", time.perf_counter()))
+        anim.start(tile)
+
+    for i, status in enumerate(STATUSES):
+        tile = tiles[i]
+        schedule_once(lambda dt, tile=tile, status=status: animate_reveal_tile(tile, status), i * 0.2)
+        schedule_once(lambda dt: None, i * 0.2 + 0.1)  # Keyboard key update
+    schedule_once(lambda dt: setattr(counters, "checked", time.perf_counter()), 1.5)
+
+
+def scheduler_reveal(tiles, counters, scheduler):
+    counters.events += 1
+    scheduler.reveal(tiles, STATUSES)
+
+
+def run(label, reveal, runs):
+    cpu = lag = 0.0
+    totals = Counters()
+    for _ in range(runs):
+        tiles = [Tile(text=letter) for letter in "CRANE"]
+        counters = Counters()
+        scheduler = RevealScheduler(instant=False)
+
+        def on_complete(*args):
+            counters.settled = counters.checked = time.perf_counter()
+        scheduler.bind(on_complete=on_complete)
+
+        Clock.tick()
+        start = time.process_time()
+        reveal(tiles, counters, scheduler)
+        while counters.checked is None or counters.settled is None:
+            Clock.tick()
+        cpu += time.process_time() - start
+        lag += counters.checked - counters.settled
+        totals.events += counters.events
+        totals.animations += counters.animations
+
+    print(f"{label:<10} {cpu / runs * 1000:7.2f} ms CPU/reveal, {totals.events // runs} clock events, "
+          f"{totals.animations // runs} Animations, game over check {lag / runs * 1000:5.0f} ms after last flip")
+
+
+def main(runs=5):
+    run("legacy", lambda tiles, counters, scheduler: legacy_reveal(tiles, counters), runs)
+    run("scheduler", scheduler_reveal, runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Latency of Solver.suggest() at the start of a game and after one and two
+guesses, averaged over a fixed sample of answers.
+
+Run with: python -m benchmarks.bench_solver
+"""
+import random
+import statistics
+import time
+
+from src.game import WordleGame
+from src.solver import Solver
+from src.word_list import get_word_list
+
+
+def main(games=50, seed=0, top_k=5):
+    word_list = get_word_list()
+    solver = Solver(word_list)
+    solver.suggest(top_k)  # Build or load the caches before timing
+
+    rng = random.Random(seed)
+    timings = {0: [], 1: [], 2: []}
+    sizes = {0: [], 1: [], 2: []}
+    for answer in rng.sample(list(word_list.answers), games):
+        game = WordleGame(answer, word_list)
+        solver.sync(game)
+        for turn in range(3):
+            start = time.perf_counter()
+            suggestions = solver.suggest(top_k)
+            timings[turn].append(time.perf_counter() - start)
+            sizes[turn].append(len(solver.candidates))
+            game.make_guess(suggestions[0][0])
+            solver.sync(game)
+            if game.is_won():
+                break
+
+    for turn, samples in timings.items():
+        if samples:
+            print(f"after {turn} guesses: {statistics.mean(sizes[turn]):7.1f} candidates, "
+                  f"mean {statistics.mean(samples) * 1000:6.2f} ms, max {max(samples) * 1000:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Load test of the SQLite statistics backend: insert rate for batched
+finished games, then per-user stats-read and history latency once the
+database holds 1M games.
+
+Run with: python -m benchmarks.bench_sqlite_store [--games 1000000] [--users 50000]
+"""
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from src.sqlite_store import SQLiteStatsStore
+
+BATCH = 1_000
+
+
+def make_batch(rng, users, start_time):
+    batch = []
+    for i in range(BATCH):
+        guesses = rng.randint(1, 6)
+        batch.append({
+            "user": f"user{rng.randrange(users)}",
+            "answer": "crane",
+            "guesses": ["slate"] * (guesses - 1) + ["crane"],
+            "won": rng.random() < 0.9,
+            "duration": rng.uniform(20, 300),
+            "finished_at": start_time + i,
+        })
+    return batch
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return (statistics.median(samples) * 1e6, samples[int(len(samples) * 0.99)] * 1e6)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--games", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=50_000)
+    parser.add_argument("--reads", type=int, default=10_000)
+    args = parser.parse_args(argv)
+    rng = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteStatsStore(Path(tmp) / "stats.db")
+        inserted = 0
+        insert_seconds = 0.0
+        while inserted < args.games:
+            batch = make_batch(rng, args.users, inserted)
+            start = time.perf_counter()
+            store.append(batch)
+            insert_seconds += time.perf_counter() - start
+            inserted += len(batch)
+        print(f"inserted {inserted} games in batches of {BATCH}: {inserted / insert_seconds:,.0f} games/s")
+
+        reads, histories = [], []
+        for _ in range(args.reads):
+            user = f"user{rng.randrange(args.users)}"
+            start = time.perf_counter()
+            store.get_stats(user)
+            reads.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            list(store.history(user))
+            histories.append(time.perf_counter() - start)
+        print("stats read: median %.0f us, p99 %.0f us" % percentiles(reads))
+        print("history:    median %.0f us, p99 %.0f us" % percentiles(histories))
+        store.close()
+        print(f"database size: {(Path(tmp) / 'stats.db').stat().st_size / 1e6:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
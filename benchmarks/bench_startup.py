@@ -0,0 +1,69 @@
+"""
+Cold start of the Kivy app: time from launching a fresh interpreter to the
+first rendered frame, and the number of tile widgets that exist by then.
+
+Run with: python -m benchmarks.bench_startup --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+CHILD = r"""
+import json, sys, time
+started = float(sys.argv[1])
+from kivy.clock import Clock
+from kivy.core.window import Window
+from src.ui.app import WordleApp
+from src.ui.tile import Tile
+
+class StartupApp(WordleApp):
+    def on_start(self):
+        def first_frame(*args):
+            Window.unbind(on_flip=first_frame)
+            tiles = sum(1 for widget in self.root.walk() if isinstance(widget, Tile))
+            print("RESULT " + json.dumps({"seconds": time.time() - started, "tiles": tiles}), flush=True)
+            Clock.schedule_once(lambda dt: self.stop(), 0)
+        Window.bind(on_flip=first_frame)
+
+StartupApp().run()
+"""
+
+
+def run_once(script: str) -> dict:
+    env = dict(os.environ, KIVY_NO_ARGS="1", KIVY_NO_CONSOLELOG="1")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [os.getcwd(), env.get("PYTHONPATH")]))
+    started = time.time()
+    output = subprocess.run(
+        [sys.executable, script, repr(started)],
+        capture_output=True, text=True, env=env, timeout=120,
+    ).stdout
+    for line in output.splitlines():
+        if line.startswith("RESULT "):
+            return json.loads(line[len("RESULT "):])
+    raise RuntimeError(f"app did not report a first frame:\n{output}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure cold app start to first frame.")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    # Kivy's App needs its subclass to live in a real file
+    with tempfile.TemporaryDirectory() as tmp:
+        script = os.path.join(tmp, "startup_app.py")
+        with open(script, "w") as f:
+            f.write(CHILD)
+        results = [run_once(script) for _ in range(args.runs)]
+    seconds = [result["seconds"] for result in results]
+    print(f"first frame: median {statistics.median(seconds) * 1000:.0f} ms, "
+          f"min {min(seconds) * 1000:.0f} ms over {len(seconds)} runs")
+    print(f"tiles at first frame: {results[-1]['tiles']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Per-game write cost of the statistics store as the history grows, and how
+long reopening the store takes with a recent snapshot versus replaying the
+whole log.
+
+Run with: python -m benchmarks.bench_stats_store
+"""
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from src.stats_store import StatsStore
+
+BATCH = 2_000
+
+
+def record_batch(store, rng):
+    start = time.perf_counter()
+    for _ in range(BATCH):
+        guesses = rng.randint(1, 6)
+        store.record_game("crane", ["slate"] * guesses, rng.random() < 0.9, duration=rng.uniform(20, 200))
+    return (time.perf_counter() - start) / BATCH
+
+
+def main(total=100_000):
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = Path(tmp) / "stats.jsonl"
+        store = StatsStore(log_path)
+        played = 0
+        while played < total:
+            seconds = record_batch(store, rng)
+            played += BATCH
+            if played in (BATCH, 10_000, 50_000, total):
+                print(f"history {played:>7} games: {seconds * 1e6:6.1f} us/game")
+        store.close()
+        print(f"log size: {log_path.stat().st_size / 1e6:.1f} MB")
+
+        start = time.perf_counter()
+        StatsStore(log_path)
+        print(f"reopen with snapshot: {(time.perf_counter() - start) * 1000:7.1f} ms")
+        store.snapshot_path.unlink()
+        start = time.perf_counter()
+        StatsStore(log_path)
+        print(f"reopen replaying log: {(time.perf_counter() - start) * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
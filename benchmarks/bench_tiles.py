@@ -0,0 +1,107 @@
+"""
+Frame cost of a full reveal and reset cycle over the 6 x 5 tile grid:
+recoloring the tiles' persistent canvas instructions in place versus the
+old approach of clearing each tile's canvas and allocating new Color /
+Rectangle / Line instructions on every status change.
+
+The old approach also wiped each tile's letter (the Label draws its text on
+the same canvas), so its draw time covers less work; compare update times.
+
+Run with: python -m benchmarks.bench_tiles
+"""
+import gc
+import os
+import time
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+
+from kivy.base import EventLoop
+from kivy.graphics import Color, Line, Rectangle
+from kivy.uix.gridlayout import GridLayout
+
+from src.ui.tile import ABSENT_COLOR, CORRECT_COLOR, DEFAULT_COLOR, PRESENT_COLOR, Tile
+
+STATUSES = ["correct", "present", "absent", "absent", "present"]
+
+
+def legacy_update_tile_status(tile, status):
+    """WordleGameUI._update_tile_status before tiles kept their instructions."""
+    with tile.canvas:
+        tile.canvas.clear()
+        if status == "correct":
+            Color(*CORRECT_COLOR)
+        elif status == "present":
+            Color(*PRESENT_COLOR)
+        elif status == "absent":
+            Color(*ABSENT_COLOR)
+        else:
+            Color(*DEFAULT_COLOR)
+        Rectangle(pos=tile.pos, size=tile.size)
+        if status == "default":
+            Color(0.3, 0.3, 0.3, 1)
+            Line(rectangle=(tile.x, tile.y, tile.width, tile.height), width=2)
+
+
+def cycle(tiles, update, render, timings):
+    """Reveal every row, then reset the board, rendering a frame after each pass."""
+    passes = [[(tile, status) for tile, status in zip(row, STATUSES)] for row in tiles]
+    passes.append([(tile, "default") for row in tiles for tile in row])
+    for updates in passes:
+        start = time.perf_counter()
+        for tile, status in updates:
+            if status == "default":
+                tile.text = ""
+            update(tile, status)
+        middle = time.perf_counter()
+        render()
+        timings.append((middle - start, time.perf_counter() - middle))
+    for row in tiles:
+        for tile in row:
+            tile.text = "A"
+
+
+def measure(label, update, cycles, render):
+    grid = GridLayout(cols=5, rows=6)
+    tiles = [[Tile(text="A") for _ in range(5)] for _ in range(6)]
+    for row in tiles:
+        for tile in row:
+            grid.add_widget(tile)
+    window = EventLoop.window
+    if window is not None:
+        window.add_widget(grid)
+
+    cycle(tiles, update, render, [])  # Warm up
+    gc.collect()
+    collections = sum(stat["collections"] for stat in gc.get_stats())
+    timings = []
+    for _ in range(cycles):
+        cycle(tiles, update, render, timings)
+    collections = sum(stat["collections"] for stat in gc.get_stats()) - collections
+    instructions = sum(len(tile.canvas.before.children) + len(tile.canvas.children)
+                       for row in tiles for tile in row)
+
+    if window is not None:
+        window.remove_widget(grid)
+    update_ms = sum(u for u, _ in timings) / len(timings) * 1000
+    frame_ms = sum(u + r for u, r in timings) / len(timings) * 1000
+    print(f"{label:<10} update {update_ms:7.3f} ms/frame, update + draw {frame_ms:7.3f} ms/frame, "
+          f"{collections} GC runs, {instructions} canvas instructions")
+
+
+def main(cycles=50):
+    try:
+        EventLoop.ensure_window()
+        # Draw the window directly rather than through EventLoop.idle(), which
+        # also sleeps to pace frames
+        render = lambda: EventLoop.window.dispatch("on_draw")
+    except Exception as e:
+        print(f"No window available ({e}); timing updates without rendering")
+        render = lambda: None
+
+    measure("legacy", legacy_update_tile_status, cycles, render)
+    measure("in-place", Tile.set_status, cycles, render)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Load test for the guess endpoint of the JSON game API.
+
+By default requests go through Flask's in-process test client, which
+measures the handler and framework cost. Pass --url to drive a running
+server over HTTP with several client threads instead, e.g.
+
+    python -m src.web   (or any WSGI server)
+    python -m benchmarks.bench_web --url http://127.0.0.1:5000 --threads 8
+"""
+from urllib.parse import urlsplit
+import argparse
+import http.client
+import json
+import random
+import statistics
+import sys
+import threading
+import time
+
+from src.word_list import get_word_list
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class TestClientTransport:
+    def __init__(self):
+        from flask import Flask
+        from src.web import init_api
+        self.client = init_api(Flask(__name__)).test_client()
+
+    def post(self, path, body=None):
+        response = self.client.post(path, json=body)
+        return response.status_code, response.get_json()
+
+
+class HTTPTransport:
+    def __init__(self, url):
+        parts = urlsplit(url)
+        self.connection = http.client.HTTPConnection(parts.hostname, parts.port or 80)
+
+    def post(self, path, body=None):
+        payload = json.dumps(body or {})
+        self.connection.request("POST", path, payload, {"Content-Type": "application/json"})
+        response = self.connection.getresponse()
+        return response.status, json.loads(response.read())
+
+
+def run_client(transport, requests, seed, latencies):
+    guesses = list(get_word_list().allowed_guesses)
+    rng = random.Random(seed)
+    game_id = None
+    for _ in range(requests):
+        if game_id is None:
+            _, state = transport.post("/api/games")
+            game_id = state["id"]
+        start = time.perf_counter()
+        status, state = transport.post(f"/api/games/{game_id}/guess", {"guess": rng.choice(guesses)})
+        latencies.append(time.perf_counter() - start)
+        if status != 200 or state.get("over"):
+            game_id = None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the guess endpoint.")
+    parser.add_argument("--url", help="base URL of a running server (default: in-process test client)")
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument("--requests", type=int, default=5000, help="guess requests per thread")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--p99-target", type=float, help="fail if p99 latency exceeds this many ms")
+    args = parser.parse_args(argv)
+
+    latencies = []
+    transports = [HTTPTransport(args.url) if args.url else TestClientTransport() for _ in range(args.threads)]
+    run_client(transports[0], 50, args.seed, [])  # Warm up
+
+    threads = [
+        threading.Thread(target=run_client, args=(transport, args.requests, args.seed + i, latencies))
+        for i, transport in enumerate(transports)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    print(f"{len(latencies)} guesses in {elapsed:.2f}s: {len(latencies) / elapsed:,.0f} req/s")
+    print(f"p50 {percentile(latencies, 0.50) * 1000:.3f} ms, p99 {percentile(latencies, 0.99) * 1000:.3f} ms, "
+          f"mean {statistics.mean(latencies) * 1000:.3f} ms")
+    if args.p99_target is not None and percentile(latencies, 0.99) * 1000 > args.p99_target:
+        print(f"p99 is above the {args.p99_target} ms target")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+"""
+Compare word-list startup cost: the original readlines() + set parsing,
+packed text loading and the memory-mapped compiled file.
+
+Run with: python -m benchmarks.bench_word_list
+"""
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+import shutil
+
+from src.packed_words import COMPILED_FILE, compile_word_lists, read_word_file
+from src.word_list import ALLOWED_GUESSES_FILE, ANSWERS_FILE, DATA_DIR, WordList
+
+
+def load_legacy(data_dir: Path):
+    """The text parsing WordList.load_words used before the packed format."""
+    with open(data_dir / ANSWERS_FILE, "r") as f:
+        answers = [word.strip().lower() for word in f.readlines()]
+    with open(data_dir / ALLOWED_GUESSES_FILE, "r") as f:
+        allowed_guesses = [word.strip().lower() for word in f.readlines()]
+    return answers, allowed_guesses, set(answers + allowed_guesses)
+
+
+def measure(label, load, repeat=20):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        load()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    kept = load()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    print(f"{label:<10} {best * 1000:8.2f} ms   {retained / 1024:8.1f} KiB retained")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        text_dir = Path(tmp) / "text"
+        compiled_dir = Path(tmp) / "compiled"
+        for directory in (text_dir, compiled_dir):
+            directory.mkdir()
+            for name in (ANSWERS_FILE, ALLOWED_GUESSES_FILE):
+                shutil.copy(DATA_DIR / name, directory / name)
+        compile_word_lists(
+            read_word_file(DATA_DIR / ANSWERS_FILE),
+            read_word_file(DATA_DIR / ALLOWED_GUESSES_FILE),
+            compiled_dir / COMPILED_FILE,
+        )
+
+        measure("legacy", lambda: load_legacy(text_dir))
+        measure("text", lambda: WordList(text_dir))
+        measure("compiled", lambda: WordList(compiled_dir))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+"""
+Benchmark suite for the core, solver and headless UI paths, with results
+stored as JSON and a compare command that flags regressions between runs.
+
+Every benchmark sets up its inputs from one seeded Random (so two runs time
+the same work), is warmed up with one untimed sample, and is then timed over
+--repeat samples of `number` calls each with the garbage collector off, as
+timeit does. Compare runs by their median seconds per call.
+
+Run with:
+    python -m benchmarks.suite run [-o bench_results.json] [--only make_guess ...]
+    python -m benchmarks.suite compare base.json new.json [--threshold 0.1]
+
+compare exits with status 1 when any benchmark got slower than the
+threshold (a fraction: 0.1 flags anything over 10% slower), so it can gate
+a CI job.
+"""
+import argparse
+import contextlib
+import datetime
+import gc
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import string
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+os.environ.setdefault("KIVY_NO_FILELOG", "1")
+
+from src.feedback import score_guess
+from src.packed_words import COMPILED_FILE, compile_word_lists, read_word_file
+from src.word_list import ALLOWED_GUESSES_FILE, ANSWERS_FILE, DATA_DIR, WordList, get_word_list
+
+RESULTS_VERSION = 1
+DEFAULT_OUTPUT = "bench_results.json"
+DEFAULT_THRESHOLD = 0.10
+
+# Name -> (setup, number of calls per sample, description)
+BENCHMARKS = {}
+
+
+def benchmark(name: str, number: int, description: str):
+    """
+    Register a benchmark. Its setup(rng, stack) prepares the inputs (stack
+    is an ExitStack for anything that needs cleaning up) and returns the
+    zero-argument callable that is timed.
+    """
+    def register(setup):
+        BENCHMARKS[name] = (setup, number, description)
+        return setup
+    return register
+
+
+class Skip(Exception):
+    """Raised by a setup when its benchmark cannot run here (e.g. no Kivy)."""
+
+
+def _copy_word_lists(stack, compiled: bool) -> Path:
+    """A temporary copy of the text lists, with the compiled file alongside if asked for."""
+    data_dir = Path(stack.enter_context(tempfile.TemporaryDirectory()))
+    for name in (ANSWERS_FILE, ALLOWED_GUESSES_FILE):
+        shutil.copy(DATA_DIR / name, data_dir / name)
+    if compiled:
+        compile_word_lists(read_word_file(data_dir / ANSWERS_FILE),
+                           read_word_file(data_dir / ALLOWED_GUESSES_FILE), data_dir / COMPILED_FILE)
+    return data_dir
+
+
+@benchmark("word_list_cold", 5, "WordList parsed from the text lists (no compiled file)")
+def word_list_cold(rng, stack):
+    data_dir = _copy_word_lists(stack, compiled=False)
+    return lambda: WordList(data_dir)
+
+
+@benchmark("word_list_warm", 200, "WordList mapped from the compiled file")
+def word_list_warm(rng, stack):
+    data_dir = _copy_word_lists(stack, compiled=True)
+    return lambda: WordList(data_dir)
+
+
+@benchmark("make_guess", 20, "1000 WordleGame.make_guess calls on seeded games")
+def make_guess(rng, stack):
+    from src.game import WordleGame
+    word_list = get_word_list()
+    guesses = word_list.guess_words()
+    pairs = [(WordleGame(rng.choice(word_list.answers), word_list), rng.choice(guesses)) for _ in range(1000)]
+
+    def run():
+        for game, guess in pairs:
+            game.make_guess(guess)
+            game.attempts.clear()
+    return run
+
+
+@benchmark("make_guess_batch", 20, "A 32-board MultiBoardGame played for 10 guesses")
+def make_guess_batch(rng, stack):
+    from src.multi_board import MultiBoardGame
+    word_list = get_word_list()
+    boards = rng.sample(word_list.answers, 32)
+    guesses = rng.sample(word_list.guess_words(), 10)
+
+    def run():
+        game = MultiBoardGame(boards, word_list)
+        for guess in guesses:
+            game.make_guess(guess)
+    return run
+
+
+@benchmark("is_valid_guess", 20, "1000 is_valid_guess calls, half of them on non-words")
+def is_valid_guess(rng, stack):
+    from src.game import WordleGame
+    word_list = get_word_list()
+    guesses = word_list.guess_words()
+    words = [rng.choice(guesses) if i % 2 else "".join(rng.choices(string.ascii_lowercase, k=5))
+             for i in range(1000)]
+    game = WordleGame(word_list.answers[0], word_list)
+
+    def run():
+        for word in words:
+            game.is_valid_guess(word)
+    return run
+
+
+@benchmark("candidate_filter", 10, "ConstraintIndex candidates for 100 histories of 1-3 guesses")
+def candidate_filter(rng, stack):
+    from src.constraint_index import get_constraint_index
+    word_list = get_word_list()
+    index = get_constraint_index(word_list)
+    guesses = word_list.guess_words()
+    histories = []
+    for i in range(100):
+        answer = rng.choice(word_list.answers)
+        histories.append([(guess, score_guess(guess, answer)) for guess in rng.sample(guesses, i % 3 + 1)])
+
+    def run():
+        for history in histories:
+            index.candidates(history)
+    return run
+
+
+@benchmark("self_play", 1, "Every answer played to the end with the decision tree strategy")
+def self_play(rng, stack):
+    from src.simulator import DecisionTreeStrategy, play_game
+    word_list = get_word_list()
+    DecisionTreeStrategy.prepare(word_list)  # Builds and caches the tree on the first run
+    strategy = DecisionTreeStrategy(word_list, rng.randrange(1 << 30))
+    answers = list(word_list.answers)
+    return lambda: [play_game(answer, strategy, word_list) for answer in answers]
+
+
+@benchmark("tile_grid", 20, "Headless construction of a 6 x 5 TileGrid")
+def tile_grid(rng, stack):
+    try:
+        from src.ui.grid import TileGrid
+    except ImportError as e:
+        raise Skip(f"Kivy is not available ({e})")
+    # Building is deferred to the next frame; ensure_built() does it now
+    return lambda: TileGrid(word_length=5, num_attempts=6).ensure_built()
+
+
+def time_benchmark(name: str, repeat: int = 7, seed: int = 0) -> dict:
+    """
+    Set up, warm up and time one benchmark.
+    Returns:
+        dict: Seconds per call (median, min, mean, stdev and every sample),
+            the calls per sample and the benchmark's description.
+    Raises:
+        Skip: If the benchmark cannot run in this environment.
+    """
+    setup, number, description = BENCHMARKS[name]
+    with contextlib.ExitStack() as stack:
+        func = setup(random.Random(f"{seed}:{name}"), stack)
+        for _ in range(number):  # Warm up: caches, lazy imports, page cache
+            func()
+        samples = []
+        for _ in range(repeat):
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                for _ in range(number):
+                    func()
+                samples.append((time.perf_counter() - start) / number)
+            finally:
+                gc.enable()
+    return {
+        "description": description,
+        "number": number,
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "samples": samples,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True, cwd=Path(__file__).parent).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(names: list[str] | None = None, repeat: int = 7, seed: int = 0) -> dict:
+    """Time the named benchmarks (all by default) and return the results document."""
+    import numpy
+    results = {}
+    for name in names or BENCHMARKS:
+        try:
+            results[name] = time_benchmark(name, repeat, seed)
+        except Skip as e:
+            print(f"{name:<18} skipped: {e}")
+            continue
+        print(f"{name:<18} {format_seconds(results[name]['median']):>10}  (+/- {format_seconds(results[name]['stdev'])})")
+    return {
+        "version": RESULTS_VERSION,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "numpy": numpy.__version__,
+        "machine": platform.platform(),
+        "seed": seed,
+        "repeat": repeat,
+        "benchmarks": results,
+    }
+
+
+def compare(base: dict, new: dict, threshold: float = DEFAULT_THRESHOLD) -> list[dict]:
+    """
+    Compare two results documents benchmark by benchmark.
+    Returns:
+        list[dict]: One row per benchmark in both runs: name, base and new
+            median seconds, their ratio (new / base) and whether it is a
+            regression (ratio above 1 + threshold).
+    """
+    rows = []
+    for name, base_result in base["benchmarks"].items():
+        new_result = new["benchmarks"].get(name)
+        if new_result is None:
+            continue
+        ratio = new_result["median"] / base_result["median"]
+        rows.append({
+            "name": name,
+            "base": base_result["median"],
+            "new": new_result["median"],
+            "ratio": ratio,
+            "regression": ratio > 1 + threshold,
+        })
+    return rows
+
+
+def format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def print_comparison(rows: list[dict], threshold: float):
+    print(f"{'benchmark':<18} {'base':>10} {'new':>10} {'change':>8}")
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else "  faster" if row["ratio"] < 1 - threshold else ""
+        print(f"{row['name']:<18} {format_seconds(row['base']):>10} {format_seconds(row['new']):>10} "
+              f"{(row['ratio'] - 1) * 100:+7.1f}%{flag}")
+
+
+def load_results(path) -> dict:
+    with open(path) as f:
+        results = json.load(f)
+    if results.get("version") != RESULTS_VERSION:
+        raise ValueError(f"{path} is not a version {RESULTS_VERSION} results file")
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="time the benchmarks and store the results as JSON")
+    run_parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT)
+    run_parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), metavar="NAME")
+    run_parser.add_argument("--repeat", type=int, default=7, help="timed samples per benchmark")
+    run_parser.add_argument("--seed", type=int, default=0)
+    compare_parser = commands.add_parser("compare", help="flag regressions between two results files")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="slowdown (as a fraction) that counts as a regression")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run_suite(args.only, args.repeat, args.seed)
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Wrote {args.output}")
+        return 0
+
+    try:
+        base, new = load_results(args.base), load_results(args.new)
+    except (OSError, ValueError) as e:
+        print(f"Could not read results: {e}", file=sys.stderr)
+        return 2
+    rows = compare(base, new, args.threshold)
+    print_comparison(rows, args.threshold)
+    missing = sorted(set(base["benchmarks"]) ^ set(new["benchmarks"]))
+    if missing:
+        print(f"Only in one run: {', '.join(missing)}")
+    regressions = [row["name"] for row in rows if row["regression"]]
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
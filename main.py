@@ -1,13 +1,19 @@
-from kivy.config import Config
-# Configure window size before importing any other Kivy modules
-Config.set('graphics', 'width', '400')  # Set a reasonable default width
-Config.set('graphics', 'height', '650')  # Set a reasonable default height that fits all elements
-Config.set('graphics', 'minimum_width', '350')  # Prevent window from being too narrow
-Config.set('graphics', 'minimum_height', '600')  # Prevent window from being too short
-Config.set('graphics', 'resizable', True)
+def main():
+    # Kivy is only imported when the GUI actually starts, so importing this
+    # module (or anything under src/) stays cheap
+    from kivy.config import Config
+    # Configure window size before importing any other Kivy modules
+    Config.set('graphics', 'width', '400')  # Set a reasonable default width
+    Config.set('graphics', 'height', '650')  # Set a reasonable default height that fits all elements
+    Config.set('graphics', 'minimum_width', '350')  # Prevent window from being too narrow
+    Config.set('graphics', 'minimum_height', '600')  # Prevent window from being too short
+    Config.set('graphics', 'resizable', True)
 
-from src.ui.app import WordleApp
+    from src import metrics
+    from src.ui.app import WordleApp
+    # WORDLE_PROFILE=<path> profiles the whole session
+    with metrics.profile_session():
+        WordleApp().run()
 
 if __name__ == '__main__':
-    WordleApp().run()
-
+    main()
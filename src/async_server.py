@@ -0,0 +1,310 @@
+"""
+asyncio server mode for the JSON game API.
+
+Serves the same JSON endpoints as web.py (see GameService), plus /metrics,
+from a single event loop using only the standard library; the HTML landing
+page (/) is only served by the Flask app. Finished games are handed to a
+write-behind queue and appended to a StatsStore on a worker thread, so a
+guess never waits on disk; on shutdown the server stops accepting connections and flushes
+everything still queued.
+
+Run with: python -m src.async_server --port 8080
+"""
+from http import HTTPStatus
+from pathlib import Path
+from urllib.parse import unquote
+import argparse
+import asyncio
+import json
+import os
+import signal
+import sys
+import time
+
+from . import metrics
+from .service import GameError, GameService
+from .stats_store import StatsStore
+from .word_list import DATA_DIR, WORD_LENGTH
+
+RESULTS_FILE = DATA_DIR / "results.jsonl"
+MAX_BODY = 64 * 1024
+SHUTDOWN_TIMEOUT = 5.0 # Seconds shutdown() waits for in-flight requests
+
+
+class BadRequest(Exception):
+    """A request the server cannot parse; answered with status and the connection closed."""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+class WriteBehindQueue:
+    """
+    Collects records on the event loop and writes them in batches on a
+    worker thread. put() never blocks; close() drains what is left.
+    """
+
+    def __init__(self, write, max_batch: int = 512):
+        self.write = write # Called with a list of records, off the event loop
+        self.max_batch = max_batch
+        self.pending = 0
+        self._queue = asyncio.Queue()
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def put(self, record):
+        self.pending += 1
+        self._queue.put_nowait(record)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            records = [record for record in batch if record is not None]
+            if records:
+                try:
+                    await loop.run_in_executor(None, self.write, records)
+                except Exception as e:
+                    print(f"Error writing results: {e}")
+            self.pending -= len(records)
+            if len(records) < len(batch):
+                return # None is the shutdown sentinel
+
+    async def close(self):
+        """Flush every queued record and stop the writer."""
+        if self._task is not None:
+            self._queue.put_nowait(None)
+            await self._task
+            self._task = None
+
+
+class AsyncGameServer:
+    def __init__(self, service: GameService | None = None, results_path: Path = RESULTS_FILE):
+        self.stats = StatsStore(results_path)
+        self.results = WriteBehindQueue(self.stats.append)
+        self.service = service or GameService()
+        self.service.on_finished = self.results.put
+        self._server = None
+        self._connections = {} # Writer -> the task handling its connection
+        self._idle = set() # Writers of connections waiting for their next request
+        self._closing = False
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080):
+        self.service.word_list # Load the lexicon before accepting connections
+        self.results.start()
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def shutdown(self):
+        """
+        Stop accepting, let requests in flight finish (for up to
+        SHUTDOWN_TIMEOUT seconds), close every connection and flush pending
+        writes.
+        """
+        self._closing = True
+        if self._server is not None:
+            self._server.close()
+        # Idle keep-alive connections are closed now; busy ones close after their response
+        for writer in list(self._idle):
+            writer.close()
+        tasks = set(self._connections.values())
+        if tasks:
+            await asyncio.wait(tasks, timeout=SHUTDOWN_TIMEOUT)
+        for writer in list(self._connections):
+            writer.close()
+        if self._server is not None:
+            await self._server.wait_closed()
+        await self.results.close()
+        self.stats.close()
+
+    async def _handle_connection(self, reader, writer):
+        self._connections[writer] = asyncio.current_task()
+        try:
+            while not self._closing:
+                self._idle.add(writer)
+                try:
+                    request = await self._read_request(reader)
+                except BadRequest as e:
+                    # Whatever follows a malformed head cannot be framed, so never read on
+                    self._write_response(writer, e.status, {"error": str(e)}, keep_alive=False)
+                    await writer.drain()
+                    break
+                finally:
+                    self._idle.discard(writer)
+                if request is None:
+                    break
+                method, path, body, keep_alive = request
+                keep_alive = keep_alive and not self._closing
+                started = time.perf_counter()
+                status, payload = self.dispatch(method, path, body)
+                if metrics.enabled():
+                    metrics.histogram("async_request_seconds", "Time to handle a request",
+                                      {"method": method, "status": str(status)}).observe(time.perf_counter() - started)
+                self._write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._connections.pop(writer, None)
+            writer.close()
+
+    async def _read_request(self, reader):
+        """
+        Read one request.
+        Returns:
+            tuple | None: (method, path, body, keep_alive), or None once the
+                client has closed the connection.
+        Raises:
+            BadRequest: If the head is malformed or the body too large; the
+                connection must not be read from again.
+        """
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError:
+            return None
+        except asyncio.LimitOverrunError:
+            raise BadRequest("Request head too large", 431)
+        lines = head.decode("latin-1").split("\r\n")
+        request_line = lines[0].split(" ")
+        if len(request_line) != 3 or not request_line[2].startswith("HTTP/1."):
+            raise BadRequest("Malformed request line")
+        method, path, version = request_line
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+
+        # Only Content-Length framing is supported; anything else could hide a second request
+        if "transfer-encoding" in headers:
+            raise BadRequest("Transfer-Encoding is not supported", 501)
+        length = headers.get("content-length", "0")
+        if not length.isdigit():
+            raise BadRequest("Invalid Content-Length")
+        length = int(length)
+        if length > MAX_BODY:
+            raise BadRequest(f"Request body over {MAX_BODY} bytes", 413)
+        body = await reader.readexactly(length) if length else b""
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+        return method, path.split("?", 1)[0], body, keep_alive
+
+    def _write_response(self, writer, status: int, payload: dict | str, keep_alive: bool):
+        """Send payload as JSON, or as Prometheus text if it is a str (see /metrics)."""
+        if isinstance(payload, str):
+            body, content_type = payload.encode(), "text/plain; version=0.0.4"
+        else:
+            body, content_type = json.dumps(payload).encode(), "application/json"
+        reason = HTTPStatus(status).phrase
+        writer.write(
+            f"HTTP/1.1 {status} {reason}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + body
+        )
+
+    def dispatch(self, method: str, path: str, body: bytes) -> tuple[int, dict | str]:
+        """
+        Handle a request; an unexpected error becomes a 500 rather than
+        dropping the connection.
+        """
+        try:
+            return self._route(method, path, body)
+        except Exception as e:
+            print(f"Error handling {method} {path}: {e!r}")
+            return 500, {"error": "Internal server error"}
+
+    def _route(self, method: str, path: str, body: bytes) -> tuple[int, dict | str]:
+        """Route a request to the GameService; mirrors the routes in web.py."""
+        parts = [unquote(part) for part in path.strip("/").split("/")]
+        try:
+            if parts == ["metrics"]:
+                if method != "GET":
+                    return 405, {"error": "Method not allowed"}
+                if not metrics.enabled():
+                    return 404, {"error": "Metrics are disabled"}
+                return 200, metrics.prometheus_text()
+            if parts[:2] == ["api", "games"] and len(parts) <= 4:
+                if len(parts) == 2:
+                    if method != "POST":
+                        return 405, {"error": "Method not allowed"}
+                    options = _json_body(body)
+                    return 201, self.service.start_game(options.get("user"), seed=options.get("seed"),
+                                                        day=options.get("date"),
+                                                        hard_mode=options.get("hard_mode", False),
+                                                        word_length=options.get("word_length", WORD_LENGTH))
+                if len(parts) == 3:
+                    if method != "GET":
+                        return 405, {"error": "Method not allowed"}
+                    return 200, self.service.get_state(parts[2])
+                if parts[3] == "guess":
+                    if method != "POST":
+                        return 405, {"error": "Method not allowed"}
+                    return 200, self.service.submit_guess(parts[2], _json_body(body).get("guess"))
+            if parts[:2] == ["api", "users"] and len(parts) == 4 and parts[3] == "stats":
+                if method != "GET":
+                    return 405, {"error": "Method not allowed"}
+                return 200, self.service.get_stats(parts[2])
+            return 404, {"error": "Not found"}
+        except GameError as e:
+            return e.status, {"error": str(e)}
+
+
+def _json_body(body: bytes) -> dict:
+    """
+    The request's JSON object, or {} for an empty body (as in web.py).
+    Raises:
+        GameError: If the body is not a JSON object.
+    """
+    if not body:
+        return {}
+    try:
+        data = json.loads(body)
+    except ValueError:
+        data = None
+    if not isinstance(data, dict):
+        raise GameError("Request body must be a JSON object")
+    return data
+
+
+async def serve(host: str, port: int, results_path: Path = RESULTS_FILE):
+    server = AsyncGameServer(results_path=results_path)
+    address = await server.start(host, port)
+    print(f"Serving on http://{address[0]}:{address[1]}")
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError: # Windows
+            pass
+    await stop.wait()
+
+    print(f"Shutting down, flushing {server.results.pending} pending writes")
+    await server.shutdown()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Serve the game API with asyncio.")
+    parser.add_argument("--host", default=os.environ.get("WORDLE_HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("WORDLE_PORT", 8080)))
+    parser.add_argument("--results", type=Path, default=RESULTS_FILE, help="JSON-lines log of finished games")
+    args = parser.parse_args(argv)
+    try:
+        with metrics.profile_session():
+            asyncio.run(serve(args.host, args.port, args.results))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""
+Vectorized feedback scoring for many guesses against many answers.
+
+Words are encoded as uint8 letter indices (a=0 .. z=25) in an (N, L) array
+and score_batch() returns an (N, M) matrix of base-3 pattern codes,
+identical to feedback.pattern_code() for every pair. Codes for words of up
+to 5 letters fit in uint8 (3 ** 5 = 243); longer words need uint16.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+# Upper bound on the size of the per-chunk (guesses, answers) intermediates
+CHUNK_BYTES = 64 * 1024 * 1024
+
+
+def pattern_dtype(word_length: int) -> np.dtype:
+    """
+    Smallest unsigned dtype that holds every pattern code for a word length.
+    Raises:
+        ValueError: If the codes would not fit in 16 bits (over 10 letters).
+    """
+    if 3 ** word_length <= 1 << 8:
+        return np.dtype(np.uint8)
+    if 3 ** word_length <= 1 << 16:
+        return np.dtype(np.uint16)
+    raise ValueError(f"Pattern codes for {word_length}-letter words do not fit in 16 bits")
+
+
+def encode_words(words) -> np.ndarray:
+    """
+    Encode equal-length words as an (N, L) uint8 array of letter indices.
+    Arrays that are already encoded are returned unchanged.
+    """
+    if isinstance(words, np.ndarray):
+        return words
+    words = list(words)
+    if not words:
+        return np.zeros((0, 0), dtype=np.uint8)
+    blob = "".join(words).encode("ascii")
+    encoded = np.frombuffer(blob, dtype=np.uint8).reshape(len(words), -1)
+    return encoded - ord("a")
+
+
+def score_batch(guesses, answers, chunk_size: int | None = None) -> np.ndarray:
+    """
+    Score every guess against every answer.
+    Returns:
+        np.ndarray: An (N, M) matrix (of pattern_dtype()), where [i, j] is
+            the pattern code of guesses[i] played against answers[j].
+    """
+    guesses = encode_words(guesses)
+    answers = encode_words(answers)
+    n_guesses, word_length = guesses.shape
+    n_answers = answers.shape[0]
+    if word_length and answers.shape[1] != word_length:
+        raise ValueError("guesses and answers must have the same word length")
+
+    result = np.empty((n_guesses, n_answers), dtype=pattern_dtype(word_length))
+    if chunk_size is None:
+        chunk_size = max(1, CHUNK_BYTES // max(1, n_answers * word_length * word_length))
+
+    counts = letter_counts(answers)
+    for start in range(0, n_guesses, chunk_size):
+        chunk = guesses[start:start + chunk_size]
+        result[start:start + len(chunk)] = _score_chunk(chunk, answers, counts)
+    return result
+
+
+@lru_cache(maxsize=None)
+def _guess_constants(word_length: int) -> tuple[np.ndarray, np.ndarray]:
+    """Place values of each position's digit, and the mask of earlier positions (j < i)."""
+    dtype = pattern_dtype(word_length)
+    powers = dtype.type(3) ** np.arange(word_length, dtype=dtype)
+    earlier = np.tri(word_length, k=-1, dtype=bool)
+    return powers, earlier
+
+
+def guess_digits(guess: np.ndarray, answers: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """
+    Score one encoded guess against many encoded answers, e.g. every
+    unsolved board of a multi-board game, in a fixed handful of
+    whole-array operations.
+    Args:
+        guess: (L,) letter indices.
+        answers: (M, L) letter indices.
+        counts: (M, 26) letter counts of the answers (see letter_counts()).
+    Returns:
+        np.ndarray: (M, L) status digits (0 absent, 1 present, 2 correct).
+    """
+    green = answers == guess
+    present = counts[:, guess] > 0
+    same = guess[:, None] == guess
+    if same.sum() == len(guess):
+        # No repeated letters: every letter the answer has is green or yellow
+        return present.astype(np.int8) + green
+
+    _, earlier = _guess_constants(len(guess))
+    missed = ~green
+    # Occurrences of each position's letter left over after the greens...
+    available = counts[:, guess] - green.astype(np.int8) @ same.astype(np.int8)
+    # ...go to the non-green occurrences from left to right
+    before = missed.astype(np.int8) @ (same & earlier).T.astype(np.int8)
+    return green.astype(np.int8) * 2 + (missed & (before < available))
+
+
+def score_guess_batch(guess: np.ndarray, answers: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """
+    Pattern codes of one encoded guess against many encoded answers
+    (see guess_digits()), identical to score_batch()'s.
+    """
+    powers, _ = _guess_constants(len(guess))
+    return guess_digits(guess, answers, counts).astype(powers.dtype) @ powers
+
+
+def letter_counts(answers: np.ndarray) -> np.ndarray:
+    """
+    Count each letter in each encoded word.
+    Returns:
+        np.ndarray: An (M, 26) int8 matrix of letter counts.
+    """
+    counts = np.zeros((answers.shape[0], 26), dtype=np.int8)
+    rows = np.arange(answers.shape[0])
+    for i in range(answers.shape[1]):
+        np.add.at(counts, (rows, answers[:, i]), 1)
+    return counts
+
+
+def _score_chunk(guesses: np.ndarray, answers: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    word_length = guesses.shape[1]
+
+    # green[i]: (guesses, answers) mask of exact matches at position i
+    green = [guesses[:, i, None] == answers[None, :, i] for i in range(word_length)]
+    # same[i][k]: guess letters i and k are equal
+    same = [[guesses[:, i, None] == guesses[:, k, None] for k in range(word_length)]
+            for i in range(word_length)]
+
+    dtype = pattern_dtype(word_length)
+    codes = np.zeros(green[0].shape, dtype=dtype)
+    yellow = []
+    for i in range(word_length):
+        # Occurrences of this letter in the answer not already claimed by a green
+        available = counts[:, guesses[:, i]].T.copy()
+        for k in range(word_length):
+            available -= green[k] & same[i][k]
+
+        # Occurrences earlier in the guess that already took a yellow
+        for k in range(i):
+            available -= yellow[k] & same[i][k]
+
+        yellow.append(~green[i] & (available > 0))
+        codes += (green[i].astype(dtype) * 2 + yellow[i]) * dtype.type(3 ** i)
+
+    return codes
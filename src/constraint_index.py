@@ -0,0 +1,107 @@
+"""
+Bitset index for filtering words by accumulated Wordle feedback.
+
+Each word in the indexed list is one bit in a Python int. The index keeps
+    position[i][c]  - words with letter c at position i
+    at_least[c][k]  - words containing letter c at least k times
+so the words consistent with a guess history come from a handful of
+AND / AND NOT operations per guess instead of rescoring every word.
+"""
+from functools import lru_cache
+
+from .feedback import ABSENT, CORRECT, decode_pattern
+from .word_list import WordList, get_word_list
+
+
+class ConstraintIndex:
+    def __init__(self, words, word_length: int = 5):
+        """
+        Build the index over a sequence of equal-length lower-case words.
+        """
+        self.words = words
+        self.word_length = word_length
+        self.all_words = (1 << len(words)) - 1
+        position = [[0] * 26 for _ in range(word_length)]
+        at_least = [[0] * (word_length + 2) for _ in range(26)]
+
+        for bit, word in enumerate(words):
+            mask = 1 << bit
+            counts = [0] * 26
+            for i, letter in enumerate(word):
+                c = ord(letter) - 97
+                position[i][c] |= mask
+                counts[c] += 1
+            for c, count in enumerate(counts):
+                for k in range(1, count + 1):
+                    at_least[c][k] |= mask
+
+        for c in range(26):
+            at_least[c][0] = self.all_words
+        self.position = position
+        self.at_least = at_least
+
+    def apply(self, bits: int, guess: str, feedback) -> int:
+        """
+        Narrow a candidate bitset by one guess.
+        Args:
+            feedback: Either a list of statuses or a base-3 pattern code.
+        """
+        if isinstance(feedback, int):
+            feedback = decode_pattern(feedback, self.word_length)
+        guess = guess.lower()
+
+        shown = {} # letter -> occurrences marked correct or present
+        capped = set() # letters with an absent occurrence, so the count is exact
+        for i, (letter, status) in enumerate(zip(guess, feedback)):
+            c = ord(letter) - 97
+            if status == CORRECT:
+                bits &= self.position[i][c]
+            else:
+                bits &= ~self.position[i][c]
+            if status == ABSENT:
+                capped.add(c)
+                shown.setdefault(c, 0)
+            else:
+                shown[c] = shown.get(c, 0) + 1
+
+        for c, count in shown.items():
+            bits &= self.at_least[c][count]
+            if c in capped:
+                bits &= ~self.at_least[c][count + 1]
+        return bits
+
+    def filter(self, history) -> int:
+        """
+        Bitset of the words consistent with every (guess, feedback) pair.
+        """
+        bits = self.all_words
+        for guess, feedback in history:
+            bits = self.apply(bits, guess, feedback)
+            if not bits:
+                break
+        return bits
+
+    def words_for(self, bits: int) -> list[str]:
+        """Decode a bitset back into words, in index order."""
+        words = self.words
+        found = []
+        while bits:
+            low = bits & -bits
+            found.append(words[low.bit_length() - 1])
+            bits ^= low
+        return found
+
+    def candidates(self, history) -> list[str]:
+        return self.words_for(self.filter(history))
+
+    def count(self, history) -> int:
+        return self.filter(history).bit_count()
+
+
+@lru_cache(maxsize=8)
+def get_constraint_index(word_list: WordList | None = None) -> ConstraintIndex:
+    """
+    The index over a word list's answers, built once per word list.
+    """
+    word_list = word_list or get_word_list()
+    return ConstraintIndex(list(word_list.answers), word_list.answers.word_length)
@@ -0,0 +1,116 @@
+"""
+Deterministic daily puzzles.
+
+The answer for a date comes from a seeded permutation of the answer list:
+puzzle n (days since EPOCH) is answers[calendar[n % len(answers)]]. The
+permutation depends only on the seed and the answer list, so every process
+(and every server worker) agrees on the answer without coordinating. It is
+computed once and cached in data/cache/ as a uint16 index array, and kept in
+memory after the first lookup, so looking up any date is O(1).
+
+Print upcoming puzzle numbers with: python -m src.daily [YYYY-MM-DD] [days]
+"""
+from datetime import date, timedelta
+from functools import lru_cache
+from pathlib import Path
+import hashlib
+import random
+import sys
+
+import numpy as np
+
+from .pattern_table import cache_dir_for, word_list_digest
+from .word_list import WordList, get_word_list
+
+CALENDAR_VERSION = 1
+EPOCH = date(2021, 6, 19)  # Puzzle 0
+DEFAULT_SEED = "wordle-daily"
+
+
+def puzzle_number(day: date) -> int:
+    """
+    Days since EPOCH.
+    Raises:
+        ValueError: If day is before the first puzzle.
+    """
+    number = (day - EPOCH).days
+    if number < 0:
+        raise ValueError(f"There is no puzzle before {EPOCH.isoformat()}")
+    return number
+
+
+def build_calendar(word_list: WordList, seed: str = DEFAULT_SEED) -> np.ndarray:
+    """
+    Shuffle the answer indices with a generator seeded from seed.
+    random.Random hashes str seeds with SHA-512, so the result is the same on
+    every machine and Python version.
+    """
+    order = list(range(len(word_list.answers)))
+    random.Random(f"{seed}|{word_list_digest(word_list)}").shuffle(order)
+    return np.array(order, dtype=np.uint16)
+
+
+def calendar_path(word_list: WordList, seed: str = DEFAULT_SEED, cache_dir: Path | None = None) -> Path:
+    cache_dir = cache_dir_for(word_list) if cache_dir is None else Path(cache_dir)
+    seed_digest = hashlib.sha256(seed.encode()).hexdigest()[:8]
+    return cache_dir / f"daily-v{CALENDAR_VERSION}-{word_list_digest(word_list)}-{seed_digest}.npy"
+
+
+def load_calendar(word_list: WordList, seed: str = DEFAULT_SEED, cache_dir: Path | None = None) -> np.ndarray:
+    """
+    Load the cached calendar for this word list and seed, building it if it
+    is missing.
+    """
+    path = calendar_path(word_list, seed, cache_dir)
+    if path.exists():
+        try:
+            calendar = np.load(path)
+            if calendar.shape == (len(word_list.answers),) and calendar.dtype == np.uint16:
+                return calendar
+        except (OSError, ValueError) as e:
+            print(f"Ignoring cached daily calendar: {e}")
+
+    calendar = build_calendar(word_list, seed)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            np.save(f, calendar)
+        tmp_path.replace(path)
+    except OSError as e:
+        print(f"Could not cache daily calendar: {e}")
+    return calendar
+
+
+@lru_cache(maxsize=8)
+def _calendar(word_list: WordList, seed: str) -> np.ndarray:
+    return load_calendar(word_list, seed)
+
+
+def daily_answer(day: date | None = None, word_list: WordList | None = None, seed: str = DEFAULT_SEED) -> str:
+    """
+    Return the answer for a date (today by default).
+    """
+    word_list = word_list or get_word_list()
+    number = puzzle_number(day or date.today())
+    calendar = _calendar(word_list, seed)
+    return word_list.answers[int(calendar[number % len(calendar)])]
+
+
+def main(argv=None) -> int:
+    """Build the calendar and list the next few puzzle numbers."""
+    argv = sys.argv[1:] if argv is None else argv
+    start = date.fromisoformat(argv[0]) if argv else date.today()
+    days = int(argv[1]) if len(argv) > 1 else 7
+    word_list = get_word_list()
+    path = calendar_path(word_list)
+    load_calendar(word_list)
+    print(f"Calendar: {path}")
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        print(f"{day.isoformat()}  puzzle #{puzzle_number(day)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
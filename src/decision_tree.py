@@ -0,0 +1,315 @@
+"""
+Precomputed decision tree over the answer list.
+
+Every node is a guess; its edges map each feedback pattern the guess can
+get to the node to play next. The tree is built offline with the solver's
+greedy rule (highest partition entropy, preferring possible answers) and
+stored as flat arrays, CSR style:
+
+    guesses[node]                    guess ID (see WordList.word_id)
+    edge_offsets[node]:[node + 1]    the node's edges, sorted by pattern
+    edge_patterns, edge_children     pattern code -> child node (-1: solved)
+    edge_starts                      first position in `order` of the
+                                     answers below the edge
+    order                            answer indices in depth-first order
+
+so following a pattern is a binary search over at most 3 ** L edges, and
+the answers below any edge are a contiguous slice of `order`. That lets
+next_guess() walk a WordleGame's attempts without scoring anything: the
+answer's position in `order` picks the edge at each node.
+
+The subtrees under the opening guess are built in parallel across
+processes. The tree is cached in data/cache/ next to the pattern table.
+
+Build it ahead of time with: python -m src.decision_tree [--workers N]
+"""
+from pathlib import Path
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+from . import metrics
+from .pattern_table import cache_dir_for, word_list_digest
+from .solver import first_guess_scores, partition_entropy
+from .word_list import WordList, get_word_list
+
+TREE_VERSION = 1
+SOLVED = -1  # Child of the all-correct edge
+
+
+def _choose_guess(table: np.ndarray, candidates: np.ndarray, word_length: int,
+                  entropies: np.ndarray | None = None) -> int:
+    """The guess Solver.suggest() would rank first for these candidates."""
+    if len(candidates) <= 2:
+        return int(candidates[0])
+    if entropies is None:
+        entropies = partition_entropy(table, candidates, word_length)
+    scores = entropies.copy()
+    scores[candidates] += 1.0 / len(candidates)
+    return int(np.argmax(scores))
+
+
+def _build_subtree(table: np.ndarray, candidates: np.ndarray, word_length: int, guess: int | None = None):
+    """
+    Returns:
+        tuple: (guess ID, [(pattern, subtree or None), ...]) with the edges
+            sorted by pattern; None marks the all-correct edge.
+    """
+    if guess is None:
+        guess = _choose_guess(table, candidates, word_length)
+    solved = 3 ** word_length - 1
+    codes = table[guess, candidates]
+    edges = []
+    for pattern in np.unique(codes):
+        if pattern == solved:
+            edges.append((int(pattern), None))
+        else:
+            edges.append((int(pattern), _build_subtree(table, candidates[codes == pattern], word_length)))
+    return guess, edges
+
+
+# Per-process state of the build workers, set by _init_worker()
+_worker = {}
+
+
+def _init_worker(data_dir: Path, word_length: int):
+    # Maps the pattern table the parent already cached
+    word_list = WordList(data_dir, word_length)
+    _worker["table"] = word_list.get_pattern_table()
+    _worker["word_length"] = word_list.word_length
+
+
+def _build_task(candidates: np.ndarray):
+    return _build_subtree(_worker["table"], candidates, _worker["word_length"])
+
+
+class DecisionTree:
+    def __init__(self, word_list: WordList, guesses, edge_offsets, edge_patterns, edge_children,
+                 edge_starts, order):
+        self.word_list = word_list
+        self.guesses = guesses
+        self.edge_offsets = edge_offsets
+        self.edge_patterns = edge_patterns
+        self.edge_children = edge_children
+        self.edge_starts = edge_starts
+        self.order = order
+        # Position of each answer in `order`
+        self.answer_rank = np.empty(len(order), dtype=np.uint32)
+        self.answer_rank[order] = np.arange(len(order), dtype=np.uint32)
+
+    @classmethod
+    def build(cls, word_list: WordList, workers: int | None = None) -> "DecisionTree":
+        """
+        Build the tree for a word list, one process per subtree of the
+        opening guess.
+        """
+        table = word_list.get_pattern_table()
+        word_length = word_list.word_length
+        candidates = np.arange(len(word_list.answers))
+        root = _choose_guess(table, candidates, word_length, first_guess_scores(word_list))
+
+        codes = table[root, candidates]
+        patterns = np.unique(codes)
+        partitions = [candidates[codes == pattern] for pattern in patterns]
+        # Largest subtrees first so the pool does not wait on a straggler
+        tasks = sorted((i for i, pattern in enumerate(patterns) if pattern != 3 ** word_length - 1),
+                       key=lambda i: -len(partitions[i]))
+        workers = workers or os.cpu_count() or 1
+        if workers == 1:
+            subtrees = [_build_subtree(table, partitions[i], word_length) for i in tasks]
+        else:
+            from concurrent.futures import ProcessPoolExecutor  # Only needed with several workers
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(word_list.data_dir, word_length)) as pool:
+                subtrees = list(pool.map(_build_task, [partitions[i] for i in tasks]))
+        built = dict(zip(tasks, subtrees))
+        edges = [(int(pattern), built.get(i)) for i, pattern in enumerate(patterns)]
+        return cls._flatten(word_list, (root, edges))
+
+    @classmethod
+    def _flatten(cls, word_list: WordList, tree) -> "DecisionTree":
+        """Lay a nested (guess, edges) tree out as flat arrays in depth-first order."""
+        guesses, offsets, patterns, children, starts, order = [], [], [], [], [], []
+
+        def visit(node) -> int:
+            guess, edges = node
+            index = len(guesses)
+            guesses.append(guess)
+            offsets.append(len(patterns))
+            first_edge = len(patterns)
+            patterns.extend(pattern for pattern, _ in edges)
+            children.extend([SOLVED] * len(edges))
+            starts.extend([0] * len(edges))
+            for i, (pattern, child) in enumerate(edges, first_edge):
+                starts[i] = len(order)
+                if child is None:
+                    order.append(guess)  # Only an answer can get the all-correct pattern
+                else:
+                    children[i] = visit(child)
+            return index
+
+        visit(tree)
+        offsets.append(len(patterns))
+        pattern_dtype = word_list.get_pattern_table().dtype
+        return cls(word_list,
+                   np.array(guesses, dtype=np.uint16), np.array(offsets, dtype=np.uint32),
+                   np.array(patterns, dtype=pattern_dtype), np.array(children, dtype=np.int32),
+                   np.array(starts, dtype=np.uint32), np.array(order, dtype=np.uint16))
+
+    def guess_word(self, node: int) -> str:
+        guess = int(self.guesses[node])
+        n_answers = len(self.word_list.answers)
+        if guess < n_answers:
+            return self.word_list.answers[guess]
+        return self.word_list.allowed_guesses[guess - n_answers]
+
+    def child(self, node: int, pattern: int) -> int | None:
+        """
+        The node after playing node's guess and getting pattern; SOLVED for
+        the all-correct pattern, None if no answer gives that pattern.
+        """
+        lo, hi = int(self.edge_offsets[node]), int(self.edge_offsets[node + 1])
+        i = lo + int(np.searchsorted(self.edge_patterns[lo:hi], pattern))
+        if i < hi and self.edge_patterns[i] == pattern:
+            return int(self.edge_children[i])
+        return None
+
+    def walk(self, moves) -> int | None:
+        """
+        Follow (guess, pattern) pairs from the root.
+        Returns:
+            int | None: The node reached, SOLVED, or None if a guess was not
+                the tree's or no answer gives a pattern.
+        """
+        node = 0
+        for guess, pattern in moves:
+            if node is None or node == SOLVED or self.guess_word(node) != guess.lower():
+                return None
+            node = self.child(node, pattern)
+        return node
+
+    @metrics.timed("decision_tree_next_guess_seconds", "Time to look the next guess up in the tree")
+    def next_guess(self, game) -> str | None:
+        """
+        The tree's next guess for a WordleGame, or None if the game is
+        solved or a guess so far left the tree (or the answer is not in the
+        tree's word list).
+        """
+        answer = self.word_list.answers.find(game.word)
+        if answer < 0:
+            return None
+        rank = self.answer_rank[answer]
+        node = 0
+        for guess in game.attempts:
+            if self.guess_word(node) != guess:
+                return None
+            lo, hi = int(self.edge_offsets[node]), int(self.edge_offsets[node + 1])
+            # The edge whose slice of `order` holds the answer
+            i = lo + int(np.searchsorted(self.edge_starts[lo:hi], rank, side="right")) - 1
+            node = int(self.edge_children[i])
+            if node == SOLVED:
+                return None
+        return self.guess_word(node)
+
+    def depths(self) -> np.ndarray:
+        """Guesses the tree takes to solve each answer, by answer index."""
+        depths = np.zeros(len(self.order), dtype=np.uint8)
+        stack = [(0, 1)]
+        while stack:
+            node, depth = stack.pop()
+            for i in range(self.edge_offsets[node], self.edge_offsets[node + 1]):
+                child = int(self.edge_children[i])
+                if child == SOLVED:
+                    depths[self.order[self.edge_starts[i]]] = depth
+                else:
+                    stack.append((child, depth + 1))
+        return depths
+
+    def summary(self) -> dict:
+        depths = self.depths()
+        return {
+            "answers": len(depths),
+            "nodes": len(self.guesses),
+            "mean_guesses": float(depths.mean()) if len(depths) else 0.0,
+            "worst_case": int(depths.max()) if len(depths) else 0,
+            "histogram": {int(n): int(count) for n, count in zip(*np.unique(depths, return_counts=True))},
+            "bytes": sum(a.nbytes for a in (self.guesses, self.edge_offsets, self.edge_patterns,
+                                            self.edge_children, self.edge_starts, self.order)),
+        }
+
+    def save(self, path: Path) -> Path:
+        """Atomically write the arrays to an .npz file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(f, guesses=self.guesses, edge_offsets=self.edge_offsets,
+                     edge_patterns=self.edge_patterns, edge_children=self.edge_children,
+                     edge_starts=self.edge_starts, order=self.order)
+        tmp_path.replace(path)
+        return path
+
+
+def tree_path(word_list: WordList, cache_dir: Path | None = None) -> Path:
+    cache_dir = cache_dir_for(word_list) if cache_dir is None else Path(cache_dir)
+    return cache_dir / f"tree-v{TREE_VERSION}-{word_list_digest(word_list)}.npz"
+
+
+def load_decision_tree(word_list: WordList | None = None, cache_dir: Path | None = None,
+                       build: bool = True, workers: int | None = None) -> DecisionTree | None:
+    """
+    Load the cached tree for this word list, building it if it is missing.
+    Returns:
+        DecisionTree | None: The tree, or None if it is not cached and build
+            is False.
+    """
+    word_list = word_list or get_word_list()
+    path = tree_path(word_list, cache_dir)
+    if path.exists():
+        try:
+            with np.load(path) as arrays:
+                tree = DecisionTree(word_list, arrays["guesses"], arrays["edge_offsets"],
+                                    arrays["edge_patterns"], arrays["edge_children"],
+                                    arrays["edge_starts"], arrays["order"])
+            if len(tree.order) == len(word_list.answers):
+                return tree
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Ignoring cached decision tree: {e}")
+
+    if not build:
+        return None
+    tree = DecisionTree.build(word_list, workers)
+    try:
+        tree.save(path)
+    except OSError as e:
+        print(f"Could not cache decision tree: {e}")
+    return tree
+
+
+def main(argv=None) -> int:
+    """Build (or rebuild) the decision tree for the shared word list."""
+    parser = argparse.ArgumentParser(description="Precompute the guessing strategy for every answer.")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    args = parser.parse_args(argv)
+
+    word_list = get_word_list()
+    word_list.get_pattern_table()  # Built once here rather than in every worker
+    start = time.perf_counter()
+    tree = DecisionTree.build(word_list, args.workers)
+    elapsed = time.perf_counter() - start
+    path = tree.save(tree_path(word_list))
+
+    summary = tree.summary()
+    print(f"Wrote {path}: {summary['nodes']} nodes, {summary['bytes'] / 1024:.1f} KB, built in {elapsed:.2f}s")
+    print(f"Average guesses: {summary['mean_guesses']:.4f} over {summary['answers']} answers, "
+          f"worst case: {summary['worst_case']}")
+    for guesses, count in summary["histogram"].items():
+        print(f"  {guesses}: {count:5d}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""
+Letter feedback for a guess, and its compact base-3 pattern encoding.
+
+A feedback pattern packs one status per position into a single integer,
+position 0 being the least significant base-3 digit:
+    0 - 'absent', 1 - 'present', 2 - 'correct'
+so a 5-letter pattern always fits in a byte (3 ** 5 = 243 values) and
+anything up to 10 letters in two.
+"""
+from collections import Counter
+
+ABSENT = 'absent'
+PRESENT = 'present'
+CORRECT = 'correct'
+
+STATUSES = (ABSENT, PRESENT, CORRECT)
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+
+
+def score_guess(guess: str, answer: str) -> list[str]:
+    """
+    Reference scorer with Wordle's duplicate-letter rules.
+    Greens are assigned first; each remaining occurrence of a letter in the
+    answer can then turn at most one other guess letter yellow, left to right.
+    Returns:
+        list[str]: The status of each letter in the guess.
+    """
+    statuses = [ABSENT] * len(guess)
+    remaining = Counter()
+
+    for i, (letter, target) in enumerate(zip(guess, answer)):
+        if letter == target:
+            statuses[i] = CORRECT
+        else:
+            remaining[target] += 1
+
+    for i, letter in enumerate(guess):
+        if statuses[i] != CORRECT and remaining[letter] > 0:
+            statuses[i] = PRESENT
+            remaining[letter] -= 1
+
+    return statuses
+
+
+def encode_pattern(statuses) -> int:
+    """
+    Pack a sequence of statuses into a base-3 pattern code.
+    """
+    code = 0
+    for status in reversed(statuses):
+        code = code * 3 + STATUS_CODES[status]
+    return code
+
+
+def decode_pattern(code: int, word_length: int = 5) -> list[str]:
+    """
+    Unpack a base-3 pattern code into one status per position.
+    """
+    statuses = []
+    for _ in range(word_length):
+        code, digit = divmod(code, 3)
+        statuses.append(STATUSES[digit])
+    return statuses
+
+
+def pattern_code(guess: str, answer: str) -> int:
+    """
+    Score a single (guess, answer) pair straight to its pattern code.
+    """
+    return encode_pattern(score_guess(guess, answer))
@@ -1,17 +1,44 @@
-from .word_list import WordList
+from collections import Counter
+from functools import lru_cache
+
+from . import metrics
+from .feedback import ABSENT, CORRECT, PRESENT
+from .word_list import WordList, get_word_list
+
+_invalid_guesses = metrics.counter("game_invalid_guesses_total", "Guesses rejected as not in the word list")
+
+
+@lru_cache(maxsize=4096)
+def _letter_counts(word: str) -> dict[str, int]:
+    """Letter counts of an answer, shared by every game with that answer (treat as read-only)."""
+    return dict(Counter(word))
+
+
+def _ordinal(n: int) -> str:
+    suffix = "th" if 10 <= n % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+    return f"{n}{suffix}"
+
 
 class WordleGame:
-    def __init__(self, word: str): # Constructor to initialize the game with a word
+    # Statistics live with the player (see WordleGameUI.stats), not on each game;
+    # game_state.CompactGame is the smaller form for hosting many games
+    __slots__ = ("word", "attempts", "max_attempts", "game_over", "word_list", "_letter_counts",
+                 "hard_mode", "_fixed", "_min_counts")
+
+    def __init__(self, word: str, word_list: WordList | None = None, hard_mode: bool = False): # Constructor to initialize the game with a word
         self.word = word.lower() # The word to be guessed
         self.attempts = [] # List to store the attempts made by the player
         self.max_attempts = 6 # Maximum number of attempts allowed
         self.game_over = False # Flag to indicate if the game is over
-        self.games_played = 0 # Number of games played
-        self.games_won = 0 # Number of games won
-        self.current_streak = 0 # Current winning streak
-        self.max_streak = 0 # Maximum winning streak
-        self.word_list = WordList() # Instance of WordList to access the word lists
+        self.word_list = word_list or get_word_list(len(self.word)) # Shared WordList for this word length, loaded once per process
+        self._letter_counts = _letter_counts(self.word) # Letter counts of the answer, reused by every guess
+        # Hard mode: revealed hints must be used in every later guess. The
+        # constraints are accumulated guess by guess, never replayed
+        self.hard_mode = hard_mode
+        self._fixed = [None] * len(self.word) if hard_mode else None # Letter known to be at each position
+        self._min_counts = {} if hard_mode else None # Letter -> occurrences the answer is known to have
 
+    @metrics.timed("game_make_guess_seconds", "Time to score a guess")
     def make_guess(self, guess: str) -> list[tuple[str, str]]:
         """
         Process the player's guess and return feedback for each letter.
@@ -20,21 +47,92 @@ class WordleGame:
                 'correct' - Letter is correct and in the correct position
                 'present' - Letter is in the word but in the wrong position
                 'absent' - Letter is not in the word
+            A repeated letter is only marked 'correct' or 'present' as many
+            times as it occurs in the word.
         """
         guess = guess.lower()
+        word = self.word
+        counts = self._letter_counts
         result = []
 
-        for i, letter in enumerate(guess):
-            if letter == self.word[i]:
-                result.append((letter.upper(), 'correct'))
-            elif letter in self.word:
-                result.append((letter.upper(), 'present'))
+        # First pass: greens, and letters that occur somewhere in the word
+        for letter, char, target in zip(guess, guess.upper(), word):
+            if letter == target:
+                result.append((char, CORRECT))
+            elif letter in counts:
+                result.append((char, PRESENT))
             else:
-                result.append((letter.upper(), 'absent'))
+                result.append((char, ABSENT))
+
+        # Second pass, only needed when the guess repeats a letter: greens use
+        # up their letter first, then each leftover occurrence allows one yellow
+        if len(set(guess)) < len(guess):
+            remaining = counts.copy()
+            for letter, target in zip(guess, word):
+                if letter == target:
+                    remaining[letter] -= 1
+            for i, letter in enumerate(guess):
+                if result[i][1] is PRESENT:
+                    if remaining[letter] > 0:
+                        remaining[letter] -= 1
+                    else:
+                        result[i] = (result[i][0], ABSENT)
 
+        if self.hard_mode:
+            self._add_constraints(guess, result)
         self.attempts.append(guess)
         return result
 
+    def _add_constraints(self, guess: str, result: list[tuple[str, str]]):
+        """Fold one guess's feedback into the hard mode constraints."""
+        shown = {}
+        for i, (letter, (_, status)) in enumerate(zip(guess, result)):
+            if status == CORRECT:
+                self._fixed[i] = letter
+            if status != ABSENT:
+                shown[letter] = shown.get(letter, 0) + 1
+        min_counts = self._min_counts
+        for letter, count in shown.items():
+            if count > min_counts.get(letter, 0):
+                min_counts[letter] = count
+
+    @property
+    def constraints(self) -> tuple[list, dict[str, int]]:
+        """
+        The hard mode constraints revealed so far.
+        Returns:
+            tuple[list, dict[str, int]]: The letter fixed at each position (or
+                None), and the minimum count of each revealed letter.
+        """
+        if not self.hard_mode:
+            return [None] * len(self.word), {}
+        return list(self._fixed), dict(self._min_counts)
+
+    def hard_mode_violation(self, guess: str) -> str | None:
+        """
+        Check a guess against the hard mode constraints in a single pass.
+        Returns:
+            str | None: Why the guess breaks the rules, or None if it is allowed.
+        """
+        if not self.hard_mode:
+            return None
+        guess = guess.lower()
+        if len(guess) != len(self.word):
+            return None # Not a hard mode problem; is_valid_guess rejects it
+        min_counts = self._min_counts
+        counts = {}
+        for i, (letter, fixed) in enumerate(zip(guess, self._fixed)):
+            if fixed is not None and letter != fixed:
+                return f"{_ordinal(i + 1)} letter must be {fixed.upper()}"
+            if letter in min_counts:
+                counts[letter] = counts.get(letter, 0) + 1
+        for letter, count in min_counts.items():
+            if counts.get(letter, 0) < count:
+                if count == 1:
+                    return f"Guess must contain {letter.upper()}"
+                return f"Guess must contain {count} {letter.upper()}s"
+        return None
+
     def is_valid_guess(self, guess: str) -> bool:
         """
         Validate if the guess meets the game requirements
@@ -52,7 +150,11 @@ class WordleGame:
             
         # Check if the word is in our valid word list
         if not self.word_list.is_valid_word(guess):
-            print("Not a valid word!")
+            _invalid_guesses.inc()
+            return False
+
+        # In hard mode the guess must also use every revealed hint
+        if self.hard_mode and self.hard_mode_violation(guess) is not None:
             return False
             
         return True
@@ -0,0 +1,115 @@
+"""
+Compact game state for hosting many live games at once.
+
+A CompactGame stores only integer word IDs (see WordList.word_id) and base-3
+feedback codes (see feedback.py) in __slots__, with no per-instance dict and
+no reference to the word list. Each guess takes three bytes: a little-endian
+uint16 word ID followed by its uint8 feedback code. A byte holds the
+3 ** 5 = 243 codes of five-letter words but not the 729 of six-letter ones,
+so only words of up to MAX_WORD_LENGTH letters can be packed.
+"""
+import struct
+
+from .feedback import decode_pattern, pattern_code
+from .word_list import WordList, get_word_list
+
+# answer id, max attempts, guess count; followed by the packed moves
+HEADER = struct.Struct("<HBB")
+MOVE = struct.Struct("<HB")
+MAX_WORD_LENGTH = 5  # Longest word whose feedback codes fit in MOVE's byte
+
+
+class CompactGame:
+    __slots__ = ("answer_id", "max_attempts", "moves")
+
+    def __init__(self, answer_id: int, max_attempts: int = 6):
+        self.answer_id = answer_id # Index of the answer in WordList.answers
+        self.max_attempts = max_attempts
+        self.moves = bytearray() # MOVE records, one per guess
+
+    @classmethod
+    def for_word(cls, word: str, word_list: WordList | None = None, max_attempts: int = 6) -> "CompactGame":
+        """
+        Start a compact game for word.
+        Raises:
+            ValueError: If word is longer than MAX_WORD_LENGTH letters.
+        """
+        if len(word) > MAX_WORD_LENGTH:
+            raise ValueError(f"CompactGame only packs words of up to {MAX_WORD_LENGTH} letters")
+        word_list = word_list or get_word_list()
+        return cls(word_list.answers.index(word.lower()), max_attempts)
+
+    @classmethod
+    def from_game(cls, game, word_list: WordList | None = None) -> "CompactGame":
+        """
+        Pack a WordleGame into a CompactGame.
+        Raises:
+            ValueError: If the game's word is longer than MAX_WORD_LENGTH letters.
+        """
+        word_list = word_list or game.word_list
+        state = cls.for_word(game.word, word_list, game.max_attempts)
+        for guess in game.attempts:
+            state.add_guess(word_list.word_id(guess), pattern_code(guess, game.word))
+        return state
+
+    @property
+    def guess_ids(self) -> list[int]:
+        return [guess_id for guess_id, _ in MOVE.iter_unpack(self.moves)]
+
+    @property
+    def patterns(self) -> list[int]:
+        return list(self.moves[2::MOVE.size])
+
+    def add_guess(self, guess_id: int, pattern: int):
+        if not 0 <= pattern < 3 ** MAX_WORD_LENGTH:
+            raise ValueError(f"Pattern code {pattern} is out of range for a CompactGame")
+        self.moves += MOVE.pack(guess_id, pattern)
+
+    def make_guess(self, guess: str, word_list: WordList | None = None) -> list[tuple[str, str]]:
+        """
+        Record a guess and return feedback in the same form as WordleGame.make_guess.
+        """
+        word_list = word_list or get_word_list()
+        guess = guess.lower()
+        code = pattern_code(guess, word_list.answers[self.answer_id])
+        self.add_guess(word_list.word_id(guess), code)
+        return list(zip(guess.upper(), decode_pattern(code, len(guess))))
+
+    def attempts(self, word_list: WordList | None = None) -> list[str]:
+        """The guesses made so far, as words."""
+        word_list = word_list or get_word_list()
+        n_answers = len(word_list.answers)
+        return [
+            word_list.answers[i] if i < n_answers else word_list.allowed_guesses[i - n_answers]
+            for i in self.guess_ids
+        ]
+
+    def guess_count(self) -> int:
+        return len(self.moves) // MOVE.size
+
+    def is_won(self) -> bool:
+        return bool(self.moves) and MOVE.unpack_from(self.moves, len(self.moves) - MOVE.size)[0] == self.answer_id
+
+    def is_over(self) -> bool:
+        return self.is_won() or self.guess_count() >= self.max_attempts
+
+    def to_bytes(self) -> bytes:
+        return HEADER.pack(self.answer_id, self.max_attempts, self.guess_count()) + bytes(self.moves)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CompactGame":
+        answer_id, max_attempts, count = HEADER.unpack_from(data, 0)
+        moves = data[HEADER.size:HEADER.size + count * MOVE.size]
+        if len(moves) != count * MOVE.size:
+            raise ValueError("truncated game state")
+        state = cls(answer_id, max_attempts)
+        state.moves = bytearray(moves)
+        return state
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CompactGame):
+            return NotImplemented
+        return self.to_bytes() == other.to_bytes()
+
+    def __repr__(self) -> str:
+        return f"CompactGame(answer_id={self.answer_id}, guesses={self.guess_count()})"
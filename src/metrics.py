@@ -0,0 +1,287 @@
+"""
+Opt-in metrics: counters and latency histograms for the hot paths.
+
+Set WORDLE_METRICS=1 to turn them on. The choice is made when a module is
+imported: with metrics off, timed() hands back the undecorated function and
+counter() / histogram() return a shared no-op, so the hot paths run
+exactly as before. Call enable() before importing the instrumented modules
+to switch them on from code (tests, benchmarks).
+
+Read the numbers with snapshot() (a JSON-able dict) or prometheus_text()
+(the Prometheus text exposition format; the Flask app serves it on
+/metrics). WORDLE_METRICS_FILE=<path> writes the snapshot there when the
+process exits (Prometheus text if the path ends in .prom, JSON otherwise).
+
+WORDLE_PROFILE=<path> runs a session (the Kivy app, either web server)
+under cProfile and dumps the stats there; inspect them with
+python -m pstats <path>.
+"""
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+import atexit
+import json
+import os
+import threading
+import time
+
+METRICS_ENV = "WORDLE_METRICS"
+METRICS_FILE_ENV = "WORDLE_METRICS_FILE"
+PROFILE_ENV = "WORDLE_PROFILE"
+
+# Upper bounds in seconds, from a microsecond lookup to a slow request
+LATENCY_BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name: str, help: str = "", labels: dict | None = None):
+        self.name = name
+        self.help = help
+        self.labels = labels or {}
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1):
+        with self._lock:
+            self.value += amount
+
+    def to_dict(self) -> dict:
+        return {"value": self.value}
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str = "", labels: dict | None = None, buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = labels or {}
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # The last one is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        i = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[i] += 1
+            self.count += 1
+            self.sum += value
+
+    @contextmanager
+    def time(self):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            cumulative, total = [], 0
+            for count in self.counts:
+                total += count
+                cumulative.append(total)
+            return {
+                "count": self.count,
+                "sum": self.sum,
+                "buckets": {_format_bound(bound): n for bound, n in zip(self.buckets + (float("inf"),), cumulative)},
+            }
+
+
+class _NullMetric:
+    """Stands in for every metric while metrics are off."""
+    value = 0
+    count = 0
+
+    def inc(self, amount: int = 1):
+        pass
+
+    def observe(self, value: float):
+        pass
+
+    @contextmanager
+    def time(self):
+        yield
+
+
+_NULL = _NullMetric()
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name: str, help: str, labels: dict | None, **kwargs):
+        key = (name, tuple(sorted((labels or {}).items())))
+        metric = self._metrics.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(key)
+                if metric is None:
+                    metric = self._metrics[key] = cls(name, help, labels, **kwargs)
+        if not isinstance(metric, cls):
+            raise ValueError(f"{name} is already registered as a {metric.kind}")
+        return metric
+
+    def counter(self, name: str, help: str = "", labels: dict | None = None) -> Counter:
+        return self._get(Counter, name, help, labels)
+
+    def histogram(self, name: str, help: str = "", labels: dict | None = None,
+                  buckets=LATENCY_BUCKETS) -> Histogram:
+        return self._get(Histogram, name, help, labels, buckets=buckets)
+
+    def snapshot(self) -> dict:
+        """Every metric by name, with one entry per label set."""
+        # Copy under the lock: a metric registered mid-iteration would
+        # otherwise change the dict's size and break the loop
+        with self._lock:
+            items = sorted(self._metrics.items())
+        snapshot = {}
+        for (name, labels), metric in items:
+            entry = snapshot.setdefault(name, {"type": metric.kind, "help": metric.help, "series": []})
+            entry["series"].append({"labels": dict(labels), **metric.to_dict()})
+        return snapshot
+
+    def prometheus_text(self) -> str:
+        lines = []
+        for name, entry in self.snapshot().items():
+            if entry["help"]:
+                lines.append(f"# HELP {name} {entry['help']}")
+            lines.append(f"# TYPE {name} {entry['type']}")
+            for series in entry["series"]:
+                labels = series["labels"]
+                if entry["type"] == "counter":
+                    lines.append(f"{name}{_format_labels(labels)} {series['value']}")
+                    continue
+                for bound, count in series["buckets"].items():
+                    lines.append(f"{name}_bucket{_format_labels({**labels, 'le': bound})} {count}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {series['sum']!r}")
+                lines.append(f"{name}_count{_format_labels(labels)} {series['count']}")
+        return "\n".join(lines) + "\n"
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+               for value in labels.values())
+    return "{" + ",".join(f'{key}="{value}"' for key, value in zip(labels, escaped)) + "}"
+
+
+# The process-wide registry, or None while metrics are off
+_registry = None
+
+
+def enabled() -> bool:
+    return _registry is not None
+
+
+def enable() -> Registry:
+    """Turn metrics on (for modules imported from now on) and return the registry."""
+    global _registry
+    if _registry is None:
+        _registry = Registry()
+    return _registry
+
+
+def disable():
+    """
+    Turn metrics off. Functions already wrapped by timed() keep recording
+    into the old registry, which is no longer reported.
+    """
+    global _registry
+    _registry = None
+
+
+def counter(name: str, help: str = "", labels: dict | None = None):
+    if _registry is None:
+        return _NULL
+    return _registry.counter(name, help, labels)
+
+
+def histogram(name: str, help: str = "", labels: dict | None = None, buckets=LATENCY_BUCKETS):
+    if _registry is None:
+        return _NULL
+    return _registry.histogram(name, help, labels, buckets)
+
+
+def timed(name: str, help: str = ""):
+    """
+    Decorator recording each call's duration in the histogram name (whose
+    _count doubles as the call counter). Returns the function unchanged
+    while metrics are off.
+    """
+    def decorate(func):
+        if _registry is None:
+            return func
+        metric = _registry.histogram(name, help)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                metric.observe(time.perf_counter() - start)
+        return wrapper
+    return decorate
+
+
+def snapshot() -> dict:
+    return _registry.snapshot() if _registry is not None else {}
+
+
+def prometheus_text() -> str:
+    return _registry.prometheus_text() if _registry is not None else ""
+
+
+def write_snapshot(path) -> None:
+    """Write the metrics to path, as Prometheus text for .prom files and JSON otherwise."""
+    path = str(path)
+    with open(path, "w") as f:
+        if path.endswith(".prom"):
+            f.write(prometheus_text())
+        else:
+            json.dump(snapshot(), f, indent=2)
+
+
+@contextmanager
+def profile_session(path: str | None = None):
+    """
+    Run the body under cProfile if path (default: $WORDLE_PROFILE) is set,
+    dumping the stats there afterwards; otherwise do nothing.
+    """
+    path = path or os.environ.get(PROFILE_ENV)
+    if not path:
+        yield None
+        return
+    import cProfile  # Only needed when profiling
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+
+
+def _write_at_exit(path):
+    try:
+        write_snapshot(path)
+    except OSError as e:
+        print(f"Could not write metrics: {e}")
+
+
+if os.environ.get(METRICS_ENV, "") not in ("", "0"):
+    enable()
+    if os.environ.get(METRICS_FILE_ENV):
+        atexit.register(_write_at_exit, os.environ[METRICS_FILE_ENV])
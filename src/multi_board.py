@@ -0,0 +1,119 @@
+"""
+Multi-board (Quordle / Octordle style) games.
+
+Every guess is played against all the boards at once. Instead of one
+WordleGame per board, the boards' state lives in a few small arrays:
+
+    answers     (boards, L) letter indices, with their letter counts
+    solved_at   (boards,) the turn each board was solved on, or -1
+    patterns    (max_attempts, boards) feedback code of every guess
+    keyboard    (boards, 26) best status seen per board and letter:
+                -1 unused, 0 absent, 1 present, 2 correct
+
+A guess is scored against every unsolved board in one batched call
+(batch_scoring.guess_digits) and the keyboard of all those boards is
+updated with one scatter-max, however many boards there are. The answers
+of the unsolved boards are only re-gathered when a board gets solved.
+
+MultiBoardGame is not a WordleGame: its make_guess returns the boards it
+scored rather than one board's (letter, status) pairs, which feedback()
+gives per board.
+"""
+import numpy as np
+
+from . import metrics
+from .batch_scoring import encode_words, guess_digits, letter_counts, pattern_dtype
+from .feedback import decode_pattern
+from .word_list import WordList, get_word_list
+
+UNUSED = -1  # Keyboard status of a letter not guessed yet
+
+
+class MultiBoardGame:
+    __slots__ = ("words", "word_list", "attempts", "max_attempts", "_answers", "_answer_counts", "solved_at", "patterns", "keyboard", "_powers",
+                 "_active", "_active_answers", "_active_counts")
+
+    def __init__(self, words, word_list: WordList | None = None, max_attempts: int | None = None):
+        """
+        Start a game with one board per answer in words. By default the
+        player gets five more guesses than there are boards (9 for 4 boards,
+        13 for 8).
+        Raises:
+            ValueError: If words is empty or mixes word lengths.
+        """
+        words = [word.lower() for word in words]
+        if not words or len({len(word) for word in words}) != 1:
+            raise ValueError("A multi-board game needs answers of one length")
+        self.words = words
+        self.word_list = word_list or get_word_list(len(words[0]))
+        self.attempts = []
+        self.max_attempts = max_attempts or len(words) + 5
+        n_boards, word_length = len(words), len(words[0])
+        self._answers = encode_words(words)
+        self._answer_counts = letter_counts(self._answers)
+        self.solved_at = np.full(n_boards, -1, dtype=np.int16)
+        self.patterns = np.zeros((self.max_attempts, n_boards), dtype=pattern_dtype(word_length))
+        self.keyboard = np.full((n_boards, 26), UNUSED, dtype=np.int8)
+        self._powers = (3 ** np.arange(word_length)).astype(self.patterns.dtype)
+        # Unsolved boards, with their answers and letter counts
+        self._active = np.arange(n_boards)
+        self._active_answers = self._answers
+        self._active_counts = self._answer_counts
+
+    @property
+    def boards(self) -> int:
+        return len(self.words)
+
+    @metrics.timed("multi_board_make_guess_seconds", "Time to score a guess on every board")
+    def make_guess(self, guess: str) -> np.ndarray:
+        """
+        Play a guess on every unsolved board.
+        Returns:
+            np.ndarray: The indices of the boards that were scored; their
+                pattern codes are in patterns[turn] (see feedback()).
+        """
+        guess = guess.lower()
+        turn = len(self.attempts)
+        letters = encode_words([guess])[0]
+        active = self._active
+
+        digits = guess_digits(letters, self._active_answers, self._active_counts)
+        # Fold every scored board's statuses into the keyboard in one
+        # scatter; a status only ever moves up
+        np.maximum.at(self.keyboard, (active[:, None], letters), digits)
+        codes = digits @ self._powers
+        self.patterns[turn, active] = codes
+
+        solved = codes == 3 ** len(guess) - 1
+        if solved.any():
+            self.solved_at[active[solved]] = turn
+            unsolved = ~solved
+            self._active = active[unsolved]
+            self._active_answers = self._active_answers[unsolved]
+            self._active_counts = self._active_counts[unsolved]
+
+        self.attempts.append(guess)
+        return active
+
+    def is_valid_guess(self, guess: str) -> bool:
+        """Whether guess is a word of the boards' length in the word list."""
+        return (bool(guess) and len(guess) == len(self.words[0]) and guess.isalpha()
+                and self.word_list.is_valid_word(guess.lower()))
+
+    def feedback(self, board: int, turn: int) -> list[tuple[str, str]]:
+        """(letter, status) pairs of one guess on one board, as WordleGame.make_guess returns them."""
+        guess = self.attempts[turn]
+        return list(zip(guess.upper(), decode_pattern(int(self.patterns[turn, board]), len(guess))))
+
+    def scored_boards(self, turn: int) -> np.ndarray:
+        """Boards that were still unsolved when the guess of turn was played."""
+        return np.flatnonzero((self.solved_at < 0) | (self.solved_at >= turn))
+
+    def boards_solved(self) -> int:
+        return int((self.solved_at >= 0).sum())
+
+    def is_won(self) -> bool:
+        return bool((self.solved_at >= 0).all())
+
+    def is_over(self) -> bool:
+        return self.is_won() or len(self.attempts) >= self.max_attempts
@@ -0,0 +1,193 @@
+"""
+Compact binary word-list format.
+
+A compiled file holds the answer and allowed-guess lists as sorted, fixed-width
+ASCII records (one byte per letter, no separators) behind a small header:
+
+    magic (4s) | version (H) | word length (H) | answers (I) | allowed (I) | crc32 (I)
+
+The loader memory-maps the file, so every worker process shares a single
+page-cache copy, and membership checks binary-search the mapped buffer.
+"""
+from collections.abc import Sequence
+from pathlib import Path
+import mmap
+import struct
+import sys
+import zlib
+
+MAGIC = b"WRDL"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIII")
+COMPILED_FILE = "words.bin"
+
+
+class PackedWords(Sequence):
+    """
+    Read-only, sorted sequence of fixed-width words stored in a byte buffer.
+    """
+
+    def __init__(self, buffer, word_length: int, offset: int = 0, count: int | None = None):
+        self._buffer = buffer
+        self.word_length = word_length
+        self._offset = offset
+        if count is None:
+            count = (len(buffer) - offset) // word_length
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _raw(self, index: int) -> bytes:
+        start = self._offset + index * self.word_length
+        return self._buffer[start:start + self.word_length]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("word index out of range")
+        return self._raw(index).decode("ascii")
+
+    def find(self, word: str) -> int:
+        """
+        Return the index of word, or -1 if it is not in the list.
+        """
+        if len(word) != self.word_length:
+            return -1
+        try:
+            key = word.encode("ascii")
+        except UnicodeEncodeError:
+            return -1
+
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            if self._raw(mid) < key:
+                low = mid + 1
+            else:
+                high = mid
+        if low < self._count and self._raw(low) == key:
+            return low
+        return -1
+
+    def index(self, word: str, start: int = 0, stop: int | None = None) -> int:
+        position = self.find(word)
+        if position < start or (stop is not None and position >= stop):
+            raise ValueError(f"{word!r} is not in the word list")
+        return position
+
+    def tobytes(self) -> bytes:
+        """
+        Return the packed records as one bytes object.
+        """
+        end = self._offset + self._count * self.word_length
+        return bytes(self._buffer[self._offset:end])
+
+    def __contains__(self, word) -> bool:
+        return isinstance(word, str) and self.find(word) >= 0
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self._raw(i).decode("ascii")
+
+    def __repr__(self) -> str:
+        return f"PackedWords({self._count} words of length {self.word_length})"
+
+
+def read_word_file(path: Path) -> list[str]:
+    """
+    Read a newline-delimited word file, lower-casing and skipping blank lines.
+    """
+    with open(path, "r") as f:
+        return [word.strip().lower() for word in f if word.strip()]
+
+
+def pack_words(words, word_length: int) -> bytes:
+    """
+    Encode words as sorted, de-duplicated fixed-width records.
+    """
+    encoded = sorted({word.encode("ascii") for word in words})
+    for word in encoded:
+        if len(word) != word_length:
+            raise ValueError(f"{word.decode()!r} is not {word_length} letters long")
+    return b"".join(encoded)
+
+
+def compile_word_lists(answers, allowed_guesses, output: Path, word_length: int = 5) -> Path:
+    """
+    Write the answer and allowed-guess lists to a compiled binary file.
+    The file is written to a temporary name first and renamed into place.
+    """
+    answers_blob = pack_words(answers, word_length)
+    allowed_blob = pack_words(allowed_guesses, word_length)
+    payload = answers_blob + allowed_blob
+    header = HEADER.pack(
+        MAGIC, VERSION, word_length,
+        len(answers_blob) // word_length, len(allowed_blob) // word_length,
+        zlib.crc32(payload),
+    )
+
+    output = Path(output)
+    tmp_path = output.with_suffix(output.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(payload)
+    tmp_path.replace(output)
+    return output
+
+
+def load_compiled(path: Path) -> tuple[PackedWords, PackedWords]:
+    """
+    Memory-map a compiled word-list file.
+    Returns:
+        tuple[PackedWords, PackedWords]: The answers and the allowed guesses.
+    Raises:
+        ValueError: If the file is truncated, corrupt or from another version.
+    """
+    with open(path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if len(buffer) < HEADER.size:
+        raise ValueError(f"{path} is too short to be a compiled word list")
+    magic, version, word_length, n_answers, n_allowed, checksum = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a compiled word list")
+    if version != VERSION:
+        raise ValueError(f"{path} has format version {version}, expected {VERSION}")
+
+    payload_size = (n_answers + n_allowed) * word_length
+    if len(buffer) != HEADER.size + payload_size:
+        raise ValueError(f"{path} is truncated")
+    if zlib.crc32(memoryview(buffer)[HEADER.size:]) != checksum:
+        raise ValueError(f"{path} failed its checksum")
+
+    answers = PackedWords(buffer, word_length, HEADER.size, n_answers)
+    allowed = PackedWords(buffer, word_length, HEADER.size + n_answers * word_length, n_allowed)
+    return answers, allowed
+
+
+def main(argv=None) -> int:
+    """
+    Compile the text word lists in data/ (or the given directory, e.g.
+    data/words-6) into words.bin next to them.
+    """
+    from .word_list import ALLOWED_GUESSES_FILE, ANSWERS_FILE, DATA_DIR
+
+    argv = sys.argv[1:] if argv is None else argv
+    data_dir = Path(argv[0]) if argv else DATA_DIR
+    answers = read_word_file(data_dir / ANSWERS_FILE)
+    output = compile_word_lists(
+        answers,
+        read_word_file(data_dir / ALLOWED_GUESSES_FILE),
+        data_dir / COMPILED_FILE,
+        len(answers[0]) if answers else 5,
+    )
+    print(f"Wrote {output} ({output.stat().st_size} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""
+Precomputed guess x answer feedback table.
+
+Row g, column a holds the base-3 pattern code (see feedback.py) of guess g
+played against answer a, where guesses are numbered as WordList.word_id()
+numbers them. The table is cached in data/cache/ as a .npy file whose name
+carries the format version and a digest of the word lists, so editing the
+lists automatically invalidates it. Cached tables are memory-mapped.
+
+Build the table ahead of time with: python -m src.pattern_table
+"""
+from pathlib import Path
+import hashlib
+import sys
+import time
+
+import numpy as np
+
+from .batch_scoring import pattern_dtype, score_batch
+from .word_list import WordList, get_word_list
+
+TABLE_VERSION = 1
+CACHE_DIR_NAME = "cache"
+
+
+def word_list_digest(word_list: WordList) -> str:
+    """
+    Short content hash of the answers and allowed guesses.
+    """
+    digest = hashlib.sha256()
+    digest.update(word_list.answers.tobytes())
+    digest.update(b"|")
+    digest.update(word_list.allowed_guesses.tobytes())
+    return digest.hexdigest()[:16]
+
+
+def cache_dir_for(word_list: WordList) -> Path:
+    """
+    Derived data lives in a cache/ directory next to the word lists.
+    """
+    return word_list.data_dir / CACHE_DIR_NAME
+
+
+def table_path(word_list: WordList, cache_dir: Path | None = None) -> Path:
+    cache_dir = cache_dir_for(word_list) if cache_dir is None else Path(cache_dir)
+    return cache_dir / f"patterns-v{TABLE_VERSION}-{word_list_digest(word_list)}.npy"
+
+
+def build_pattern_table(word_list: WordList) -> np.ndarray:
+    """
+    Score every valid guess against every answer.
+    """
+    return score_batch(word_list.guess_words(), list(word_list.answers))
+
+
+def save_pattern_table(table: np.ndarray, path: Path) -> Path:
+    """
+    Atomically write a table and remove cached tables for older word lists.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        np.save(f, table)
+    tmp_path.replace(path)
+
+    for old in path.parent.glob("patterns-v*.npy"):
+        if old != path:
+            old.unlink(missing_ok=True)
+    return path
+
+
+def load_pattern_table(word_list: WordList, cache_dir: Path | None = None, build: bool = True) -> np.ndarray | None:
+    """
+    Load the cached table for this word list, building it if it is missing.
+    Returns:
+        np.ndarray | None: The (guesses, answers) table (uint8 for words of
+            up to 5 letters), or None if it is not cached and build is False.
+    """
+    path = table_path(word_list, cache_dir)
+    expected_shape = (len(word_list.answers) + len(word_list.allowed_guesses), len(word_list.answers))
+    if path.exists():
+        try:
+            table = np.load(path, mmap_mode="r")
+            if table.shape == expected_shape and table.dtype == pattern_dtype(word_list.word_length):
+                return table
+        except (OSError, ValueError) as e:
+            print(f"Ignoring cached pattern table: {e}")
+
+    if not build:
+        return None
+    table = build_pattern_table(word_list)
+    try:
+        save_pattern_table(table, path)
+    except OSError as e:
+        print(f"Could not cache pattern table: {e}")
+    return table
+
+
+def main() -> int:
+    """Build (or rebuild) the pattern table for the shared word list."""
+    word_list = get_word_list()
+    start = time.perf_counter()
+    table = build_pattern_table(word_list)
+    path = save_pattern_table(table, table_path(word_list))
+    elapsed = time.perf_counter() - start
+    print(f"Wrote {path}: {table.shape[0]} x {table.shape[1]} patterns "
+          f"({table.nbytes / 1e6:.1f} MB) in {elapsed:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+"""
+Framework-independent game service used by the web front-ends.
+
+GameService turns requests ("start a game", "guess this word", "show the
+board") into plain dicts, keeping the games themselves in a SessionStore.
+"""
+from datetime import date
+import secrets
+import threading
+import time
+import weakref
+
+from .feedback import score_guess
+from .game import WordleGame
+from .session_store import LRUSessionStore, SessionStore
+from .stats_store import StatsBackend
+from .word_list import WORD_LENGTH, WordList, get_word_list
+
+
+class GameError(Exception):
+    """A request the service cannot fulfil; status is the matching HTTP code."""
+    status = 400
+
+
+class GameNotFound(GameError):
+    status = 404
+
+
+class InvalidGuess(GameError):
+    status = 400
+
+
+ANONYMOUS_USER = "anonymous"
+MAX_USER_LENGTH = 64
+
+
+class GameService:
+    def __init__(self, store: SessionStore | None = None, word_list: WordList | None = None,
+                 on_finished=None, stats: StatsBackend | None = None):
+        self.store = store if store is not None else LRUSessionStore()
+        self._word_list = word_list
+        # Called with a result record whenever a game ends; must not block
+        self.on_finished = on_finished
+        # Where finished games are recorded and per-user stats are read from
+        self.stats = stats
+        # Player name of each game started with one
+        self.players = LRUSessionStore()
+        # One lock per game being played, kept only while a request holds it
+        self._game_locks = weakref.WeakValueDictionary()
+        self._game_locks_lock = threading.Lock()
+
+    @property
+    def word_list(self) -> WordList:
+        # Resolved on first use so each worker process loads the lexicon once
+        if self._word_list is None:
+            self._word_list = get_word_list()
+        return self._word_list
+
+    def word_list_for(self, word_length: int) -> WordList:
+        """
+        The lexicon for games of word_length letters. Other lengths than the
+        default are loaded the first time a game of that length starts.
+        Raises:
+            GameError: If there is no word list for that length.
+        """
+        if isinstance(word_length, bool) or not isinstance(word_length, int):
+            raise GameError("Invalid word length")
+        if word_length == self.word_list.word_length:
+            return self.word_list
+        try:
+            return get_word_list(word_length)
+        except ValueError as e:
+            raise GameError(str(e))
+
+    def start_game(self, user: str | None = None, seed=None, day: str | None = None,
+                   hard_mode: bool = False, word_length: int = WORD_LENGTH) -> dict:
+        """
+        Start a game and return its initial state. The answer is random,
+        fixed by seed (an int or str) for replays, or the daily puzzle for
+        day (an ISO date, or "today"). Hard mode games must use every
+        revealed hint in later guesses.
+        Raises:
+            GameError: If user, seed, day, hard_mode or word_length is invalid.
+        """
+        user = _check_user(user) if user is not None else None
+        if not isinstance(hard_mode, bool):
+            raise GameError("Invalid hard_mode; expected true or false")
+        word_list = self.word_list_for(word_length)
+        puzzle = None
+        if day is not None:
+            from .daily import daily_answer, puzzle_number
+            try:
+                day = date.today() if day == "today" else date.fromisoformat(day)
+                puzzle = puzzle_number(day)
+            except (TypeError, ValueError):
+                raise GameError("Invalid puzzle date")
+            answer = daily_answer(day, word_list)
+        elif seed is not None:
+            if isinstance(seed, bool) or not isinstance(seed, (int, str)):
+                raise GameError("Invalid seed")
+            answer = word_list.get_random_word(seed)
+        else:
+            answer = word_list.get_random_word()
+
+        game = WordleGame(answer, word_list, hard_mode)
+        game_id = secrets.token_urlsafe(12)
+        self.store.put(game_id, game)
+        if user is not None:
+            self.players.put(game_id, user)
+        state = self._state(game_id, game)
+        if puzzle is not None:
+            state["puzzle"] = puzzle
+        return state
+
+    def _get(self, game_id: str) -> WordleGame:
+        game = self.store.get(game_id)
+        if game is None:
+            raise GameNotFound(f"No game with id {game_id!r}")
+        return game
+
+    def _game_lock(self, game_id: str) -> threading.Lock:
+        with self._game_locks_lock:
+            lock = self._game_locks.get(game_id)
+            if lock is None:
+                lock = self._game_locks[game_id] = threading.Lock()
+            return lock
+
+    def get_state(self, game_id: str) -> dict:
+        return self._state(game_id, self._get(game_id))
+
+    def submit_guess(self, game_id: str, guess) -> dict:
+        """
+        Play a guess and return the feedback along with the new state.
+        Raises:
+            GameNotFound: If the game does not exist.
+            InvalidGuess: If the game is over or the guess is not a valid word.
+        """
+        # Concurrent guesses on one game are played one at a time, so two of
+        # them cannot both pass the checks and overrun max_attempts or record
+        # the finished game twice
+        with self._game_lock(game_id):
+            return self._submit_guess(game_id, guess)
+
+    def _submit_guess(self, game_id: str, guess) -> dict:
+        game = self._get(game_id)
+        if game.is_over():
+            raise InvalidGuess("The game is already over")
+        if not isinstance(guess, str) or not game.is_valid_guess(guess):
+            violation = game.hard_mode_violation(guess) if isinstance(guess, str) else None
+            if violation is not None and game.word_list.is_valid_word(guess):
+                raise InvalidGuess(violation)
+            raise InvalidGuess("Not in word list")
+
+        result = game.make_guess(guess)
+        self.store.put(game_id, game)
+        state = self._state(game_id, game)
+        if state["over"]:
+            record = {
+                "id": game_id,
+                "user": self.players.get(game_id) or ANONYMOUS_USER,
+                "answer": game.word,
+                "guesses": list(game.attempts),
+                "won": state["won"],
+                "finished_at": time.time(),
+            }
+            if self.on_finished is not None:
+                self.on_finished(record)
+            if self.stats is not None:
+                self.stats.submit(record)
+        state["feedback"] = [{"letter": letter, "status": status} for letter, status in result]
+        return state
+
+    def get_stats(self, user: str) -> dict:
+        """
+        Return a player's aggregate statistics.
+        Raises:
+            GameError: If user is not a valid player name.
+            GameNotFound: If no per-user statistics backend is configured.
+        """
+        user = _check_user(user)
+        if self.stats is None or not self.stats.per_user:
+            raise GameNotFound("Per-user statistics are not enabled")
+        stats = self.stats.get_stats(user)
+        return {"user": user, **stats.to_dict(), "win_rate": stats.win_rate}
+
+    def _state(self, game_id: str, game: WordleGame) -> dict:
+        state = {
+            "id": game_id,
+            "word_length": len(game.word),
+            "max_attempts": game.max_attempts,
+            "hard_mode": game.hard_mode,
+            "attempts": [
+                {"guess": guess, "statuses": score_guess(guess, game.word)}
+                for guess in game.attempts
+            ],
+            "won": game.is_won(),
+            "over": game.is_over(),
+        }
+        if state["over"]:
+            state["answer"] = game.word
+        return state
+
+
+def _check_user(user) -> str:
+    if not isinstance(user, str) or not 0 < len(user) <= MAX_USER_LENGTH:
+        raise GameError("Invalid user name")
+    return user
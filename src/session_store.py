@@ -0,0 +1,59 @@
+"""
+Pluggable storage for live game sessions.
+
+A store maps session IDs to game objects. The web API only relies on the
+SessionStore interface, so the in-memory LRU default can be swapped for a
+shared store (e.g. one backed by CompactGame.to_bytes()) without touching
+the handlers.
+"""
+from collections import OrderedDict
+import threading
+
+
+class SessionStore:
+    """Interface for session stores."""
+
+    def get(self, session_id: str):
+        """Return the game for session_id, or None if it is unknown or expired."""
+        raise NotImplementedError
+
+    def put(self, session_id: str, game):
+        """Store (or replace) the game for session_id."""
+        raise NotImplementedError
+
+    def delete(self, session_id: str):
+        """Forget session_id if it exists."""
+        raise NotImplementedError
+
+
+class LRUSessionStore(SessionStore):
+    """
+    Thread-safe in-memory store that evicts the least recently used
+    session once capacity is reached.
+    """
+
+    def __init__(self, capacity: int = 100_000):
+        self.capacity = capacity
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str):
+        with self._lock:
+            game = self._sessions.get(session_id)
+            if game is not None:
+                self._sessions.move_to_end(session_id)
+            return game
+
+    def put(self, session_id: str, game):
+        with self._lock:
+            self._sessions[session_id] = game
+            self._sessions.move_to_end(session_id)
+            while len(self._sessions) > self.capacity:
+                self._sessions.popitem(last=False)
+
+    def delete(self, session_id: str):
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
@@ -0,0 +1,201 @@
+"""
+Headless self-play simulator.
+
+Plays every answer in the word list end-to-end through WordleGame with a
+pluggable guessing strategy, spreading the games over a process pool.
+
+Run with: python -m src.simulator --strategy entropy --workers 8 [--hard]
+"""
+from collections import Counter
+import argparse
+import os
+import random
+import sys
+import time
+
+from .game import WordleGame
+from .word_list import WordList, get_word_list
+
+# name -> factory(word_list, seed) returning an object with next_guess(game);
+# a factory may also have a prepare(word_list) that builds shared caches once
+STRATEGIES = {}
+
+
+def register_strategy(name: str):
+    """Decorator that makes a strategy factory available to the simulator."""
+    def register(factory):
+        STRATEGIES[name] = factory
+        return factory
+    return register
+
+
+@register_strategy("entropy")
+class EntropyStrategy:
+    """Always play the solver's top-ranked guess."""
+
+    def __init__(self, word_list: WordList, seed: int = 0):
+        from .solver import Solver
+        self.solver = Solver(word_list)
+
+    def next_guess(self, game: WordleGame) -> str:
+        self.solver.sync(game)
+        constraints = game.constraints if game.hard_mode else None
+        return self.solver.suggest(1, constraints)[0][0]
+
+
+@register_strategy("random-candidate")
+class RandomCandidateStrategy:
+    """
+    Play a random answer that is still consistent with the feedback
+    (which always satisfies hard mode).
+    """
+
+    def __init__(self, word_list: WordList, seed: int = 0):
+        from .solver import Solver
+        self.solver = Solver(word_list)
+        self.seed = seed
+
+    def next_guess(self, game: WordleGame) -> str:
+        self.solver.sync(game)
+        # Seed per game and turn so results do not depend on how games are split across workers
+        rng = random.Random(f"{self.seed}:{game.word}:{len(game.attempts)}")
+        return rng.choice(self.solver.remaining_answers())
+
+
+@register_strategy("tree")
+class DecisionTreeStrategy:
+    """
+    Look the next guess up in the precomputed decision tree (see
+    decision_tree.py), falling back to the solver off the tree and where
+    the tree's guess would break hard mode.
+    """
+
+    def __init__(self, word_list: WordList, seed: int = 0):
+        from .decision_tree import load_decision_tree
+        self.tree = load_decision_tree(word_list, workers=1)
+        self.fallback = EntropyStrategy(word_list, seed)
+
+    @staticmethod
+    def prepare(word_list: WordList):
+        from .decision_tree import load_decision_tree
+        load_decision_tree(word_list)
+
+    def next_guess(self, game: WordleGame) -> str:
+        guess = self.tree.next_guess(game)
+        if guess is None or game.hard_mode_violation(guess) is not None:
+            return self.fallback.next_guess(game)
+        return guess
+
+
+def play_game(answer: str, strategy, word_list: WordList, hard_mode: bool = False) -> int:
+    """
+    Play one game to the end.
+    Returns:
+        int: The number of guesses used, or 0 if the game was lost.
+    Raises:
+        ValueError: If the strategy breaks the hard mode rules.
+    """
+    game = WordleGame(answer, word_list, hard_mode)
+    while not game.is_over():
+        guess = strategy.next_guess(game)
+        violation = game.hard_mode_violation(guess)
+        if violation is not None:
+            raise ValueError(f"{guess!r} breaks hard mode: {violation}")
+        game.make_guess(guess)
+    return len(game.attempts) if game.is_won() else 0
+
+
+# Per-process state, created once by _init_worker rather than sent with every task
+_worker = {}
+
+
+def _init_worker(strategy_name: str, seed: int, hard_mode: bool = False):
+    word_list = get_word_list()
+    _worker["word_list"] = word_list
+    _worker["hard_mode"] = hard_mode
+    _worker["strategy"] = STRATEGIES[strategy_name](word_list, seed)
+
+
+def _play_range(bounds: tuple[int, int]) -> list[int]:
+    word_list = _worker["word_list"]
+    strategy = _worker["strategy"]
+    hard_mode = _worker["hard_mode"]
+    return [play_game(word_list.answers[i], strategy, word_list, hard_mode) for i in range(*bounds)]
+
+
+def simulate(strategy_name: str = "entropy", workers: int | None = None, chunk_size: int = 32,
+             limit: int | None = None, seed: int = 0, hard_mode: bool = False) -> dict:
+    """
+    Play every answer (or the first `limit`) and summarize the results.
+    Returns:
+        dict: games, wins, win_rate, mean_guesses, histogram (guesses -> games,
+            0 meaning lost), seconds and games_per_sec.
+    """
+    if strategy_name not in STRATEGIES:
+        raise ValueError(f"Unknown strategy {strategy_name!r}; choose from {', '.join(sorted(STRATEGIES))}")
+
+    # Build the shared caches up front so forked workers only map them
+    word_list = get_word_list()
+    word_list.get_pattern_table()
+    prepare = getattr(STRATEGIES[strategy_name], "prepare", None)
+    if prepare is not None:
+        prepare(word_list)
+    n_games = len(word_list.answers) if limit is None else min(limit, len(word_list.answers))
+    chunks = [(start, min(start + chunk_size, n_games)) for start in range(0, n_games, chunk_size)]
+    workers = workers or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    if workers == 1:
+        _init_worker(strategy_name, seed, hard_mode)
+        results = [n for bounds in chunks for n in _play_range(bounds)]
+    else:
+        from concurrent.futures import ProcessPoolExecutor  # Only needed with several workers
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(strategy_name, seed, hard_mode)) as pool:
+            results = [n for chunk in pool.map(_play_range, chunks) for n in chunk]
+    elapsed = time.perf_counter() - start
+
+    histogram = Counter(results)
+    wins = n_games - histogram.get(0, 0)
+    return {
+        "strategy": strategy_name,
+        "hard_mode": hard_mode,
+        "workers": workers,
+        "games": n_games,
+        "wins": wins,
+        "win_rate": wins / n_games if n_games else 0.0,
+        "mean_guesses": sum(n for n in results if n) / wins if wins else 0.0,
+        "histogram": dict(sorted(histogram.items())),
+        "seconds": elapsed,
+        "games_per_sec": n_games / elapsed if elapsed else 0.0,
+    }
+
+
+def print_report(summary: dict):
+    mode = ", hard mode" if summary.get("hard_mode") else ""
+    print(f"Strategy: {summary['strategy']} ({summary['workers']} workers{mode})")
+    print(f"Won {summary['wins']}/{summary['games']} ({summary['win_rate']:.2%}), "
+          f"{summary['mean_guesses']:.3f} guesses per win")
+    width = max(summary["histogram"].values(), default=1)
+    for guesses, count in summary["histogram"].items():
+        label = "X" if guesses == 0 else str(guesses)
+        print(f"  {label}: {count:5d} {'#' * max(1, round(40 * count / width))}")
+    print(f"{summary['games_per_sec']:.1f} games/sec ({summary['seconds']:.2f}s)")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Play every Wordle answer with a guessing strategy.")
+    parser.add_argument("--strategy", default="entropy", choices=sorted(STRATEGIES))
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=32, help="answers per task")
+    parser.add_argument("--limit", type=int, default=None, help="only play the first N answers")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--hard", action="store_true", help="play by the hard mode rules")
+    args = parser.parse_args(argv)
+
+    print_report(simulate(args.strategy, args.workers, args.chunk_size, args.limit, args.seed, args.hard))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
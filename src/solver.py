@@ -0,0 +1,179 @@
+"""
+Entropy-based hint and solver engine.
+
+The solver tracks which answers are still consistent with the guesses made
+so far and ranks possible next guesses by the expected information (in bits)
+of the feedback they would produce. Feedback comes from the precomputed
+pattern table (see pattern_table.py), so nothing is rescored at runtime.
+"""
+from pathlib import Path
+
+import numpy as np
+
+from . import metrics
+from .pattern_table import cache_dir_for, word_list_digest
+from .word_list import WordList, get_word_list
+
+FIRST_GUESS_VERSION = 1
+
+# Guesses per histogram in partition_entropy()
+ENTROPY_CHUNK_ROWS = 256
+
+
+def partition_entropy(table: np.ndarray, candidates: np.ndarray, word_length: int = 5) -> np.ndarray:
+    """
+    Entropy of the feedback partition each guess induces over the candidates.
+    Returns:
+        np.ndarray: One float64 entropy (bits) per row of the table.
+    """
+    n_patterns = 3 ** word_length
+    n_guesses = table.shape[0]
+    n_candidates = len(candidates)
+    entropies = np.zeros(n_guesses)
+    if n_candidates == 0:
+        return entropies
+
+    # H = log2(n) - sum(c * log2(c)) / n over the partition sizes c
+    sizes = np.arange(n_candidates + 1, dtype=np.float64)
+    c_log_c = np.zeros_like(sizes)
+    c_log_c[1:] = sizes[1:] * np.log2(sizes[1:])
+
+    # Count patterns a few hundred guesses at a time so the histogram stays in cache
+    offsets = (np.arange(ENTROPY_CHUNK_ROWS, dtype=np.intp) * n_patterns)[:, None]
+    for start in range(0, n_guesses, ENTROPY_CHUNK_ROWS):
+        codes = table[start:start + ENTROPY_CHUNK_ROWS][:, candidates].astype(np.intp)
+        rows = codes.shape[0]
+        codes += offsets[:rows]
+        counts = np.bincount(codes.ravel(), minlength=rows * n_patterns)
+        entropies[start:start + rows] = (
+            np.log2(n_candidates) - c_log_c[counts].reshape(rows, n_patterns).sum(axis=1) / n_candidates
+        )
+    return entropies
+
+
+@metrics.timed("solver_first_guess_scores_seconds", "Time to load or compute the opening entropies")
+def first_guess_scores(word_list: WordList, cache_dir: Path | None = None) -> np.ndarray:
+    """
+    Entropy of every guess against the full answer list, cached on disk
+    next to the pattern table so the opening suggestion is instant.
+    """
+    cache_dir = cache_dir_for(word_list) if cache_dir is None else Path(cache_dir)
+    path = cache_dir / f"first-guess-v{FIRST_GUESS_VERSION}-{word_list_digest(word_list)}.npy"
+    if path.exists():
+        try:
+            return np.load(path)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring cached first-guess scores: {e}")
+
+    scores = partition_entropy(word_list.get_pattern_table(), np.arange(len(word_list.answers)),
+                               word_list.word_length)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            np.save(f, scores)
+        tmp_path.replace(path)
+    except OSError as e:
+        print(f"Could not cache first-guess scores: {e}")
+    return scores
+
+
+class Solver:
+    def __init__(self, word_list: WordList | None = None):
+        """
+        Initialize a solver over the full answer list.
+        """
+        self.word_list = word_list or get_word_list()
+        self.table = self.word_list.get_pattern_table()
+        self._guess_letters = None # (guesses, L) letter codes, built for hard mode
+        self.reset()
+
+    def reset(self):
+        """Forget all guesses and consider every answer again."""
+        self.candidates = np.arange(len(self.word_list.answers))
+        self.history = [] # (guess, pattern) pairs applied so far
+        self._game = None
+
+    @metrics.timed("solver_update_seconds", "Time to narrow the candidates after a guess")
+    def update(self, guess: str, pattern: int):
+        """
+        Narrow the candidates to the answers that would have produced
+        this feedback pattern for this guess.
+        """
+        guess_id = self.word_list.word_id(guess)
+        row = self.table[guess_id]
+        self.candidates = self.candidates[row[self.candidates] == pattern]
+        self.history.append((guess.lower(), pattern))
+
+    def sync(self, game):
+        """
+        Apply any attempts made in a WordleGame since the last sync.
+        """
+        if game is not self._game or len(game.attempts) < len(self.history):
+            self.reset()
+            self._game = game
+        for guess in game.attempts[len(self.history):]:
+            self.update(guess, self.word_list.pattern(guess, game.word))
+
+    def remaining_answers(self) -> list[str]:
+        """The answers still consistent with every guess so far."""
+        answers = self.word_list.answers
+        return [answers[i] for i in self.candidates]
+
+    def allowed_guesses(self, constraints) -> np.ndarray:
+        """
+        Mask of the guesses that satisfy hard mode constraints, as returned
+        by WordleGame.constraints (fixed letters and minimum letter counts).
+        """
+        if self._guess_letters is None:
+            from .batch_scoring import encode_words
+            self._guess_letters = encode_words(self.word_list.guess_words())
+        letters = self._guess_letters
+        fixed, min_counts = constraints
+        allowed = np.ones(len(letters), dtype=bool)
+        for i, letter in enumerate(fixed):
+            if letter is not None:
+                allowed &= letters[:, i] == ord(letter) - 97
+        for letter, count in min_counts.items():
+            allowed &= (letters == ord(letter) - 97).sum(axis=1) >= count
+        return allowed
+
+    @metrics.timed("solver_suggest_seconds", "Time to rank the next guesses")
+    def suggest(self, k: int = 5, constraints=None) -> list[tuple[str, float]]:
+        """
+        Rank the next guess by expected information. With hard mode
+        constraints (see WordleGame.constraints) only guesses that satisfy
+        them are ranked.
+        Returns:
+            list[tuple[str, float]]: Up to k (word, entropy in bits) pairs,
+                best first. Guesses that could themselves be the answer are
+                preferred by their chance of winning outright.
+        """
+        n_candidates = len(self.candidates)
+        if n_candidates == 0:
+            return []
+
+        if not self.history:
+            entropies = first_guess_scores(self.word_list)
+        else:
+            entropies = partition_entropy(self.table, self.candidates, self.word_list.word_length)
+
+        # Candidate answers sit at the start of the guess axis, so their IDs
+        # in the table equal their answer indices
+        scores = entropies.copy()
+        scores[self.candidates] += 1.0 / n_candidates
+        if constraints is not None:
+            allowed = self.allowed_guesses(constraints)
+            scores[~allowed] = -np.inf
+            k = min(k, int(allowed.sum()))
+
+        k = min(k, len(scores))
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return [(self._word_for_id(int(i)), float(entropies[i])) for i in best]
+
+    def _word_for_id(self, word_id: int) -> str:
+        n_answers = len(self.word_list.answers)
+        if word_id < n_answers:
+            return self.word_list.answers[word_id]
+        return self.word_list.allowed_guesses[word_id - n_answers]
@@ -0,0 +1,338 @@
+"""
+SQLite statistics backend for many players.
+
+Finished games go into a `games` table (indexed by user and by date) and
+each player's aggregates are kept materialized in `user_stats`, updated in
+the same transaction as the inserts, so reading a player's stats is one
+primary-key lookup however many games are stored.
+
+The database runs in WAL mode so readers never block the writer (nor each
+other). Each thread borrows a connection from a small pool; sqlite3 caches
+the prepared form of the fixed SQL statements below on every connection. Games recorded
+one at a time (e.g. by web handlers) are buffered and inserted in batches
+by a background thread, at most `flush_interval` seconds after they arrive.
+A batch that fails with a transient error (e.g. "database is locked")
+stays buffered and is retried, up to MAX_WRITE_ATTEMPTS times; a record
+the database rejects for any other reason is reported and dropped without
+holding up the others.
+
+Reads include buffered games without writing them first. Every buffered
+record gets a sequence number, and each batch commits the last number it
+wrote (in `buffer_writers`, one row per store) in its own transaction. A
+read runs in one snapshot transaction and adds only the buffered records
+numbered past what its snapshot has committed, so each game is seen exactly
+once without holding any lock while the database is queried.
+"""
+from contextlib import contextmanager
+from pathlib import Path
+import json
+import queue
+import secrets
+import sqlite3
+import threading
+
+from .stats_store import LOCAL_USER, GameStats, StatsBackend, check_record
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    user TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    guesses TEXT NOT NULL,
+    won INTEGER NOT NULL,
+    duration REAL,
+    finished_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_by_user ON games (user, finished_at);
+CREATE INDEX IF NOT EXISTS games_by_date ON games (finished_at);
+CREATE TABLE IF NOT EXISTS user_stats (
+    user TEXT PRIMARY KEY,
+    games_played INTEGER NOT NULL,
+    games_won INTEGER NOT NULL,
+    current_streak INTEGER NOT NULL,
+    max_streak INTEGER NOT NULL,
+    distribution TEXT NOT NULL,
+    total_duration REAL NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS buffer_writers (
+    writer TEXT PRIMARY KEY,
+    last_seq INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+INSERT_GAME = ("INSERT INTO games (user, answer, guesses, won, duration, finished_at) "
+               "VALUES (?, ?, ?, ?, ?, ?)")
+SELECT_STATS = ("SELECT games_played, games_won, current_streak, max_streak, distribution, total_duration "
+                "FROM user_stats WHERE user = ?")
+SELECT_STATS_MANY = ("SELECT user, games_played, games_won, current_streak, max_streak, distribution, "
+                     "total_duration FROM user_stats WHERE user IN ({})")
+MAX_PARAMS = 900  # Below SQLite's default limit on bound parameters
+# Errors worth retrying a batch for, and how many times to try before dropping it
+RETRYABLE_ERRORS = (sqlite3.OperationalError,)
+MAX_WRITE_ATTEMPTS = 5
+UPSERT_STATS = ("INSERT OR REPLACE INTO user_stats (user, games_played, games_won, current_streak, "
+                "max_streak, distribution, total_duration) VALUES (?, ?, ?, ?, ?, ?, ?)")
+UPSERT_WRITER = "INSERT OR REPLACE INTO buffer_writers (writer, last_seq) VALUES (?, ?)"
+SELECT_WRITER = "SELECT last_seq FROM buffer_writers WHERE writer = ?"
+DELETE_WRITER = "DELETE FROM buffer_writers WHERE writer = ?"
+SELECT_HISTORY = ("SELECT user, answer, guesses, won, duration, finished_at FROM games "
+                  "WHERE user = ? ORDER BY finished_at, id")
+SELECT_HISTORY_BETWEEN = ("SELECT user, answer, guesses, won, duration, finished_at FROM games "
+                          "WHERE finished_at >= ? AND finished_at < ? ORDER BY finished_at, id")
+
+
+class ConnectionPool:
+    """A fixed number of connections shared between threads."""
+
+    def __init__(self, path: Path, size: int = 4):
+        self.path = str(path)
+        self._idle = queue.Queue()
+        for _ in range(size):
+            self._idle.put(self._connect())
+
+    def _connect(self) -> sqlite3.Connection:
+        # Transactions are managed explicitly with BEGIN / COMMIT
+        connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None,
+                                     cached_statements=32)
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.execute("PRAGMA busy_timeout = 5000")
+        return connection
+
+    @contextmanager
+    def connection(self):
+        connection = self._idle.get()
+        try:
+            yield connection
+        finally:
+            self._idle.put(connection)
+
+    def close(self):
+        while not self._idle.empty():
+            self._idle.get_nowait().close()
+
+
+def _stats_from_row(row) -> GameStats:
+    stats = GameStats()
+    if row is not None:
+        (stats.games_played, stats.games_won, stats.current_streak, stats.max_streak,
+         distribution, stats.total_duration) = row
+        stats.distribution = json.loads(distribution)
+    return stats
+
+
+class SQLiteStatsStore(StatsBackend):
+    per_user = True
+
+    def __init__(self, path: Path, pool_size: int = 4, batch_size: int = 256, flush_interval: float = 0.05):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.pool = ConnectionPool(self.path, pool_size)
+        with self.pool.connection() as connection:
+            connection.executescript(SCHEMA)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        # Buffered (sequence number, record) pairs, and the batch being written
+        self._pending = []
+        self._in_flight = []
+        self._next_seq = 0
+        self._writer_id = secrets.token_hex(8)
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # Keeps batches in arrival order
+        self._wake = threading.Event()
+        self._closed = False
+        self._writer = None
+        self._failed_attempts = 0  # Consecutive retryable failures of the batch at the front
+
+    def append(self, records: list[dict], last_seq: int | None = None):
+        """
+        Insert finished games and update their players' aggregates in one
+        transaction. Records without a user count towards LOCAL_USER.
+        flush() passes the sequence number of the last buffered record in
+        the batch, which is committed along with it.
+        Raises:
+            ValueError: If any record is invalid; nothing is written then.
+            sqlite3.Error: If the transaction failed and was rolled back.
+        """
+        if not records:
+            return
+        for record in records:
+            check_record(record)
+        with self.pool.connection() as connection:
+            # Take the write lock up front so no other writer can change the
+            # aggregates between reading and replacing them
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.executemany(INSERT_GAME, [
+                    (record.get("user") or LOCAL_USER, record["answer"], ",".join(record["guesses"]),
+                     int(bool(record["won"])), record.get("duration"), record["finished_at"])
+                    for record in records
+                ])
+                users = list(dict.fromkeys(record.get("user") or LOCAL_USER for record in records))
+                stats = dict.fromkeys(users)
+                # Fetch the current aggregates of the whole batch's players at once
+                for i in range(0, len(users), MAX_PARAMS):
+                    chunk = users[i:i + MAX_PARAMS]
+                    query = SELECT_STATS_MANY.format(", ".join("?" * len(chunk)))
+                    for row in connection.execute(query, chunk):
+                        stats[row[0]] = _stats_from_row(row[1:])
+                for record in records:
+                    user = record.get("user") or LOCAL_USER
+                    if stats[user] is None:
+                        stats[user] = GameStats()
+                    stats[user].add(record)
+                connection.executemany(UPSERT_STATS, [
+                    (user, s.games_played, s.games_won, s.current_streak, s.max_streak,
+                     json.dumps(s.distribution), s.total_duration)
+                    for user, s in stats.items()
+                ])
+                if last_seq is not None:
+                    connection.execute(UPSERT_WRITER, (self._writer_id, last_seq))
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+    def submit(self, record: dict):
+        """
+        Buffer a record for the background batch writer.
+        Raises:
+            ValueError: If record is not a valid game record.
+        """
+        check_record(record)
+        with self._pending_lock:
+            self._next_seq += 1
+            self._pending.append((self._next_seq, record))
+            full = len(self._pending) >= self.batch_size
+            if (self._writer is None or not self._writer.is_alive()) and not self._closed:
+                self._writer = threading.Thread(target=self._run_writer, daemon=True)
+                self._writer.start()
+        if full:
+            self._wake.set()
+
+    def _run_writer(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                # Retryable batches are still pending; the writer must keep running either way
+                print(f"Error writing game results: {e}")
+
+    def flush(self):
+        """
+        Write every buffered record now.
+        Raises:
+            sqlite3.OperationalError: If the database could not be written
+                (e.g. it is locked); the records stay buffered, ahead of any
+                that arrived since, unless this was their last attempt.
+        """
+        with self._flush_lock:
+            with self._pending_lock:
+                batch, self._pending = self._pending, []
+                self._in_flight = batch
+            if not batch:
+                return
+            try:
+                try:
+                    self.append([record for _, record in batch], last_seq=batch[-1][0])
+                except RETRYABLE_ERRORS:
+                    self._retry_later(batch)
+                    raise
+                except Exception:
+                    # Something in the batch is bad; write the records one at a time
+                    self._append_each(batch)
+                self._failed_attempts = 0
+            finally:
+                with self._pending_lock:
+                    self._in_flight = []
+
+    def _append_each(self, batch: list[tuple[int, dict]]):
+        for i, (seq, record) in enumerate(batch):
+            try:
+                self.append([record], last_seq=seq)
+            except RETRYABLE_ERRORS:
+                self._retry_later(batch[i:])
+                raise
+            except Exception as e:
+                print(f"Dropping invalid game result {record!r}: {e}")
+
+    def _retry_later(self, batch: list[tuple[int, dict]]):
+        """Put a failed batch back at the front of the buffer, or drop it after its last attempt."""
+        self._failed_attempts += 1
+        if self._failed_attempts >= MAX_WRITE_ATTEMPTS:
+            print(f"Dropping {len(batch)} game results after {self._failed_attempts} failed writes")
+            self._failed_attempts = 0
+            return
+        with self._pending_lock:
+            self._pending[:0] = batch
+
+    @contextmanager
+    def _read(self):
+        """
+        Yield a connection inside a snapshot transaction, and the buffered
+        records that snapshot does not contain yet.
+        """
+        # Take the buffer first: anything committed from it after this point
+        # is numbered at most the last_seq the snapshot below reads
+        with self._pending_lock:
+            buffered = self._in_flight + self._pending
+        with self.pool.connection() as connection:
+            connection.execute("BEGIN")
+            try:
+                # The first read fixes the snapshot for the whole transaction
+                row = connection.execute(SELECT_WRITER, (self._writer_id,)).fetchone()
+                written = row[0] if row is not None else 0
+                yield connection, [record for seq, record in buffered if seq > written]
+            finally:
+                connection.execute("COMMIT")
+
+    def get_stats(self, user: str = LOCAL_USER) -> GameStats:
+        """Read user's materialized aggregates (including any buffered games)."""
+        with self._read() as (connection, pending):
+            stats = _stats_from_row(connection.execute(SELECT_STATS, (user,)).fetchone())
+        for record in pending:
+            if (record.get("user") or LOCAL_USER) == user:
+                stats.add(record)
+        return stats
+
+    def history(self, user: str = LOCAL_USER):
+        with self._read() as (connection, pending):
+            rows = connection.execute(SELECT_HISTORY, (user,)).fetchall()
+        for row in rows:
+            yield _record_from_row(row)
+        for record in pending:
+            if (record.get("user") or LOCAL_USER) == user:
+                yield record
+
+    def games_between(self, start: float, end: float) -> list[dict]:
+        """Every game finished in [start, end), e.g. one day's puzzles."""
+        with self._read() as (connection, pending):
+            rows = connection.execute(SELECT_HISTORY_BETWEEN, (start, end)).fetchall()
+        games = [_record_from_row(row) for row in rows]
+        games.extend(record for record in pending if start <= record["finished_at"] < end)
+        return sorted(games, key=lambda record: record["finished_at"])
+
+    def close(self):
+        self._closed = True
+        self._wake.set()
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+        self.flush()
+        with self.pool.connection() as connection:
+            connection.execute(DELETE_WRITER, (self._writer_id,))
+        self.pool.close()
+
+
+def _record_from_row(row) -> dict:
+    user, answer, guesses, won, duration, finished_at = row
+    return {
+        "user": user,
+        "answer": answer,
+        "guesses": guesses.split(",") if guesses else [],
+        "won": bool(won),
+        "duration": duration,
+        "finished_at": finished_at,
+    }
@@ -0,0 +1,377 @@
+"""
+Append-only statistics store.
+
+Every finished game is appended to a JSON-lines log as one compact record
+(answer, guesses, result, duration), so the full per-game history is kept.
+Aggregates (games played and won, streaks, guess distribution) are updated
+incrementally as records are appended, so recording a game costs the same
+however long the history gets.
+
+Each append is flushed to the OS straight away, which survives a crash of
+the app; fsync is batched every `sync_every` records to bound what a power
+loss can take. Every `compact_every` records the aggregates are written to a
+snapshot (atomically, via a temporary file and rename) together with the
+log offset they cover, so opening the store only replays the log written
+since the last snapshot. A torn final line is truncated on open; a corrupt
+line elsewhere is skipped, never taking the records after it with it.
+"""
+from pathlib import Path
+import json
+import os
+import threading
+import time
+
+from .word_list import DATA_DIR
+
+STATS_LOG = DATA_DIR / "stats.jsonl"
+STATS_DB_ENV = "WORDLE_STATS_DB"  # Path of a SQLite database to use instead
+LOCAL_USER = "local"
+LEGACY_STATS_FILE = DATA_DIR / "statistics.json"
+SNAPSHOT_VERSION = 1
+MAX_ATTEMPTS = 6
+
+
+def snapshot_path_for(log_path: Path) -> Path:
+    return log_path.with_name(log_path.stem + ".snapshot.json")
+
+
+def check_record(record) -> None:
+    """
+    Check that record describes a finished game (see game_record()).
+    Raises:
+        ValueError: If a field is missing or of the wrong type, or a won
+            game has no guesses.
+    """
+    if not isinstance(record, dict):
+        raise ValueError("A game record must be a JSON object")
+    guesses = record.get("guesses")
+    if not isinstance(record.get("answer"), str):
+        raise ValueError("Game record without an answer")
+    if not isinstance(guesses, list) or not all(isinstance(guess, str) for guess in guesses):
+        raise ValueError("Game record without a list of guesses")
+    if not isinstance(record.get("won"), bool):
+        raise ValueError("Game record without a result")
+    if record["won"] and not guesses:
+        raise ValueError("Won game record without guesses")
+    for field in ("duration", "finished_at"):
+        value = record.get(field)
+        if isinstance(value, bool) or not isinstance(value, (int, float, type(None))):
+            raise ValueError(f"Game record with an invalid {field}")
+    if record.get("finished_at") is None:
+        raise ValueError("Game record without finished_at")
+
+
+class GameStats:
+    """Aggregates over a sequence of finished games, updated one game at a time."""
+
+    def __init__(self):
+        self.games_played = 0
+        self.games_won = 0
+        self.current_streak = 0
+        self.max_streak = 0
+        # Wins by number of guesses (index 0 is a win in one guess)
+        self.distribution = [0] * MAX_ATTEMPTS
+        self.total_duration = 0.0
+
+    def add(self, record: dict):
+        """
+        Count one finished game.
+        Raises:
+            ValueError: If record is not a valid game record (see check_record()).
+        """
+        check_record(record)
+        self.games_played += 1
+        self.total_duration += record.get("duration") or 0.0
+        if record["won"]:
+            self.games_won += 1
+            self.current_streak += 1
+            self.max_streak = max(self.max_streak, self.current_streak)
+            guesses = len(record["guesses"])
+            if guesses > len(self.distribution):
+                self.distribution.extend([0] * (guesses - len(self.distribution)))
+            self.distribution[guesses - 1] += 1
+        else:
+            self.current_streak = 0
+
+    @property
+    def win_rate(self) -> float:
+        return self.games_won / self.games_played if self.games_played else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "games_played": self.games_played,
+            "games_won": self.games_won,
+            "current_streak": self.current_streak,
+            "max_streak": self.max_streak,
+            "distribution": list(self.distribution),
+            "total_duration": self.total_duration,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "GameStats":
+        stats = cls()
+        stats.games_played = int(data.get("games_played", 0))
+        stats.games_won = int(data.get("games_won", 0))
+        stats.current_streak = int(data.get("current_streak", 0))
+        stats.max_streak = int(data.get("max_streak", 0))
+        distribution = data.get("distribution") or []
+        stats.distribution = [int(n) for n in distribution] + [0] * (MAX_ATTEMPTS - len(distribution))
+        stats.total_duration = float(data.get("total_duration", 0.0))
+        return stats
+
+
+def game_record(answer: str, guesses, won: bool, duration: float | None = None,
+                user: str = LOCAL_USER) -> dict:
+    """Build the record stored for one finished game."""
+    return {
+        "user": user,
+        "answer": answer,
+        "guesses": list(guesses),
+        "won": bool(won),
+        "duration": None if duration is None else round(duration, 3),
+        "finished_at": round(time.time(), 3),
+    }
+
+
+class StatsBackend:
+    """
+    Interface for statistics backends, shared by the Kivy UI and the web API.
+    Records are dicts with answer, guesses, won, duration and finished_at,
+    plus the player's user name where a backend tracks several players.
+    """
+    # Whether get_stats() and history() keep each user's games apart
+    per_user = False
+
+    def record_game(self, answer: str, guesses, won: bool, duration: float | None = None,
+                    user: str = LOCAL_USER) -> dict:
+        """Record one finished game and return the record."""
+        record = game_record(answer, guesses, won, duration, user)
+        self.submit(record)
+        return record
+
+    def append(self, records: list[dict]):
+        """Record a batch of finished games, oldest first."""
+        raise NotImplementedError
+
+    def submit(self, record: dict):
+        """Record one finished game from a request handler; may be buffered."""
+        self.append([record])
+
+    def get_stats(self, user: str = LOCAL_USER) -> GameStats:
+        """Return the aggregates for user."""
+        raise NotImplementedError
+
+    def history(self, user: str = LOCAL_USER):
+        """Yield user's game records, oldest first."""
+        raise NotImplementedError
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+
+class StatsStore(StatsBackend):
+    """
+    Single-player store backed by a JSON-lines log; every record counts
+    towards the same aggregates whatever its user.
+    """
+
+    def __init__(self, log_path: Path = STATS_LOG, sync_every: int = 16, compact_every: int = 1000,
+                 legacy_path: Path | None = None):
+        self.log_path = Path(log_path)
+        self.snapshot_path = snapshot_path_for(self.log_path)
+        self.sync_every = sync_every
+        self.compact_every = compact_every
+        self.legacy_path = legacy_path
+        self.stats = GameStats()
+        self._offset = 0        # Bytes of the log covered by self.stats
+        self._snapshot_offset = 0
+        self._unsynced = 0
+        self._since_snapshot = 0
+        self._file = None
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        """Restore the aggregates from the snapshot and replay the log after it."""
+        snapshot = self._read_snapshot()
+        try:
+            log_size = self.log_path.stat().st_size
+        except FileNotFoundError:
+            log_size = 0
+
+        if snapshot is not None and snapshot["offset"] <= log_size:
+            self.stats = GameStats.from_dict(snapshot["stats"])
+            self._offset = self._snapshot_offset = snapshot["offset"]
+        elif snapshot is None and log_size == 0 and self.legacy_path is not None and self.legacy_path.exists():
+            # Carry over the counters from the old statistics.json; they only
+            # live in the snapshot, so write it before any game is logged
+            try:
+                self.stats = GameStats.from_dict(json.loads(self.legacy_path.read_text()))
+            except (OSError, ValueError) as e:
+                print(f"Ignoring old statistics file: {e}")
+            else:
+                self._write_snapshot()
+
+        if log_size > self._offset:
+            self._replay(log_size)
+
+    def _read_snapshot(self) -> dict | None:
+        try:
+            snapshot = json.loads(self.snapshot_path.read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"Ignoring statistics snapshot: {e}")
+            return None
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            return None
+        return snapshot
+
+    def _replay(self, log_size: int):
+        """
+        Apply the records after the current offset. A corrupt line is
+        skipped; only a torn final line (no newline) is truncated.
+        """
+        skipped = 0
+        with open(self.log_path, "rb") as f:
+            f.seek(self._offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                self._offset += len(line)
+                try:
+                    # Valid JSON that is not a game record is as corrupt as a garbled line
+                    self.stats.add(json.loads(line))
+                except ValueError:
+                    skipped += 1
+                    continue
+                self._since_snapshot += 1
+        if skipped:
+            print(f"Skipped {skipped} corrupt statistics records in {self.log_path}")
+
+        if self._offset < log_size:
+            print(f"Truncating {log_size - self._offset} bytes of incomplete statistics at the end of {self.log_path}")
+            with open(self.log_path, "r+b") as f:
+                f.truncate(self._offset)
+                os.fsync(f.fileno())
+
+    def append(self, records: list[dict]):
+        """Append finished-game records (e.g. a batch from the write-behind queue)
+        and update the aggregates.
+        Raises:
+            ValueError: If any record is invalid; nothing is written then.
+        """
+        for record in records:
+            check_record(record)
+        data = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records).encode()
+        with self._lock:
+            if self._file is None:
+                self.log_path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.log_path, "ab")
+            self._file.write(data)
+            self._file.flush()
+            self._offset += len(data)
+            for record in records:
+                self.stats.add(record)
+
+            self._unsynced += len(records)
+            if self._unsynced >= self.sync_every:
+                self._sync()
+            self._since_snapshot += len(records)
+            if self._since_snapshot >= self.compact_every:
+                self._write_snapshot()
+
+    def _sync(self):
+        if self._file is not None and self._unsynced:
+            os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def _write_snapshot(self):
+        """Atomically record the aggregates and the log offset they cover."""
+        # The snapshot must never point past data that is not yet on disk
+        self._sync()
+        snapshot = {"version": SNAPSHOT_VERSION, "offset": self._offset, "stats": self.stats.to_dict()}
+        tmp_path = self.snapshot_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f)
+            f.flush()
+            os.fsync(f.fileno())
+        tmp_path.replace(self.snapshot_path)
+        self._snapshot_offset = self._offset
+        self._since_snapshot = 0
+
+    def get_stats(self, user: str = LOCAL_USER) -> GameStats:
+        return self.stats
+
+    def history(self, user: str = LOCAL_USER):
+        """Yield every complete game record in the log, oldest first."""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+            end = self._offset
+        try:
+            with open(self.log_path, "rb") as f:
+                while f.tell() < end:
+                    try:
+                        record = json.loads(f.readline())
+                        check_record(record)
+                    except ValueError:
+                        continue  # Corrupt line, skipped on replay too
+                    yield record
+        except FileNotFoundError:
+            return
+
+    def flush(self):
+        """fsync pending records and bring the snapshot up to date."""
+        with self._lock:
+            self._sync()
+            if self._offset != self._snapshot_offset:
+                self._write_snapshot()
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def open_stats_store(legacy_path: Path | None = None) -> StatsBackend:
+    """
+    Open the configured statistics backend: the SQLite database named by
+    $WORDLE_STATS_DB if set, otherwise the JSON-lines log in data/.
+    """
+    db_path = os.environ.get(STATS_DB_ENV)
+    if db_path:
+        from .sqlite_store import SQLiteStatsStore
+        return SQLiteStatsStore(db_path)
+    return StatsStore(legacy_path=legacy_path)
+
+
+# Process-wide backend shared by the Kivy UI and the Flask app
+_shared_stats_store = None
+_shared_lock = threading.Lock()
+
+
+def get_stats_store() -> StatsBackend:
+    """
+    Return the shared statistics backend, opening it on first use.
+    """
+    global _shared_stats_store
+    with _shared_lock:
+        if _shared_stats_store is None:
+            _shared_stats_store = open_stats_store(LEGACY_STATS_FILE)
+        return _shared_stats_store
+
+
+def set_stats_store(store: StatsBackend | None) -> None:
+    """
+    Replace the shared backend (e.g. with a temporary one in tests).
+    Passing None makes the next get_stats_store() call open it again.
+    """
+    global _shared_stats_store
+    with _shared_lock:
+        _shared_stats_store = store
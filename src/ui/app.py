@@ -5,31 +5,33 @@ from kivy.uix.label import Label
 from kivy.uix.popup import Popup
 from kivy.animation import Animation
 from kivy.clock import Clock
-from kivy.core.window import Window
 from kivy.metrics import dp
-from kivy.properties import ObjectProperty, ListProperty, BooleanProperty, StringProperty
-from kivy.graphics import Color, Rectangle, Line
-import json
+from kivy.properties import ObjectProperty, ListProperty, BooleanProperty, StringProperty, NumericProperty
 import os
+import random
+import time
+from pathlib import Path
 
-from ..word_list import WordList
+from .. import metrics
+from ..word_list import get_word_list, reload_word_list_if_changed
 from ..game import WordleGame
+from ..multi_board import MultiBoardGame
+from ..stats_store import get_stats_store
 from .themes import ThemeManager
-from .tile import Tile
+from .grid import TileGrid
+from .boards import BoardGrid, KeyboardStatus, board_columns
+from .reveal import RevealScheduler
+from .frames import FrameMonitor
 
-from kivy.factory import Factory
 from kivy.uix.button import Button
-from kivy.uix.gridlayout import GridLayout
-
-# Register the Tile template explicitly
-Factory.register('Tile', cls=Label)
-
-# Debugging: Print registered templates
-print("Templates loaded:", Builder.templates.keys())
 
 # Constants
 WORD_LENGTH = 5
+WORD_LENGTH_ENV = "WORDLE_WORD_LENGTH"  # Play 4-8 letter words instead of 5
+BOARDS_ENV = "WORDLE_BOARDS"  # Play this many boards at once (multi-board mode)
 NUM_ATTEMPTS = 6
+KV_FILE = Path(__file__).parent.parent.parent / "wordle.kv"
+RESIZE_GESTURE_GAP = 0.25  # Seconds without a resize event that end a gesture
 
 # Color constants
 CORRECT_COLOR = (0.416, 0.667, 0.392, 1)  # #6aaa64 (green)
@@ -40,149 +42,166 @@ WHITE_COLOR = (1, 1, 1, 1)                # #ffffff (white)
 DARK_TEXT_COLOR = (0.1, 0.1, 0.1, 1)      # #1a1a1a (near black)
 DEFAULT_KEY_COLOR = (0.82, 0.84, 0.85, 1) # #d3d6da (light gray)
 
+def compute_layout(width, height, word_length=WORD_LENGTH, num_attempts=NUM_ATTEMPTS):
+    """
+    Work out the grid and keyboard geometry for a window size.
+    Returns:
+        dict: tile_size, grid_size, key_width and wide_key_width.
+    """
+    tile_size = min(dp(62), (width - dp(100)) / word_length)
+    grid_width = (tile_size * word_length) + ((word_length - 1) * dp(5))
+    grid_height = (tile_size * num_attempts) + ((num_attempts - 1) * dp(5))
+    # Ten keys and nine gaps on the top keyboard row
+    key_width = min(dp(43), (width - dp(16) - 9 * dp(4)) / 10)
+    return {
+        'tile_size': (tile_size, tile_size),
+        'grid_size': (grid_width, grid_height),
+        'key_width': key_width,
+        'wide_key_width': key_width * 1.5,
+    }
+
+def compute_board_layout(width, height, word_length, num_attempts, boards):
+    """
+    Geometry for a multi-board game: the boards share the space of one big
+    grid, and tiles also shrink to fit the height left by the keyboard.
+    Returns:
+        dict: As compute_layout(), plus board_size.
+    """
+    cols = board_columns(boards)
+    rows = -(-boards // cols)
+    layout = compute_layout(width, height, word_length * cols, num_attempts * rows)
+    tile_size = min(layout['tile_size'][0], (height - dp(320)) / (num_attempts * rows) - dp(5))
+    tile_size = max(tile_size, dp(4))
+    board_width = (tile_size * word_length) + ((word_length - 1) * dp(5))
+    board_height = (tile_size * num_attempts) + ((num_attempts - 1) * dp(5))
+    layout.update({
+        'tile_size': (tile_size, tile_size),
+        'board_size': (board_width, board_height),
+        'grid_size': (board_width * cols + (cols - 1) * dp(5), board_height * rows + (rows - 1) * dp(5)),
+    })
+    return layout
+
 class KeyButton(Button):
     key_id = StringProperty('')
 
 class WordleGameUI(BoxLayout):
     tile_grid = ObjectProperty()
     keyboard = ObjectProperty()
+    # Letters per word; the KV rule sizes the grid from it
+    word_length = NumericProperty(WORD_LENGTH)
 
-    def on_kv_post(self, base_widget):
-        """Populate the tile grid after the KV file is loaded."""
-        tile_grid = self.ids.tile_grid
-        tile_grid.clear_widgets()
-
-        for _ in range(6 * 5):  # 6 rows x 5 columns
-            tile = Tile()  # Create a Tile instance
-            tile_grid.add_widget(tile)
-    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
         # Theme manager for color blind mode
         self.theme_manager = ThemeManager()
         
-        # Statistics tracking
-        self.stats = {
-            'games_played': 0,
-            'games_won': 0,
-            'current_streak': 0,
-            'max_streak': 0
-        }
-        
-        # Load saved statistics
-        self.load_statistics()
+        # Statistics backend shared with the Flask app (see stats_store.py);
+        # the JSON-lines log by default, SQLite when $WORDLE_STATS_DB is set
+        self.stats_store = get_stats_store()
         
         # Game state initialization
-        self.word_list = WordList()
-        self.answer = self.word_list.get_random_word().upper()
-        self.game = WordleGame(self.answer)
+        self.word_list = get_word_list(int(self.word_length))
+        self.new_game()
         self.guess_index = 0
         self.current_guess = ""
+        self.game_started = time.monotonic()
+
+        # Keyboard keys by letter, for coloring as tiles are revealed
+        self.keys = {
+            key.text: key for key in self.keyboard.walk()
+            if isinstance(key, Button) and len(key.text) == 1 and key.text.isalpha()
+        }
+
+        # One scheduler drives each row's flip and the keyboard updates
+        self.reveal = RevealScheduler()
+        self.reveal.bind(on_tile_revealed=self._on_tile_revealed)
+        self.reveal.bind(on_complete=lambda *args: self.check_game_status())
         
-        # Explicitly initialize tile_grid as a GridLayout and add it to the layout
-        self.tile_grid = GridLayout(cols=5, rows=6, spacing=dp(5), size_hint=(None, None))
-        self.tile_grid.size = (dp(325), dp(390))
-        self.tile_grid.pos_hint = {'center_x': 0.5, 'center_y': 0.5}
-        self.add_widget(self.tile_grid)
-        
-        # Setup tiles and keyboard
-        self.setup_tiles()
-        
-        # Window resize callback
+        # Resize events are coalesced into at most one relayout per frame
+        self.layout = None
+        from kivy.core.window import Window  # Creating the window is slow; defer it
+        self._pending_size = Window.size
+        self._relayout_trigger = Clock.create_trigger(self._relayout, -1)
+        self._gesture_trigger = Clock.create_trigger(self._end_resize_gesture, RESIZE_GESTURE_GAP)
+        self.resize_stats = {'resize_events': 0, 'relayouts': 0}
+        self.last_resize_gesture = None
+        self._relayout()
+        self.resize_stats['relayouts'] = 0  # The initial layout is not a resize
         Window.bind(on_resize=self._on_window_resize)
     
-    def save_statistics(self):
-        """Save game statistics to file"""
-        stats_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data')
-        os.makedirs(stats_dir, exist_ok=True)
-        stats_path = os.path.join(stats_dir, 'statistics.json')
-        
-        try:
-            with open(stats_path, 'w') as f:
-                json.dump(self.stats, f)
-        except Exception as e:
-            print(f"Error saving statistics: {e}")
-    
-    def load_statistics(self):
-        """Load game statistics from file if available"""
-        stats_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data')
-        stats_path = os.path.join(stats_dir, 'statistics.json')
-        
-        if os.path.exists(stats_path):
-            try:
-                with open(stats_path, 'r') as f:
-                    loaded_stats = json.load(f)
-                    self.stats.update(loaded_stats)
-            except Exception as e:
-                print(f"Error loading statistics: {e}")
-    
-    def setup_tiles(self):
-        """Set up tile grid programmatically"""
-        self.tiles = []
-
-        # Clear any existing widgets in the tile grid
-        self.tile_grid.clear_widgets()
-
-        # Create tiles
-        for row in range(NUM_ATTEMPTS):
-            tile_row = []
-            for col in range(WORD_LENGTH):
-                # Create a visible tile with proper styling
-                tile = Label(
-                    size_hint=(None, None),
-                    size=(dp(56), dp(56)),
-                    font_size=dp(32),
-                    bold=True,
-                    halign='center',
-                    valign='middle',
-                    text='',
-                    color=(1, 1, 1, 1)  # White text color
-                )
-                # Set tile status attribute
-                tile.status = "default"
-
-                # Explicitly set up the canvas to ensure visibility
-                with tile.canvas.before:
-                    Color(0.12, 0.12, 0.12, 1)  # Dark gray background
-                    Rectangle(pos=tile.pos, size=tile.size)
-                    Color(0.3, 0.3, 0.3, 1)  # Border color
-                    Line(rectangle=(tile.x, tile.y, tile.width, tile.height), width=2)
-
-                tile_row.append(tile)
-                self.tile_grid.add_widget(tile)
-                print(f"Added tile at row {row}, col {col}")  # Debugging log
-            self.tiles.append(tile_row)
-
-        # Force layout update
-        self.tile_grid.do_layout()
-    
+    def new_game(self):
+        """Pick an answer and start a game with it"""
+        self.answer = self.word_list.get_random_word().upper()
+        self.game = WordleGame(self.answer, self.word_list)
+
+    @property
+    def tiles(self):
+        """Rows of Tile widgets, built once by the TileGrid in the KV rule"""
+        return self.tile_grid.rows_of_tiles
+
+    @property
+    def stats(self):
+        """Aggregated statistics over every finished game"""
+        return self.stats_store.get_stats()
+
     def _on_window_resize(self, instance, width, height):
-        """Handle window resize to maintain proper proportions"""
-        # Recalculate tile sizes based on new window width
-        tile_grid = self.ids.tile_grid
-        tile_size = min(dp(62), (width - dp(100)) / WORD_LENGTH)
-        grid_width = (tile_size * WORD_LENGTH) + ((WORD_LENGTH - 1) * dp(5))
-        grid_height = (tile_size * NUM_ATTEMPTS) + ((NUM_ATTEMPTS - 1) * dp(5))
-        
-        # Update grid container size
-        tile_grid.size = (grid_width, grid_height)
-        
-        # Update individual tile sizes
+        """Record the new window size and schedule one relayout for this frame"""
+        self._pending_size = (width, height)
+        self.resize_stats['resize_events'] += 1
+        self._relayout_trigger()
+        # Restart the gesture timer so a drag counts as a single gesture
+        self._gesture_trigger.cancel()
+        self._gesture_trigger()
+
+    def _relayout(self, dt=None):
+        """Apply the geometry for the latest window size in one pass"""
+        layout = compute_layout(*self._pending_size, int(self.word_length))
+        if layout == self.layout:
+            return
+        self.layout = layout
+        self.resize_stats['relayouts'] += 1
+
+        self.tile_grid.size = layout['grid_size']
         for row in self.tiles:
             for tile in row:
-                tile.size = (tile_size, tile_size)
+                tile.size = layout['tile_size']
+        self._layout_keyboard(layout)
+
+    def _layout_keyboard(self, layout):
+        for key in self.keyboard.walk():
+            if isinstance(key, Button):
+                key.width = layout['key_width'] if len(key.text) == 1 else layout['wide_key_width']
+
+    def on_word_length(self, instance, value):
+        """Start a game of the new length; the TileGrid rebuilds its rows itself"""
+        if getattr(self, 'game', None) is None:
+            return  # Set from the constructor, before the first game exists
+        # Ahead of the KV binding, so the relayout below sizes the new rows
+        self.tile_grid.word_length = value
+        self.reset_game()
+        self.layout = None
+        self._relayout()
+
+    def _end_resize_gesture(self, dt):
+        """Keep the counters of the resize gesture that just finished"""
+        self.last_resize_gesture = self.resize_stats
+        self.resize_stats = {'resize_events': 0, 'relayouts': 0}
     
     def on_keyboard_input(self, letter):
         """Handle letter key presses"""
-        if len(self.current_guess) < WORD_LENGTH and not self.game.is_over():
+        if len(self.current_guess) < self.word_length and not self.game.is_over():
             # Add letter to current guess
             self.current_guess += letter
             # Update tile display
-            tile = self.tiles[self.guess_index][len(self.current_guess) - 1]
-            tile.text = letter
-            # Add subtle pop animation
-            self._animate_tile_input(tile)
+            for tile in self._input_tiles(len(self.current_guess) - 1):
+                tile.text = letter
+                # Add subtle pop animation
+                self._animate_tile_input(tile)
+
+    def _input_tiles(self, position):
+        """Tiles that show the letter typed at this position of the current guess"""
+        return [self.tiles[self.guess_index][position]]
     
     def _animate_tile_input(self, tile):
         """Add a subtle pop animation when letter is entered"""
@@ -196,17 +215,18 @@ class WordleGameUI(BoxLayout):
     def on_backspace(self, instance=None):
         """Handle backspace key press"""
         if self.current_guess and not self.game.is_over():
-            # Get tile reference before removing the letter
-            tile = self.tiles[self.guess_index][len(self.current_guess) - 1]
-            # Remove last letter and clear tile
+            # Get tile references before removing the letter
+            tiles = self._input_tiles(len(self.current_guess) - 1)
+            # Remove last letter and clear tiles
             self.current_guess = self.current_guess[:-1]
-            tile.text = ""
-            # Update the tile status
-            self._update_tile_status(tile, "default")
+            for tile in tiles:
+                tile.text = ""
+                # Update the tile status
+                self._update_tile_status(tile, "default")
     
     def on_enter(self, instance=None):
         """Submit current guess"""
-        if len(self.current_guess) == WORD_LENGTH and not self.game.is_over():
+        if len(self.current_guess) == self.word_length and not self.game.is_over():
             if not self.word_list.is_valid_word(self.current_guess):
                 self.show_invalid_word()
                 return
@@ -219,34 +239,17 @@ class WordleGameUI(BoxLayout):
                 self.show_popup("Error", "Unexpected result from game logic.")
                 return
                 
-            # Animate tiles with delay for flip effect
-            self.animate_reveal_tiles(result)
-            
-            # Move to next row
+            # Move to next row, then flip the submitted one; the game over
+            # check runs when the reveal scheduler reports completion
+            row = self.guess_index
             self.guess_index += 1
             self.current_guess = ""
-            
-            # Check game over conditions after animation completes
-            Clock.schedule_once(lambda dt: self.check_game_status(), 1.5)
+            self.animate_reveal_tiles(result, row)
     
     def _update_tile_status(self, tile, status):
         """Update the visual status of a tile"""
-        with tile.canvas:
-            tile.canvas.clear()
-            if status == "correct":
-                Color(*CORRECT_COLOR)
-            elif status == "present":
-                Color(*PRESENT_COLOR)
-            elif status == "absent":
-                Color(*ABSENT_COLOR)
-            else:
-                Color(*DEFAULT_COLOR)
-            Rectangle(pos=tile.pos, size=tile.size)
-
-            # Add border for default tiles
-            if status == "default":
-                Color(0.3, 0.3, 0.3, 1)
-                Line(rectangle=(tile.x, tile.y, tile.width, tile.height), width=2)
+        # Recolors the tile's existing canvas instructions in place
+        tile.set_status(status)
     
     def _animate_tile_flip(self, tile):
         """Animate the tile flipping"""
@@ -261,9 +264,9 @@ class WordleGameUI(BoxLayout):
             # Only update to a "higher" status (correct > present > absent)
             if status == "correct":
                 self._set_key_color(key, CORRECT_COLOR)
-            elif status == "present" and key.background_color != CORRECT_COLOR:
+            elif status == "present" and tuple(key.background_color) != CORRECT_COLOR:
                 self._set_key_color(key, PRESENT_COLOR)
-            elif status == "absent" and key.background_color not in [CORRECT_COLOR, PRESENT_COLOR]:
+            elif status == "absent" and tuple(key.background_color) not in [CORRECT_COLOR, PRESENT_COLOR]:
                 self._set_key_color(key, ABSENT_COLOR)
     
     def _set_key_color(self, key, color):
@@ -276,7 +279,6 @@ class WordleGameUI(BoxLayout):
     
     def show_invalid_word(self):
         """Show animation for invalid word with proper shake and error message"""
-        row_tiles = self.tiles[self.guess_index]
         tile_grid = self.tile_grid
         start_pos = tile_grid.pos
         
@@ -321,9 +323,9 @@ class WordleGameUI(BoxLayout):
         # After shake completes, clear the current guess
         def clear_guess(dt):
             for i in range(len(self.current_guess)):
-                tile = row_tiles[i]
-                tile.text = ""
-                self._update_tile_status(tile, "default")
+                for tile in self._input_tiles(i):
+                    tile.text = ""
+                    self._update_tile_status(tile, "default")
             self.current_guess = ""
         
         Clock.schedule_once(clear_guess, 1.5)
@@ -338,24 +340,22 @@ class WordleGameUI(BoxLayout):
             self.show_game_over_popup("Game Over", f"The word was: {self.answer}")
     
     def update_stats(self, won):
-        """Update game statistics"""
-        self.stats['games_played'] += 1
-        if won:
-            self.stats['games_won'] += 1
-            self.stats['current_streak'] += 1
-            self.stats['max_streak'] = max(self.stats['max_streak'], self.stats['current_streak'])
-        else:
-            self.stats['current_streak'] = 0
+        """Record the finished game; the store updates the aggregates"""
+        self.stats_store.record_game(self.answer, self.game.attempts, won,
+                                     duration=time.monotonic() - self.game_started)
     
     def show_game_over_popup(self, title, message):
         """Show game over popup with stats and play again option"""
         content = BoxLayout(orientation='vertical', spacing=10, padding=10)
+        stats = self.stats
         
         content.add_widget(Label(text=message, font_size=20))
-        content.add_widget(Label(text=f"Games Played: {self.stats['games_played']}", font_size=16))
-        content.add_widget(Label(text=f"Win Rate: {int(self.stats['games_won']/max(1, self.stats['games_played'])*100)}%", font_size=16))
-        content.add_widget(Label(text=f"Current Streak: {self.stats['current_streak']}", font_size=16))
-        content.add_widget(Label(text=f"Max Streak: {self.stats['max_streak']}", font_size=16))
+        content.add_widget(Label(text=f"Games Played: {stats.games_played}", font_size=16))
+        content.add_widget(Label(text=f"Win Rate: {int(stats.win_rate * 100)}%", font_size=16))
+        content.add_widget(Label(text=f"Current Streak: {stats.current_streak}", font_size=16))
+        content.add_widget(Label(text=f"Max Streak: {stats.max_streak}", font_size=16))
+        distribution = "  ".join(f"{i}: {n}" for i, n in enumerate(stats.distribution, 1))
+        content.add_widget(Label(text=f"Guesses: {distribution}", font_size=14))
         
         from kivy.uix.button import Button
         play_again_btn = Button(text="Play Again", size_hint_y=None, height=50)
@@ -374,10 +374,12 @@ class WordleGameUI(BoxLayout):
     
     def reset_game(self, instance=None):
         """Reset the game with a new word"""
-        self.answer = self.word_list.get_random_word().upper()
-        self.game = WordleGame(self.answer)
+        self.reveal.cancel()
+        self.word_list = reload_word_list_if_changed(int(self.word_length))
+        self.new_game()
         self.guess_index = 0
         self.current_guess = ""
+        self.game_started = time.monotonic()
         
         # Clear all tiles
         for row in self.tiles:
@@ -389,115 +391,164 @@ class WordleGameUI(BoxLayout):
         for letter, key in self.keys.items():
             self._set_key_color(key, DEFAULT_KEY_COLOR)
 
-    def animate_reveal_tiles(self, result):
-        """Animate the tiles with the results of the guess"""
-        # Ensure the results match the current guess length
-        if len(result) != len(self.tiles[self.guess_index]):
+    def animate_reveal_tiles(self, result, row=None):
+        """Flip a row of tiles to reveal the results of the guess"""
+        row_tiles = self.tiles[self.guess_index if row is None else row]
+        # make_guess returns (letter, status) pairs
+        self.reveal.reveal(row_tiles, [status for _, status in result])
+
+    def _on_tile_revealed(self, scheduler, tile, status):
+        """Color the matching key on the same frame the tile shows its status"""
+        self.update_key_status(tile.text, status)
+
+class MultiBoardGameUI(WordleGameUI):
+    """
+    Quordle / Octordle style: every guess is played on all the boards.
+    The boards replace the single tile grid, and each letter key carries
+    one status segment per board (see boards.KeyboardStatus).
+    """
+    boards = NumericProperty(4)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Swap the KV rule's single grid for one grid per board
+        single = self.tile_grid
+        parent = single.parent
+        index = parent.children.index(single)
+        parent.remove_widget(single)
+        self.board_grid = BoardGrid(boards=int(self.boards), word_length=int(self.word_length),
+                                    num_attempts=self.game.max_attempts, pos_hint=single.pos_hint)
+        parent.add_widget(self.board_grid, index)
+        self.tile_grid = self.board_grid
+        self.key_status = KeyboardStatus(self.keys, int(self.boards))
+        self.layout = None
+        self._relayout()
+        self.resize_stats['relayouts'] = 0
+
+    def new_game(self):
+        """Pick a different answer for every board"""
+        words = random.sample(self.word_list.answers, int(self.boards))
+        self.game = MultiBoardGame(words, self.word_list)
+        self.answer = ", ".join(word.upper() for word in words)
+
+    @property
+    def tiles(self):
+        """Rows of Tile widgets of the first board"""
+        return self.board_grid.grids[0].rows_of_tiles
+
+    def _relayout(self, dt=None):
+        """Size every board's tiles for the latest window size"""
+        if getattr(self, 'board_grid', None) is None:
+            return  # Called by WordleGameUI.__init__ before the boards exist
+        layout = compute_board_layout(*self._pending_size, int(self.word_length),
+                                      self.game.max_attempts, int(self.boards))
+        if layout == self.layout:
             return
+        self.layout = layout
+        self.resize_stats['relayouts'] += 1
 
-        # Update each tile with delay for flip effect
-        for i, status in enumerate(result):
-            tile = self.tiles[self.guess_index][i]
-            # Schedule the update with increasing delay
-            Clock.schedule_once(
-                lambda dt, tile=tile, status=status: self._animate_reveal_tile(tile, status),
-                i * 0.2  # Delay increases for each tile
-            )
-            # Also update the keyboard key status
-            Clock.schedule_once(
-                lambda dt, letter=tile.text, status=status: self.update_key_status(letter, status),
-                i * 0.2 + 0.1  # Slightly after tile animation
-            )
-    
-    def _animate_reveal_tile(self, tile, status):
-        """Animate a single tile flip and reveal"""
-        # First half of flip (become invisible)
-        anim1 = Animation(opacity=0, duration=0.15)
-        
-        # Second half of flip (show result and become visible)
-        anim2 = Animation(opacity=1, duration=0.15)
-        
-        # Function to update tile during the middle of the animation
-        def update_tile_status(anim, tile):
-            self._update_tile_status(tile, status)
-        
-        # Bind the update to occur after the first animation
-        anim1.bind(on_complete=update_tile_status)
-        
-        # Chain animations
-        anim = anim1 + anim2
-        anim.start(tile)
+        self.board_grid.size = layout['grid_size']
+        for grid in self.board_grid.grids:
+            grid.size = layout['board_size']
+        for tile in self.board_grid.iter_tiles():
+            tile.size = layout['tile_size']
+        self._layout_keyboard(layout)
+
+    def _input_tiles(self, position):
+        """The tile at this position of the current row on every unsolved board"""
+        grids = self.board_grid.grids
+        return [grids[board].rows_of_tiles[self.guess_index][position]
+                for board in (self.game.solved_at < 0).nonzero()[0]]
+
+    def on_enter(self, instance=None):
+        """Play the current guess on every unsolved board at once"""
+        if len(self.current_guess) == self.word_length and not self.game.is_over():
+            if not self.word_list.is_valid_word(self.current_guess):
+                self.show_invalid_word()
+                return
+
+            row = self.guess_index
+            scored = self.game.make_guess(self.current_guess)
+            self.guess_index += 1
+            self.current_guess = ""
+
+            # Boards are revealed at once; staggered flips on every board
+            # would keep the player waiting
+            grids = self.board_grid.grids
+            for board in scored:
+                for tile, (_, status) in zip(grids[board].rows_of_tiles[row], self.game.feedback(board, row)):
+                    tile.set_status(status)
+            self.key_status.update(self.game.keyboard)
+            self.check_game_status()
+
+    def check_game_status(self):
+        """Show the result; multi-board games do not count towards the statistics"""
+        if self.game.is_won():
+            self.show_game_over_popup("🎉 You Won!", f"The words were: {self.answer}")
+        elif self.game.is_over():
+            solved = self.game.boards_solved()
+            self.show_game_over_popup("Game Over", f"Solved {solved} of {self.game.boards}. "
+                                                   f"The words were: {self.answer}")
+
+    def reset_game(self, instance=None):
+        """Start a new game on fresh boards"""
+        self.reveal.cancel()
+        self.word_list = reload_word_list_if_changed(int(self.word_length))
+        self.new_game()
+        self.guess_index = 0
+        self.current_guess = ""
+        self.game_started = time.monotonic()
+
+        self.board_grid.word_length = int(self.word_length)
+        for tile in self.board_grid.iter_tiles():
+            tile.text = ""
+            self._update_tile_status(tile, "default")
+        self.key_status.reset()
 
 class WordleApp(App):
     def build(self):
         try:
             # Load the KV file for the layout
-            Builder.load_file("wordle.kv")
+            Builder.load_file(str(KV_FILE))
             
             # Set window title and background
             self.title = 'Wordle'
+            from kivy.core.window import Window
             Window.clearcolor = (1, 1, 1, 1)
             
             # Create and return the main UI
-            game_ui = WordleGameUI()
+            word_length = int(os.environ.get(WORD_LENGTH_ENV, WORD_LENGTH))
+            boards = int(os.environ.get(BOARDS_ENV, 1))
+            if boards > 1:
+                game_ui = MultiBoardGameUI(word_length=word_length, boards=boards)
+            else:
+                game_ui = WordleGameUI(word_length=word_length)
             
             # Force an initial layout calculation
             def init_layout(dt):
                 game_ui.do_layout()
             Clock.schedule_once(init_layout, 0)
+
+            if metrics.enabled():
+                self.frame_monitor = FrameMonitor()
+                self.frame_monitor.start()
             
             return game_ui
         except Exception as e:
             print(f"Error during app build: {e}")
             raise
 
-    def on_start(self):
-        # Populate the tile grid with 30 tile widgets only if it is empty
-        tile_grid = self.root.tile_grid
-        if not tile_grid.children:
-            for row in range(6):
-                for col in range(5):
-                    tile = Tile()
-                    tile_grid.add_widget(tile)
-
-from flask import Flask
-
-app = Flask(__name__)
-
-@app.route("/")
-def wordle():
-    # Serve the Wordle game page directly as a string
-    return """
-    <!DOCTYPE html>
-    <html lang=\"en\" class=\"pz-dont-touch\">
-    <head>
-        <meta http-equiv=\"Content-Type\" content=\"text/html; charset=UTF-8\">
-        <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\">
-        <meta name=\"theme-color\" content=\"#000000\">
-        <title>Wordle — The New York Times</title>
-        <meta property=\"description\" content=\"Guess the hidden word in 6 tries. A new puzzle is available each day.\">
-        <meta property=\"og:title\" content=\"Wordle - A daily word game\">
-        <meta property=\"og:description\" content=\"Guess the hidden word in 6 tries. A new puzzle is available each day.\">
-        <style>
-            body {
-                font-family: Arial, sans-serif;
-                margin: 0;
-                padding: 0;
-                background-color: #f7fafc;
-                color: #333;
-            }
-            h1 {
-                text-align: center;
-                margin-top: 20px;
-            }
-        </style>
-    </head>
-    <body>
-        <h1>Wordle — The New York Times</h1>
-        <p style=\"text-align: center;\">Guess the hidden word in 6 tries. A new puzzle is available each day.</p>
-    </body>
-    </html>
-    """
+    def on_stop(self):
+        # Write out any buffered or unsynced games
+        get_stats_store().close()
+
 
-if __name__ == "__main__":
-    app.run(debug=True)
\ No newline at end of file
+def __getattr__(name):
+    # The Flask app used to live here; build it on first access so importing
+    # the Kivy front-end never imports Flask
+    if name == "app":
+        from ..web import create_app
+        global app
+        app = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,112 @@
+from kivy.uix.gridlayout import GridLayout
+from kivy.graphics import Color, InstructionGroup, Rectangle
+from kivy.properties import NumericProperty, ListProperty
+from kivy.metrics import dp
+import numpy as np
+
+from .grid import TileGrid
+from .tile import ABSENT_COLOR, CORRECT_COLOR, PRESENT_COLOR
+
+# Key segment color for each multi_board keyboard status (-1 is unused)
+SEGMENT_COLORS = {
+    -1: (0, 0, 0, 0),
+    0: ABSENT_COLOR,
+    1: PRESENT_COLOR,
+    2: CORRECT_COLOR,
+}
+
+
+def board_columns(boards):
+    """Boards per row: 2 for up to 4 boards, 4 for up to 16, then 8."""
+    return 2 if boards <= 4 else 4 if boards <= 16 else 8
+
+
+class BoardGrid(GridLayout):
+    """One TileGrid per board of a multi-board game."""
+    boards = NumericProperty(4)
+    word_length = NumericProperty(5)
+    num_attempts = NumericProperty(9)
+    grids = ListProperty([])
+
+    def __init__(self, **kwargs):
+        self._built = False
+        kwargs.setdefault('spacing', dp(5))
+        kwargs.setdefault('size_hint', (None, None))
+        super().__init__(**kwargs)
+        self.build_boards()
+        self.bind(boards=self._rebuild, word_length=self._rebuild, num_attempts=self._rebuild)
+
+    def _rebuild(self, *args):
+        if self._built:
+            self.build_boards()
+
+    def build_boards(self):
+        """Create exactly one TileGrid per board, replacing any existing ones."""
+        self.clear_widgets()
+        boards = int(self.boards)
+        self.cols = board_columns(boards)
+        self.rows = -(-boards // self.cols)
+        grids = [TileGrid(word_length=self.word_length, num_attempts=self.num_attempts) for _ in range(boards)]
+        for grid in grids:
+            self.add_widget(grid)
+        self.grids = grids
+        self._built = True
+
+    def iter_tiles(self):
+        for grid in self.grids:
+            yield from grid.iter_tiles()
+
+
+class KeyboardStatus:
+    """
+    Paints each letter key with one small segment per board, laid out like
+    the boards themselves, colored with that board's status for the letter.
+
+    update() diffs the game's (boards, 26) keyboard array against what is
+    painted and recolors only the segments that changed, in one pass over
+    all boards.
+    """
+
+    def __init__(self, keys, boards):
+        self.keys = keys  # Letter -> key widget
+        self.boards = boards
+        self.cols = board_columns(boards)
+        self.painted = np.full((boards, 26), -1, dtype=np.int8)
+        self._colors = np.empty((boards, 26), dtype=object)
+        self._rects = {}
+        for letter, key in keys.items():
+            column = ord(letter.lower()) - 97
+            group = InstructionGroup()
+            rects = []
+            for board in range(boards):
+                color = Color(*SEGMENT_COLORS[-1])
+                rect = Rectangle()
+                group.add(color)
+                group.add(rect)
+                self._colors[board, column] = color
+                rects.append(rect)
+            self._rects[key] = rects
+            key.canvas.after.add(group)
+            key.bind(pos=self._place, size=self._place)
+            self._place(key)
+
+    def _place(self, key, *args):
+        """Lay the key's segments out in a strip along its bottom edge."""
+        rows = -(-self.boards // self.cols)
+        width = key.width / self.cols
+        height = min(key.height * 0.3, dp(4) * rows) / rows
+        for board, rect in enumerate(self._rects[key]):
+            row, col = divmod(board, self.cols)
+            rect.pos = (key.x + col * width, key.y + (rows - 1 - row) * height)
+            rect.size = (width, height)
+
+    def update(self, keyboard):
+        """Recolor the segments whose status changed since the last update."""
+        changed = np.argwhere(keyboard != self.painted)
+        for board, column in changed:
+            self._colors[board, column].rgba = SEGMENT_COLORS[int(keyboard[board, column])]
+        self.painted[changed[:, 0], changed[:, 1]] = keyboard[changed[:, 0], changed[:, 1]]
+        return len(changed)
+
+    def reset(self):
+        self.update(np.full_like(self.painted, -1))
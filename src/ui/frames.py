@@ -0,0 +1,40 @@
+from kivy.clock import Clock
+
+from .. import metrics
+
+# Frame time buckets in seconds: 120, 60, 30 and 15 fps, then visible stalls
+FRAME_BUCKETS = (1 / 120, 1 / 60, 1 / 30, 1 / 15, 0.25, 1.0)
+# A frame taking longer than this missed at least one 60 Hz vsync
+DROPPED_FRAME_SECONDS = 1.5 / 60
+
+
+def record_frame(histogram, dt):
+    """Observe one frame's duration and count it as dropped if it ran long."""
+    histogram.observe(dt)
+    if dt > DROPPED_FRAME_SECONDS:
+        metrics.counter("ui_dropped_frames_total", "Frames that took longer than 1.5 vsyncs at 60 Hz").inc()
+
+
+class FrameMonitor:
+    """
+    Records the time between consecutive frames in ui_frame_seconds while
+    started. Only used with metrics on; the callback runs every frame.
+    """
+
+    def __init__(self):
+        self.histogram = metrics.histogram("ui_frame_seconds", "Time between frames", buckets=FRAME_BUCKETS)
+        self._event = None
+
+    def start(self):
+        if self._event is None:
+            self._event = Clock.schedule_interval(self._tick, 0)
+
+    def stop(self):
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+
+    def _tick(self, dt):
+        # The first frame after scheduling reports dt 0
+        if dt > 0:
+            record_frame(self.histogram, dt)
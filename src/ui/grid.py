@@ -0,0 +1,59 @@
+from kivy.uix.gridlayout import GridLayout
+from kivy.clock import Clock
+from kivy.properties import NumericProperty
+from kivy.metrics import dp
+
+from .tile import Tile
+
+class TileGrid(GridLayout):
+    """
+    Grid of Tile widgets, one row per attempt and one column per letter.
+
+    Building is deferred to the next frame, so a grid declared in KV (whose
+    word_length and num_attempts are set after construction) is built once
+    with its final size. Reading rows_of_tiles builds a pending grid at once.
+    """
+    word_length = NumericProperty(5)
+    num_attempts = NumericProperty(6)
+
+    def __init__(self, **kwargs):
+        self._tile_rows = []
+        self._build_trigger = Clock.create_trigger(self.build_tiles, -1)
+        kwargs.setdefault('spacing', dp(5))
+        kwargs.setdefault('size_hint', (None, None))
+        super().__init__(**kwargs)
+        self._build_trigger()
+
+    def on_word_length(self, instance, value):
+        self._build_trigger()
+
+    def on_num_attempts(self, instance, value):
+        self._build_trigger()
+
+    @property
+    def rows_of_tiles(self):
+        self.ensure_built()
+        return self._tile_rows
+
+    def ensure_built(self):
+        """Build the tiles now if a (re)build is pending."""
+        if self._build_trigger.is_triggered:
+            self.build_tiles()
+
+    def build_tiles(self, *args):
+        """Create exactly word_length x num_attempts tiles, replacing any existing ones."""
+        self._build_trigger.cancel()
+        self.clear_widgets()
+        self.cols = int(self.word_length)
+        self.rows = int(self.num_attempts)
+        rows_of_tiles = []
+        for _ in range(self.rows):
+            row = [Tile() for _ in range(self.cols)]
+            for tile in row:
+                self.add_widget(tile)
+            rows_of_tiles.append(row)
+        self._tile_rows = rows_of_tiles
+
+    def iter_tiles(self):
+        for row in self.rows_of_tiles:
+            yield from row
@@ -0,0 +1,129 @@
+import os
+
+from kivy.clock import Clock
+from kivy.event import EventDispatcher
+from kivy.properties import BooleanProperty, NumericProperty
+
+from .. import metrics
+from .frames import FRAME_BUCKETS, record_frame
+
+# Timing of a row reveal, in seconds
+REVEAL_STAGGER = 0.2  # Delay between one tile starting to flip and the next
+FLIP_DURATION = 0.3   # Fade out, swap in the status color, fade back in
+
+# Set to a non-empty value other than "0" to skip reveal animations
+REDUCED_MOTION_ENV = "WORDLE_REDUCED_MOTION"
+
+
+def reduced_motion_requested() -> bool:
+    return os.environ.get(REDUCED_MOTION_ENV, "") not in ("", "0")
+
+
+class RevealScheduler(EventDispatcher):
+    """
+    Drives the flip of a whole row from a single per-frame clock callback.
+
+    reveal() precomputes each tile's timeline (start, midpoint, end); every
+    frame step() fades the tiles, applies each status at its tile's midpoint
+    and dispatches on_tile_revealed in the same pass, so listeners such as
+    the keyboard update on the same frame as the tile. on_complete fires
+    once the last tile has finished flipping.
+
+    In instant mode (reduced motion, automated UI tests) reveal() applies
+    every status and dispatches both events immediately.
+    """
+    __events__ = ('on_tile_revealed', 'on_complete')
+
+    instant = BooleanProperty(False)
+    stagger = NumericProperty(REVEAL_STAGGER)
+    flip_duration = NumericProperty(FLIP_DURATION)
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('instant', reduced_motion_requested())
+        super().__init__(**kwargs)
+        self._timeline = []
+        self._elapsed = 0.0
+        self._event = None
+
+    @property
+    def active(self) -> bool:
+        return bool(self._timeline)
+
+    def reveal(self, tiles, statuses):
+        """
+        Flip tiles one after another, revealing the matching statuses.
+        A reveal still in progress is finished first; an empty row
+        completes at once.
+        Raises:
+            ValueError: If tiles and statuses differ in length.
+        """
+        tiles, statuses = list(tiles), list(statuses)
+        if len(tiles) != len(statuses):
+            raise ValueError(f"{len(statuses)} statuses for a row of {len(tiles)} tiles")
+        self.finish()
+        half = self.flip_duration / 2
+        # One entry per tile: [tile, status, start, midpoint, end, revealed]
+        self._timeline = [
+            [tile, status, i * self.stagger, i * self.stagger + half, i * self.stagger + self.flip_duration, False]
+            for i, (tile, status) in enumerate(zip(tiles, statuses))
+        ]
+        self._elapsed = 0.0
+        if not self._timeline:
+            self.dispatch('on_complete')
+            return
+        if self.instant:
+            self.finish()
+            return
+        if self._event is None:
+            self._event = Clock.schedule_interval(self.step, 0)
+        else:
+            self._event()
+
+    def step(self, dt):
+        """Advance every tile's flip by dt seconds; returns False when done."""
+        if metrics.enabled() and dt > 0:
+            record_frame(metrics.histogram("ui_reveal_frame_seconds", "Frame times during a row reveal",
+                                           buckets=FRAME_BUCKETS), dt)
+        self._elapsed += dt
+        elapsed = self._elapsed
+        for entry in self._timeline:
+            tile, status, start, middle, end, revealed = entry
+            if elapsed < start:
+                continue
+            if elapsed < middle:
+                tile.opacity = 1 - (elapsed - start) / (middle - start)
+                continue
+            if not revealed:
+                entry[5] = True
+                tile.set_status(status)
+                self.dispatch('on_tile_revealed', tile, status)
+            tile.opacity = 1 if elapsed >= end else (elapsed - middle) / (end - middle)
+
+        if elapsed >= self._timeline[-1][4]:
+            self._stop()
+            self.dispatch('on_complete')
+            return False
+        return True
+
+    def finish(self):
+        """Jump to the end of the current reveal, if any."""
+        if self._timeline:
+            self._elapsed = self._timeline[-1][4]
+            self.step(0)
+
+    def cancel(self):
+        """Abandon the current reveal without revealing the remaining tiles."""
+        for tile, *_ in self._timeline:
+            tile.opacity = 1
+        self._stop()
+
+    def _stop(self):
+        self._timeline = []
+        if self._event is not None:
+            self._event.cancel()
+
+    def on_tile_revealed(self, tile, status):
+        pass
+
+    def on_complete(self):
+        pass
@@ -13,6 +13,13 @@ DEFAULT_COLOR = (0.071, 0.071, 0.075, 1)  # #121213 (dark gray/black)
 WHITE_COLOR = (1, 1, 1, 1)                # #ffffff (white)
 BORDER_COLOR = (0.3, 0.3, 0.3, 1)         # #4c4c4c (darker gray for border)
 
+STATUS_COLORS = {
+    "correct": CORRECT_COLOR,
+    "present": PRESENT_COLOR,
+    "absent": ABSENT_COLOR,
+    "default": DEFAULT_COLOR,
+}
+
 class Tile(Label):
     letter = StringProperty('')
     bg_color = ListProperty(DEFAULT_COLOR)
@@ -31,53 +38,51 @@ class Tile(Label):
         self.color = (1, 1, 1, 1)  # White text color
         self.status = "default"
 
+        # The tile owns one set of canvas instructions for its whole life;
+        # status and geometry changes mutate them in place
         with self.canvas.before:
-            Color(0.12, 0.12, 0.12, 1)  # Dark background color
-            Rectangle(pos=self.pos, size=self.size)
-            Color(0.3, 0.3, 0.3, 1)  # Border color
-            Line(rectangle=(self.x, self.y, self.width, self.height), width=2)
-        
+            # Subtle drop shadow
+            self._shadow_color = Color(0, 0, 0, 0.2)
+            self._shadow = Rectangle()
+            # Perfectly square background
+            self._bg_color = Color(*DEFAULT_COLOR)
+            self._bg = Rectangle()
+            # Border, only visible on empty tiles
+            self._border_color = Color(*self.border_color)
+            self._border = Line(width=self.border_width)
+        self._update_canvas()
+
         # Enable text size to ensure centering works
         self.bind(size=self._update_text_size)
-        
-        # Set tile properties
-        self.status = "default"
         self.bind(size=self._update_canvas, pos=self._update_canvas)
+        self.bind(border_color=self._update_border, border_width=self._update_border)
     
     def _update_text_size(self, instance, value):
         """Ensure text is properly centered in the tile"""
         self.text_size = value
         
     def _update_canvas(self, *args):
-        """Update tile canvas drawing with proper colors and shape"""
-        self.canvas.before.clear()
-        with self.canvas.before:
-            # Draw shadow effect (subtle drop shadow)
-            Color(0, 0, 0, 0.2)
-            Rectangle(pos=(self.x + 2, self.y - 2), size=self.size)
-            
-            # Set background color based on status
-            if self.status == "correct":
-                Color(*CORRECT_COLOR)
-            elif self.status == "present":
-                Color(*PRESENT_COLOR)
-            elif self.status == "absent":
-                Color(*ABSENT_COLOR)
-            else:
-                Color(*DEFAULT_COLOR)
-            
-            # Draw perfectly square background
-            Rectangle(pos=self.pos, size=self.size)
-            
-            # Add border for empty tiles
-            if self.status == "default":
-                Color(*self.border_color)
-                Line(rectangle=(self.x, self.y, self.width, self.height), width=self.border_width)
+        """Move and resize the tile's canvas instructions"""
+        x, y = self.pos
+        self._shadow.pos = (x + 2, y - 2)
+        self._shadow.size = self.size
+        self._bg.pos = self.pos
+        self._bg.size = self.size
+        self._border.rectangle = (x, y, self.width, self.height)
+
+    def _update_border(self, *args):
+        """Apply border color/width, hiding the border on revealed tiles"""
+        self._border_color.rgba = self.border_color if self.status == "default" else (0, 0, 0, 0)
+        self._border.width = self.border_width
 
     def set_status(self, status):
         """Set the status of the tile and update its background."""
+        if status == self.status:
+            return
         self.status = status
-        self._update_canvas()
+        self.bg_color = STATUS_COLORS.get(status, DEFAULT_COLOR)
+        self._bg_color.rgba = self.bg_color
+        self._update_border()
         
     def animate_flip(self):
         """Animate the tile flipping when revealing feedback."""
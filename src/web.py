@@ -0,0 +1,166 @@
+"""
+JSON game API for the Flask app.
+
+    POST /api/games                  start a game, optionally with {"user": "name"}
+                                     {"seed": 42} or {"date": "2024-01-31"},
+                                     {"hard_mode": true}, and {"word_length": 6}
+    GET  /api/games/<id>             fetch its state
+    POST /api/games/<id>/guess       submit {"guess": "crane"}
+    GET  /api/users/<user>/stats     a player's aggregate statistics
+    GET  /metrics                    request and game metrics in Prometheus
+                                     text format (with WORDLE_METRICS=1)
+
+create_app() builds the full Flask app (the landing page plus the API);
+run it with: python -m src.web (set WORDLE_DEBUG=1 for Flask's debugger
+and reloader; never on a reachable host)
+
+Register the API on another app with init_api(app); the GameService (and through it
+the session store and statistics backend) can be injected for tests or
+other deployments.
+"""
+import os
+import time
+
+from flask import Blueprint, Flask, current_app, g, jsonify, request
+
+from . import metrics
+from .service import GameError, GameService
+from .stats_store import get_stats_store
+from .word_list import WORD_LENGTH
+
+DEBUG_ENV = "WORDLE_DEBUG"
+
+api = Blueprint("api", __name__, url_prefix="/api")
+
+
+def init_api(app, service: GameService | None = None):
+    """
+    Register the API on app. By default web games are only recorded when
+    the shared statistics backend is per-user (SQLite, see
+    WORDLE_STATS_DB); the desktop player's own log is never written to.
+    """
+    if service is None:
+        stats = get_stats_store()
+        service = GameService(stats=stats if stats.per_user else None)
+    app.extensions["wordle_service"] = service
+    app.register_blueprint(api)
+    if metrics.enabled():
+        app.before_request(_start_timer)
+        app.after_request(_record_request)
+    return app
+
+
+def _start_timer():
+    g.request_started = time.perf_counter()
+
+
+def _record_request(response):
+    started = g.pop("request_started", None)
+    if started is not None:
+        labels = {"endpoint": request.endpoint or "unknown", "status": str(response.status_code)}
+        metrics.histogram("web_request_seconds", "Time to handle a request", labels).observe(
+            time.perf_counter() - started)
+    return response
+
+
+def create_app(service: GameService | None = None):
+    """The Flask app: the landing page plus the JSON API."""
+    app = Flask(__name__)
+    init_api(app, service)
+    app.add_url_rule("/", "wordle", wordle)
+    app.add_url_rule("/metrics", "metrics", prometheus_metrics)
+    return app
+
+
+def prometheus_metrics():
+    if not metrics.enabled():
+        return jsonify({"error": "Metrics are disabled"}), 404
+    return metrics.prometheus_text(), 200, {"Content-Type": "text/plain; version=0.0.4"}
+
+
+def _service() -> GameService:
+    return current_app.extensions["wordle_service"]
+
+
+def _json_body() -> dict:
+    """
+    The request's JSON object, or {} for an empty body.
+    Raises:
+        GameError: If the body is not a JSON object.
+    """
+    if not request.get_data():
+        return {}
+    body = request.get_json(silent=True)
+    if not isinstance(body, dict):
+        raise GameError("Request body must be a JSON object")
+    return body
+
+
+@api.errorhandler(GameError)
+def _game_error(error):
+    return jsonify({"error": str(error)}), error.status
+
+
+@api.post("/games")
+def start_game():
+    body = _json_body()
+    game = _service().start_game(body.get("user"), seed=body.get("seed"), day=body.get("date"),
+                                 hard_mode=body.get("hard_mode", False),
+                                 word_length=body.get("word_length", WORD_LENGTH))
+    return jsonify(game), 201
+
+
+@api.get("/games/<game_id>")
+def get_game(game_id):
+    return jsonify(_service().get_state(game_id))
+
+
+@api.post("/games/<game_id>/guess")
+def submit_guess(game_id):
+    body = _json_body()
+    return jsonify(_service().submit_guess(game_id, body.get("guess")))
+
+
+@api.get("/users/<user>/stats")
+def get_stats(user):
+    return jsonify(_service().get_stats(user))
+
+
+def wordle():
+    # Serve the Wordle game page directly as a string
+    return """
+    <!DOCTYPE html>
+    <html lang=\"en\" class=\"pz-dont-touch\">
+    <head>
+        <meta http-equiv=\"Content-Type\" content=\"text/html; charset=UTF-8\">
+        <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\">
+        <meta name=\"theme-color\" content=\"#000000\">
+        <title>Wordle — The New York Times</title>
+        <meta property=\"description\" content=\"Guess the hidden word in 6 tries. A new puzzle is available each day.\">
+        <meta property=\"og:title\" content=\"Wordle - A daily word game\">
+        <meta property=\"og:description\" content=\"Guess the hidden word in 6 tries. A new puzzle is available each day.\">
+        <style>
+            body {
+                font-family: Arial, sans-serif;
+                margin: 0;
+                padding: 0;
+                background-color: #f7fafc;
+                color: #333;
+            }
+            h1 {
+                text-align: center;
+                margin-top: 20px;
+            }
+        </style>
+    </head>
+    <body>
+        <h1>Wordle — The New York Times</h1>
+        <p style=\"text-align: center;\">Guess the hidden word in 6 tries. A new puzzle is available each day.</p>
+    </body>
+    </html>
+    """
+
+
+if __name__ == "__main__":
+    with metrics.profile_session():
+        create_app().run(debug=os.environ.get(DEBUG_ENV, "") not in ("", "0"))
@@ -1,40 +1,224 @@
 from pathlib import Path
 import random
+import threading
+
+from . import metrics
+from .packed_words import COMPILED_FILE, PackedWords, load_compiled, pack_words, read_word_file
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+ANSWERS_FILE = "wordle-answers-alphabetical.txt"
+ALLOWED_GUESSES_FILE = "wordle-allowed-guesses.txt"
+WORD_LENGTH = 5
+SUPPORTED_LENGTHS = range(4, 9)
+
+
+def partition_dir(word_length: int, data_dir: Path | None = None) -> Path:
+    """
+    Where the word lists for one word length live: the 5-letter lists sit
+    directly in data/, other lengths in data/words-<length>/ under the same
+    file names.
+    """
+    data_dir = DATA_DIR if data_dir is None else data_dir
+    if word_length == WORD_LENGTH:
+        return Path(data_dir)
+    return Path(data_dir) / f"words-{word_length}"
+
 
 class WordList:
-    def __init__(self):
+    def __init__(self, data_dir: Path = DATA_DIR, word_length: int = WORD_LENGTH):
         """
         Initialize the WordList class.
+
+        A WordList holds the words of one length and is immutable once
+        loaded, so a single instance per length can be shared by every game
+        in the process (see get_word_list()).
         """
-        self.answers = []
-        self.allowed_guesses = []
+        self.data_dir = Path(data_dir)
+        self.word_length = word_length
+        self.answers = PackedWords(b"", word_length)
+        self.allowed_guesses = PackedWords(b"", word_length)
+        self.source = None
+        self._mtimes = {}
+        self._pattern_table = None
         self.load_words()
 
+    def _source_paths(self) -> list[Path]:
+        return [self.data_dir / ANSWERS_FILE, self.data_dir / ALLOWED_GUESSES_FILE]
+
+    def _compiled_path(self) -> Path | None:
+        """
+        Return the compiled word-list file if it exists and is up to date.
+        """
+        compiled = self.data_dir / COMPILED_FILE
+        try:
+            compiled_mtime = compiled.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        for path in self._source_paths():
+            if path.exists() and path.stat().st_mtime_ns > compiled_mtime:
+                return None
+        return compiled
+
+    @metrics.timed("word_list_load_seconds", "Time to load a word list")
     def load_words(self):
-        # Change from 'data_dir = Path(__file__).parent / "data"' to:
-        data_dir = Path(__file__).parent.parent / "data"
+        """
+        Load the answers and allowed guesses, preferring the memory-mapped
+        compiled file (see packed_words.py) over parsing the text lists.
+        """
+        compiled = self._compiled_path()
+        if compiled is not None:
+            try:
+                answers, allowed_guesses = load_compiled(compiled)
+                if answers.word_length != self.word_length:
+                    raise ValueError(f"{compiled} holds {answers.word_length}-letter words")
+                self.answers, self.allowed_guesses = answers, allowed_guesses
+                self.source = "compiled"
+                self._mtimes = {path: path.stat().st_mtime_ns for path in [compiled, *self._source_paths()]}
+                return
+            except (OSError, ValueError) as e:
+                print(f"Ignoring compiled word list: {e}")
+
+        # Fall back to the text lists, packed into the same sorted format
+        answers = read_word_file(self.data_dir / ANSWERS_FILE)
+        allowed_guesses = read_word_file(self.data_dir / ALLOWED_GUESSES_FILE)
+        self.answers = PackedWords(pack_words(answers, self.word_length), self.word_length)
+        self.allowed_guesses = PackedWords(pack_words(allowed_guesses, self.word_length), self.word_length)
+        self.source = "text"
+
+        # Remember the file versions we loaded so changes can be detected later
+        self._mtimes = {path: path.stat().st_mtime_ns for path in self._source_paths()}
+
+    def is_stale(self) -> bool:
+        """
+        Check whether the word files on disk changed since they were loaded.
+        """
+        if self.source == "text" and self._compiled_path() is not None:
+            return True
+        for path, mtime in self._mtimes.items():
+            try:
+                if path.stat().st_mtime_ns != mtime:
+                    return True
+            except FileNotFoundError:
+                return True
+        return False
+
+    def guess_words(self) -> list[str]:
+        """
+        Every valid guess, numbered the way word_id() numbers them.
+        """
+        return list(self.answers) + list(self.allowed_guesses)
 
-        # Load answer words
-        with open(data_dir / "wordle-answers-alphabetical.txt", "r") as f:
-            self.answers = [word.strip().lower() for word in f.readlines()]
+    def word_id(self, word: str) -> int:
+        """
+        Return a stable integer ID for a valid word: answers come first in
+        alphabetical order, followed by the allowed guesses.
+        Raises:
+            ValueError: If the word is not in either list.
+        """
+        word = word.lower()
+        position = self.answers.find(word)
+        if position >= 0:
+            return position
+        position = self.allowed_guesses.find(word)
+        if position >= 0:
+            return len(self.answers) + position
+        raise ValueError(f"{word!r} is not a valid word")
 
-        # Load allowed guesses
-        with open(data_dir / "wordle-allowed-guesses.txt", "r") as f:
-            self.allowed_guesses = [word.strip().lower() for word in f.readlines()]
+    def get_pattern_table(self):
+        """
+        Return the precomputed guess x answer pattern table (see
+        pattern_table.py), loading or building it on first use.
+        """
+        if self._pattern_table is None:
+            from .pattern_table import load_pattern_table
+            self._pattern_table = load_pattern_table(self)
+        return self._pattern_table
 
-        # Combine both lists for valid guesses
-        self.valid_words = set(self.answers + self.allowed_guesses)
+    def pattern(self, guess: str, answer: str) -> int:
+        """
+        Look up the base-3 feedback pattern of a guess against an answer.
+        The table read is constant time, but finding the two words' rows
+        is a binary search of the packed lists each, so a lookup is
+        O(log n) in the number of words.
+        Raises:
+            ValueError: If guess is not a valid word or answer not an answer.
+        """
+        return int(self.get_pattern_table()[self.word_id(guess), self.answers.index(answer.lower())])
 
-    def get_random_word(self) -> str:
+    def get_random_word(self, seed=None) -> str:
         """
         Get a random word from the list of answers.
+        The same seed (an int or str) always picks the same word, in any
+        process, which makes games reproducible for replays and tests.
         """
-        return random.choice(self.answers)
-    
+        if seed is None:
+            return random.choice(self.answers)
+        return random.Random(seed).choice(self.answers)
+
+    @metrics.timed("word_list_is_valid_word_seconds", "Time to check a word against the lists")
     def is_valid_word(self, word: str) -> bool:
         """
         Check if a word is valid (either an answer or an allowed guess).
         """
-        return word.lower() in self.valid_words
+        word = word.lower()
+        return word in self.answers or word in self.allowed_guesses
+
+
+# Process-wide word lists shared by every WordleGame and the UI, one per
+# word length, each loaded the first time a game of that length needs it
+_shared_word_lists = {}
+_shared_lock = threading.Lock()
+
+
+def get_word_list(word_length: int = WORD_LENGTH) -> WordList:
+    """
+    Return the shared WordList for a word length, loading it on first use.
+    Raises:
+        ValueError: If there is no word list for that length.
+    """
+    word_list = _shared_word_lists.get(word_length)
+    if word_list is None:
+        with _shared_lock:
+            word_list = _shared_word_lists.get(word_length)
+            if word_list is None:
+                word_list = _load_partition(word_length)
+                _shared_word_lists[word_length] = word_list
+    return word_list
+
+
+def _load_partition(word_length: int) -> WordList:
+    data_dir = partition_dir(word_length)
+    if word_length not in SUPPORTED_LENGTHS or not (data_dir / ANSWERS_FILE).exists():
+        raise ValueError(f"No word list for {word_length}-letter words")
+    return WordList(data_dir, word_length)
+
+
+def available_lengths() -> list[int]:
+    """Word lengths whose word lists are present in data/."""
+    return [n for n in SUPPORTED_LENGTHS if (partition_dir(n) / ANSWERS_FILE).exists()]
+
+
+def set_word_list(word_list: WordList | None) -> None:
+    """
+    Replace the shared WordList for its word length (e.g. with a fixture in
+    tests). Passing None makes every length load from disk again.
+    """
+    with _shared_lock:
+        if word_list is None:
+            _shared_word_lists.clear()
+        else:
+            _shared_word_lists[word_list.word_length] = word_list
+
 
-        
\ No newline at end of file
+def reload_word_list_if_changed(word_length: int = WORD_LENGTH) -> WordList:
+    """
+    Reload the shared WordList if its source files changed on disk.
+    Games already in progress keep the instance they started with.
+    """
+    word_list = get_word_list(word_length)
+    if word_list.is_stale():
+        with _shared_lock:
+            if _shared_word_lists.get(word_length) is word_list:
+                _shared_word_lists[word_length] = WordList(word_list.data_dir, word_length)
+            word_list = _shared_word_lists[word_length]
+    return word_list
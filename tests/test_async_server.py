@@ -0,0 +1,155 @@
+import asyncio
+import json
+
+from src.async_server import AsyncGameServer
+from src.service import GameService
+
+
+async def request(reader, writer, method, path, body=None):
+    payload = json.dumps(body).encode() if body is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: test\r\nContent-Length: {len(payload)}\r\n\r\n".encode() + payload)
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    length = int(head.lower().split(b"content-length: ")[1].split(b"\r\n")[0])
+    return status, json.loads(await reader.readexactly(length))
+
+
+def test_play_and_flush_results_on_shutdown(tmp_path):
+    results_path = tmp_path / "results.jsonl"
+
+    async def scenario():
+        service = GameService()
+        server = AsyncGameServer(service, results_path)
+        host, port = await server.start("127.0.0.1", 0)
+        reader, writer = await asyncio.open_connection(host, port)
+
+        status, state = await request(reader, writer, "POST", "/api/games")
+        assert status == 201
+        answer = service.store.get(state["id"]).word
+
+        status, _ = await request(reader, writer, "POST", f"/api/games/{state['id']}/guess", {"guess": "zzzzz"})
+        assert status == 400
+        status, state = await request(reader, writer, "POST", f"/api/games/{state['id']}/guess", {"guess": answer})
+        assert status == 200 and state["won"]
+        status, _ = await request(reader, writer, "GET", "/api/games/unknown")
+        assert status == 404
+
+        writer.close()
+        await server.shutdown()
+        assert server.results.pending == 0
+        return answer
+
+    answer = asyncio.run(scenario())
+    records = [json.loads(line) for line in results_path.read_text().splitlines()]
+    assert [(r["answer"], r["guesses"], r["won"]) for r in records] == [(answer, [answer], True)]
+
+
+async def read_response(reader):
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    length = int(head.lower().split(b"content-length: ")[1].split(b"\r\n")[0])
+    await reader.readexactly(length)
+    return status, head
+
+
+def test_malformed_and_oversized_requests_close_the_connection(tmp_path):
+    async def scenario():
+        server = AsyncGameServer(GameService(), tmp_path / "results.jsonl")
+        host, port = await server.start("127.0.0.1", 0)
+        smuggled = b"GET /api/games/x HTTP/1.1\r\nHost: test\r\n\r\n" * 3
+        cases = [
+            (b"GARBAGE\r\n\r\n", 400),
+            (b"POST /api/games HTTP/1.1\r\nContent-Length: ten\r\n\r\n", 400),
+            (b"POST /api/games HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n0\r\n\r\n", 501),
+            (b"POST /api/games HTTP/1.1\r\nContent-Length: 70000\r\n\r\n" + smuggled, 413),
+        ]
+        for raw, expected in cases:
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(raw)
+            await writer.drain()
+            status, head = await read_response(reader)
+            assert status == expected
+            assert b"Connection: close" in head
+            # Nothing after the bad request is answered
+            assert await reader.read() == b""
+            writer.close()
+        await server.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_unexpected_errors_become_500(tmp_path):
+    class BrokenService(GameService):
+        def get_state(self, game_id):
+            raise RuntimeError("boom")
+
+    async def scenario():
+        server = AsyncGameServer(BrokenService(), tmp_path / "results.jsonl")
+        host, port = await server.start("127.0.0.1", 0)
+        reader, writer = await asyncio.open_connection(host, port)
+        status, body = await request(reader, writer, "GET", "/api/games/abc")
+        assert status == 500 and body == {"error": "Internal server error"}
+        # The connection is still usable
+        status, _ = await request(reader, writer, "POST", "/api/games")
+        assert status == 201
+        writer.close()
+        await server.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_shutdown_closes_idle_keep_alive_connections(tmp_path):
+    async def scenario():
+        server = AsyncGameServer(GameService(), tmp_path / "results.jsonl")
+        host, port = await server.start("127.0.0.1", 0)
+        reader, writer = await asyncio.open_connection(host, port)
+        status, _ = await request(reader, writer, "POST", "/api/games")
+        assert status == 201
+        await asyncio.wait_for(server.shutdown(), 2)
+        assert await reader.read() == b""
+        assert not server._connections
+        writer.close()
+
+    asyncio.run(scenario())
+
+
+def test_routes_match_the_flask_app(tmp_path):
+    server = AsyncGameServer(GameService(), tmp_path / "results.jsonl")
+    for body in (b"not json", b"[1,2]", b'"crane"'):
+        assert server.dispatch("POST", "/api/games", body) == (400, {"error": "Request body must be a JSON object"})
+    status, state = server.dispatch("POST", "/api/games", b"")
+    assert status == 201
+    game_id = state["id"]
+    assert server.dispatch("POST", f"/api/games/{game_id}/guess", b"[]")[0] == 400
+
+    assert server.dispatch("GET", f"/api/games/{game_id}/unknown", b"")[0] == 404
+    assert server.dispatch("GET", f"/api/games/{game_id}/guess/extra", b"")[0] == 404
+    assert server.dispatch("GET", f"/api/games/{game_id}/guess", b"")[0] == 405
+    assert server.dispatch("DELETE", "/api/games", b"")[0] == 405
+    # Statistics need a per-user backend, exactly as in web.py
+    assert server.dispatch("GET", "/api/users/ada/stats", b"")[0] == 404
+    assert server.dispatch("POST", "/api/users/ada/stats", b"")[0] == 405
+    assert server.dispatch("GET", "/", b"")[0] == 404
+
+
+def test_user_stats_and_metrics_routes(tmp_path):
+    from src import metrics
+    from src.sqlite_store import SQLiteStatsStore
+
+    store = SQLiteStatsStore(tmp_path / "stats.db")
+    server = AsyncGameServer(GameService(stats=store), tmp_path / "results.jsonl")
+    status, stats = server.dispatch("GET", "/api/users/ada%20l/stats", b"")
+    assert status == 200 and (stats["user"], stats["games_played"]) == ("ada l", 0)
+    store.close()
+
+    saved = metrics._registry
+    try:
+        metrics.disable()
+        assert server.dispatch("GET", "/metrics", b"")[0] == 404
+        metrics.enable()
+        metrics.counter("games_total").inc()
+        status, text = server.dispatch("GET", "/metrics", b"")
+        assert status == 200 and "games_total 1" in text
+    finally:
+        metrics._registry = saved
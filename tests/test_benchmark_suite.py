@@ -0,0 +1,31 @@
+import json
+
+from benchmarks import suite
+
+
+def results(**medians):
+    return {"version": suite.RESULTS_VERSION,
+            "benchmarks": {name: {"median": median} for name, median in medians.items()}}
+
+
+def test_compare_flags_slowdowns_over_the_threshold():
+    rows = {row["name"]: row for row in suite.compare(results(a=1.0, b=1.0, c=1.0, gone=1.0),
+                                                      results(a=1.05, b=1.2, c=0.5, new=1.0), threshold=0.1)}
+    assert set(rows) == {"a", "b", "c"}
+    assert not rows["a"]["regression"]
+    assert rows["b"]["regression"] and abs(rows["b"]["ratio"] - 1.2) < 1e-9
+    assert not rows["c"]["regression"]
+
+
+def test_run_and_compare_commands(tmp_path, capsys):
+    base, slower = tmp_path / "base.json", tmp_path / "slower.json"
+    assert suite.main(["run", "-o", str(base), "--only", "make_guess_batch", "--repeat", "2"]) == 0
+    stored = json.loads(base.read_text())
+    result = stored["benchmarks"]["make_guess_batch"]
+    assert len(result["samples"]) == 2 and result["min"] <= result["median"]
+
+    stored["benchmarks"]["make_guess_batch"]["median"] *= 2
+    slower.write_text(json.dumps(stored))
+    assert suite.main(["compare", str(base), str(base)]) == 0
+    assert suite.main(["compare", str(base), str(slower)]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
@@ -0,0 +1,32 @@
+import random
+
+from src.constraint_index import ConstraintIndex, get_constraint_index
+from src.feedback import pattern_code, score_guess
+from src.word_list import get_word_list
+
+
+def naive_filter(words, history):
+    return [w for w in words if all(score_guess(g, w) == statuses for g, statuses in history)]
+
+
+def test_matches_naive_filter_on_random_games():
+    word_list = get_word_list()
+    answers = list(word_list.answers)
+    guesses = word_list.guess_words()
+    index = get_constraint_index(word_list)
+    rng = random.Random(11)
+    for _ in range(10):
+        answer = rng.choice(answers)
+        history = []
+        for guess in rng.sample(guesses, 3) + ["eerie", "speed"]:
+            history.append((guess, score_guess(guess, answer)))
+            assert index.candidates(history) == naive_filter(answers, history)
+
+
+def test_repeated_letter_counts():
+    index = ConstraintIndex(["abide", "eerie", "geese", "there", "speed"])
+    # One E present, one absent: exactly one E
+    assert index.candidates([("speed", score_guess("speed", "abide"))]) == ["abide"]
+    # Pattern codes are accepted as well as status lists
+    assert index.candidates([("eerie", pattern_code("eerie", "there"))]) == ["there"]
+    assert index.count([]) == 5
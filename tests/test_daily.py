@@ -0,0 +1,54 @@
+import subprocess
+import sys
+from datetime import date, timedelta
+
+import numpy as np
+from flask import Flask
+
+from src.daily import EPOCH, build_calendar, calendar_path, daily_answer, load_calendar, puzzle_number
+from src.service import GameService
+from src.web import init_api
+from src.word_list import WordList
+from tests.test_word_list import write_lists
+
+ANSWERS = ["abbey", "crane", "daisy", "slate", "tiger", "zonal"]
+
+
+def test_calendar_is_a_cached_permutation(tmp_path):
+    write_lists(tmp_path, ANSWERS, ["aahed"])
+    word_list = WordList(tmp_path)
+
+    calendar = load_calendar(word_list)
+    assert sorted(calendar.tolist()) == list(range(len(ANSWERS)))
+    assert calendar_path(word_list).exists()
+    assert np.array_equal(load_calendar(word_list), calendar)
+    assert not np.array_equal(build_calendar(word_list, "other seed"), calendar)
+
+    # One full cycle of days visits every answer once
+    days = [EPOCH + timedelta(days=n) for n in range(len(ANSWERS))]
+    assert sorted(daily_answer(day, word_list) for day in days) == ANSWERS
+    assert daily_answer(days[0] + timedelta(days=len(ANSWERS)), word_list) == daily_answer(days[0], word_list)
+
+
+def test_daily_answer_is_identical_across_processes():
+    day = date(2024, 1, 31)
+    code = f"from datetime import date; from src.daily import daily_answer; print(daily_answer(date({day.year}, {day.month}, {day.day})))"
+    other = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert other.stdout.split()[-1] == daily_answer(day)
+    assert puzzle_number(day) == 956
+
+
+def test_seeded_games_are_reproducible():
+    client = init_api(Flask(__name__), GameService()).test_client()
+    service = client.application.extensions["wordle_service"]
+
+    first = client.post("/api/games", json={"seed": 1234}).get_json()
+    second = client.post("/api/games", json={"seed": 1234}).get_json()
+    assert service.store.get(first["id"]).word == service.store.get(second["id"]).word
+    assert service.word_list.get_random_word("replay") == service.word_list.get_random_word("replay")
+
+    daily = client.post("/api/games", json={"date": "2024-01-31"}).get_json()
+    assert daily["puzzle"] == 956
+    assert service.store.get(daily["id"]).word == daily_answer(date(2024, 1, 31))
+    assert client.post("/api/games", json={"date": "yesterday"}).status_code == 400
+    assert client.post("/api/games", json={"seed": [1]}).status_code == 400
@@ -0,0 +1,64 @@
+from src.decision_tree import SOLVED, DecisionTree, load_decision_tree, tree_path
+from src.feedback import pattern_code
+from src.game import WordleGame
+from src.word_list import WordList
+
+from .test_word_list import write_lists
+
+ANSWERS = ["abide", "crane", "slate", "speed", "there", "trace", "crate", "grate", "irate", "plate"]
+
+
+def play_with_tree(tree, word_list, answer):
+    game = WordleGame(answer, word_list)
+    while not game.is_over():
+        guess = tree.next_guess(game)
+        assert guess is not None
+        game.make_guess(guess)
+    assert tree.next_guess(game) is None
+    return game
+
+
+def test_tree_solves_every_answer(tmp_path):
+    write_lists(tmp_path, ANSWERS, ["geese", "roate"])
+    word_list = WordList(tmp_path)
+    tree = DecisionTree.build(word_list, workers=1)
+    depths = tree.depths()
+    for i, answer in enumerate(word_list.answers):
+        game = play_with_tree(tree, word_list, answer)
+        assert game.is_won()
+        assert len(game.attempts) == depths[i]
+
+    summary = tree.summary()
+    assert summary["answers"] == len(ANSWERS)
+    assert summary["worst_case"] == depths.max()
+    assert sum(summary["histogram"].values()) == len(ANSWERS)
+
+
+def test_walk_follows_feedback_patterns(tmp_path):
+    write_lists(tmp_path, ANSWERS, ["geese", "roate"])
+    word_list = WordList(tmp_path)
+    tree = DecisionTree.build(word_list, workers=1)
+    game = play_with_tree(tree, word_list, "grate")
+    moves = [(guess, pattern_code(guess, "grate")) for guess in game.attempts]
+    assert tree.walk(moves) == SOLVED
+    assert tree.guess_word(tree.walk(moves[:-1])) == "grate"
+    root = tree.guess_word(0)
+    unseen = next(code for code in range(243) if all(pattern_code(root, a) != code for a in ANSWERS))
+    assert tree.walk([(root, unseen)]) is None
+
+    # A guess the tree would not play leaves it
+    off_tree = WordleGame("grate", word_list)
+    off_tree.make_guess("abide" if tree.guess_word(0) != "abide" else "crane")
+    assert tree.next_guess(off_tree) is None
+
+
+def test_parallel_build_matches_and_is_cached(tmp_path):
+    write_lists(tmp_path, ANSWERS, ["geese", "roate"])
+    word_list = WordList(tmp_path)
+    serial = DecisionTree.build(word_list, workers=1)
+    tree = load_decision_tree(word_list, workers=2)
+    assert tree_path(word_list).exists()
+    loaded = load_decision_tree(word_list, build=False)
+    for built in (tree, loaded):
+        for name in ("guesses", "edge_offsets", "edge_patterns", "edge_children", "edge_starts", "order"):
+            assert (getattr(built, name) == getattr(serial, name)).all(), name
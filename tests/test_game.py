@@ -0,0 +1,56 @@
+from itertools import product
+
+from src.feedback import score_guess
+from src.game import WordleGame
+
+
+def test_repeated_letters_are_not_over_reported():
+    game = WordleGame("abide")
+    assert game.make_guess("speed") == [
+        ('S', 'absent'), ('P', 'absent'), ('E', 'present'), ('E', 'absent'), ('D', 'present'),
+    ]
+
+
+def test_green_takes_priority_over_earlier_yellow():
+    game = WordleGame("there")
+    statuses = [status for _, status in game.make_guess("eerie")]
+    assert statuses == ['present', 'absent', 'present', 'absent', 'correct']
+
+
+def test_make_guess_conforms_to_reference_exhaustively():
+    # Every 5-letter word over a 3-letter alphabet covers all duplicate-letter layouts
+    words = ["".join(letters) for letters in product("abc", repeat=5)]
+    for answer in words:
+        game = WordleGame(answer)
+        for guess in words:
+            statuses = [status for _, status in game.make_guess(guess)]
+            assert statuses == score_guess(guess, answer), (guess, answer)
+
+
+def test_win_and_loss():
+    game = WordleGame("crane")
+    game.make_guess("slate")
+    assert not game.is_won() and not game.is_over()
+    game.make_guess("CRANE")
+    assert game.is_won() and game.is_over()
+
+
+def test_hard_mode_requires_revealed_hints():
+    game = WordleGame("crane", hard_mode=True)
+    game.make_guess("trace")  # -, R, A, (C), E
+    assert game.constraints == ([None, "r", "a", None, "e"], {"r": 1, "a": 1, "c": 1, "e": 1})
+
+    assert game.hard_mode_violation("slate") == "2nd letter must be R"
+    assert game.hard_mode_violation("grape") == "Guess must contain C"
+    assert not game.is_valid_guess("grape")
+    assert game.hard_mode_violation("crane") is None and game.is_valid_guess("CRANE")
+
+
+def test_hard_mode_tracks_repeated_letters():
+    game = WordleGame("there", hard_mode=True)
+    game.make_guess("eerie")  # (E), -, (R), -, E: two Es revealed
+    assert game.constraints[1] == {"e": 2, "r": 1}
+    assert game.hard_mode_violation("mercy") == "5th letter must be E"
+    assert game.hard_mode_violation("rupee") is None
+    assert game.hard_mode_violation("rinse") == "Guess must contain 2 Es"
+    assert WordleGame("there").hard_mode_violation("rinse") is None
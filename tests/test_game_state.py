@@ -0,0 +1,49 @@
+import pytest
+
+from src.feedback import pattern_code
+from src.game import WordleGame
+from src.game_state import CompactGame
+from src.word_list import get_word_list
+
+
+def test_compact_game_matches_wordle_game():
+    word_list = get_word_list()
+    game = WordleGame("abide", word_list)
+    state = CompactGame.for_word("abide", word_list)
+    for guess in ("speed", "aahed", "abide"):
+        assert state.make_guess(guess, word_list) == game.make_guess(guess)
+
+    assert state.attempts(word_list) == game.attempts
+    assert state.patterns == [pattern_code(g, "abide") for g in game.attempts]
+    assert state.is_won() and state.is_over()
+    assert CompactGame.from_game(game) == state
+
+
+def test_round_trip_is_a_few_bytes():
+    word_list = get_word_list()
+    state = CompactGame.for_word("crane", word_list)
+    state.make_guess("slate", word_list)
+    state.make_guess("zonal", word_list)
+
+    data = state.to_bytes()
+    assert len(data) == 4 + 3 * 2
+    restored = CompactGame.from_bytes(data)
+    assert restored == state
+    assert restored.guess_ids == [word_list.word_id("slate"), word_list.word_id("zonal")]
+    assert not restored.is_over()
+
+    with pytest.raises(ValueError):
+        CompactGame.from_bytes(data[:-1])
+
+
+def test_no_instance_dict():
+    assert not hasattr(CompactGame(0), "__dict__")
+    assert not hasattr(WordleGame("crane"), "__dict__")
+
+
+def test_words_over_five_letters_are_rejected():
+    # 3 ** 6 feedback codes do not fit in a MOVE's byte
+    with pytest.raises(ValueError):
+        CompactGame.for_word("planet")
+    with pytest.raises(ValueError):
+        CompactGame(0).add_guess(0, 3 ** 5)
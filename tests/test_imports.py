@@ -0,0 +1,23 @@
+import subprocess
+import sys
+
+import pytest
+
+CORE = ["src.game", "src.word_list", "src.service", "src.simulator", "src.game_state",
+        "src.session_store", "src.stats_store", "src.async_server", "src.ui"]
+
+
+def test_core_imports_no_frameworks():
+    code = "; ".join(f"import {module}" for module in CORE) + (
+        "; import sys; print(sorted({name.split('.')[0] for name in sys.modules} & {'kivy', 'flask', 'numpy'}))"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "[]"
+
+
+def test_kivy_front_end_does_not_import_flask():
+    pytest.importorskip("kivy")
+    code = "import src.ui.app, sys; print('flask' in sys.modules, 'kivy.core.window' in sys.modules)"
+    env = {"KIVY_NO_ARGS": "1", "KIVY_NO_CONSOLELOG": "1", "KIVY_NO_FILELOG": "1"}
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env).stdout
+    assert output.split()[-2:] == ["False", "False"]
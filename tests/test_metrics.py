@@ -0,0 +1,114 @@
+import json
+import os
+import pstats
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src import metrics
+from src.service import GameService
+from src.session_store import LRUSessionStore
+from src.web import create_app
+
+
+@pytest.fixture
+def registry():
+    saved = metrics._registry
+    metrics.disable()
+    try:
+        yield metrics.enable()
+    finally:
+        metrics._registry = saved
+
+
+def test_counters_and_histograms(registry):
+    metrics.counter("guesses_total", "Guesses").inc()
+    metrics.counter("guesses_total").inc(2)
+    histogram = metrics.histogram("lookup_seconds", "Lookups", {"kind": "word"}, buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        histogram.observe(value)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["guesses_total"]["series"] == [{"labels": {}, "value": 3}]
+    series = snapshot["lookup_seconds"]["series"][0]
+    assert series["labels"] == {"kind": "word"}
+    assert series["count"] == 3
+    assert series["buckets"] == {"0.1": 1, "1.0": 2, "+Inf": 3}
+    json.dumps(snapshot)
+
+    text = metrics.prometheus_text()
+    assert "# TYPE guesses_total counter\nguesses_total 3" in text
+    assert 'lookup_seconds_bucket{kind="word",le="+Inf"} 3' in text
+    assert 'lookup_seconds_count{kind="word"} 3' in text
+
+    with pytest.raises(ValueError):
+        metrics.histogram("guesses_total")
+
+
+def test_timed_is_free_when_disabled(registry):
+    def lookup():
+        return 42
+
+    metrics.disable()
+    assert metrics.timed("lookup_seconds")(lookup) is lookup
+    assert metrics.counter("anything") is metrics.histogram("anything")
+
+    metrics.enable()
+    wrapped = metrics.timed("lookup_seconds")(lookup)
+    assert wrapped is not lookup
+    assert wrapped() == 42 and wrapped() == 42
+    assert metrics.snapshot()["lookup_seconds"]["series"][0]["count"] == 2
+
+
+def test_write_snapshot_and_profile(registry, tmp_path):
+    metrics.counter("games_total").inc()
+    metrics.write_snapshot(tmp_path / "metrics.json")
+    metrics.write_snapshot(tmp_path / "metrics.prom")
+    assert json.loads((tmp_path / "metrics.json").read_text())["games_total"]["series"][0]["value"] == 1
+    assert "games_total 1" in (tmp_path / "metrics.prom").read_text()
+
+    with metrics.profile_session(str(tmp_path / "wordle.prof")) as profiler:
+        sum(range(1000))
+    assert profiler is not None
+    pstats.Stats(str(tmp_path / "wordle.prof"))
+    with metrics.profile_session("") as profiler:
+        assert profiler is None
+
+
+def test_metrics_endpoint(registry):
+    client = create_app(GameService(LRUSessionStore(10))).test_client()
+    client.post("/api/games")
+    client.get("/api/games/missing")
+    text = client.get("/metrics").get_data(as_text=True)
+    assert 'web_request_seconds_count{endpoint="api.start_game",status="201"} 1' in text
+    assert 'status="404"' in text
+
+    metrics.disable()
+    assert client.get("/metrics").status_code == 404
+
+
+def test_env_instruments_the_hot_paths(tmp_path):
+    out = tmp_path / "metrics.json"
+    script = ("from src.game import WordleGame\n"
+              "game = WordleGame('crane')\n"
+              "game.make_guess('slate')\n"
+              "game.make_guess('crane')\n"
+              "assert not game.is_valid_guess('qqqqq')\n")
+    env = {**os.environ, metrics.METRICS_ENV: "1", metrics.METRICS_FILE_ENV: str(out)}
+    subprocess.run([sys.executable, "-c", script], check=True, env=env, cwd=Path(__file__).parents[1])
+    snapshot = json.loads(out.read_text())
+    assert snapshot["game_make_guess_seconds"]["series"][0]["count"] == 2
+    assert snapshot["game_invalid_guesses_total"]["series"][0]["value"] == 1
+
+
+def test_frame_times_and_dropped_frames(registry):
+    from src.ui.frames import DROPPED_FRAME_SECONDS, FrameMonitor
+
+    monitor = FrameMonitor()
+    for dt in (0, 1 / 60, 1 / 60, DROPPED_FRAME_SECONDS * 2):
+        monitor._tick(dt)
+    snapshot = metrics.snapshot()
+    assert snapshot["ui_frame_seconds"]["series"][0]["count"] == 3
+    assert snapshot["ui_dropped_frames_total"]["series"][0]["value"] == 1
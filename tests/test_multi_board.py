@@ -0,0 +1,69 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.game import WordleGame
+from src.multi_board import UNUSED, MultiBoardGame
+from src.word_list import get_word_list
+
+RANK = {"absent": 0, "present": 1, "correct": 2}
+
+
+def test_boards_match_separate_games():
+    word_list = get_word_list()
+    rng = random.Random(7)
+    words = rng.sample(word_list.answers, 8)
+    game = MultiBoardGame(words, word_list)
+    singles = [WordleGame(word, word_list) for word in words]
+    keyboard = np.full((8, 26), UNUSED)
+    assert game.max_attempts == 13
+
+    for guess in rng.sample(word_list.answers, 6) + ["speed", "eerie", words[3]]:
+        turn = len(game.attempts)
+        scored = game.make_guess(guess)
+        assert list(scored) == [i for i, single in enumerate(singles) if not single.is_won()]
+        for board in scored:
+            result = singles[board].make_guess(guess)
+            assert game.feedback(board, turn) == result
+            for letter, status in result:
+                column = ord(letter.lower()) - 97
+                keyboard[board, column] = max(keyboard[board, column], RANK[status])
+        assert (game.keyboard == keyboard).all()
+
+    assert game.solved_at[3] == len(game.attempts) - 1
+    assert game.boards_solved() == sum(single.is_won() for single in singles)
+    assert list(game.scored_boards(0)) == list(range(8))
+
+
+def test_game_ends_when_every_board_is_solved():
+    game = MultiBoardGame(["crane", "slate", "there", "speed"])
+    for word in ["crane", "slate", "there"]:
+        game.make_guess(word)
+        assert not game.is_over()
+    game.make_guess("speed")
+    assert game.is_won() and game.is_over()
+    assert list(game.solved_at) == [0, 1, 2, 3]
+
+
+def test_game_is_lost_after_max_attempts():
+    game = MultiBoardGame(["crane", "slate"], max_attempts=2)
+    game.make_guess("crane")
+    game.make_guess("there")
+    assert game.is_over() and not game.is_won()
+    assert game.boards_solved() == 1
+
+
+def test_boards_must_share_a_length():
+    with pytest.raises(ValueError):
+        MultiBoardGame(["crane", "planet"])
+    with pytest.raises(ValueError):
+        MultiBoardGame([])
+
+
+def test_is_not_a_wordle_game():
+    game = MultiBoardGame(["crane", "slate"])
+    assert not isinstance(game, WordleGame)
+    assert game.is_valid_guess("SLATE") and game.is_valid_guess("there")
+    assert not game.is_valid_guess("qqqqq") and not game.is_valid_guess("cranes")
+    assert not game.is_valid_guess("")
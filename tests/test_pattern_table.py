@@ -0,0 +1,34 @@
+from src.feedback import pattern_code
+from src.pattern_table import load_pattern_table, table_path
+from src.word_list import WordList
+
+from .test_word_list import write_lists
+
+ANSWERS = ["abide", "crane", "speed", "there"]
+ALLOWED = ["eerie", "geese"]
+
+
+def test_pattern_lookup_matches_scorer(tmp_path):
+    write_lists(tmp_path, ANSWERS, ALLOWED)
+    word_list = WordList(tmp_path)
+    for guess in ANSWERS + ALLOWED:
+        for answer in ANSWERS:
+            assert word_list.pattern(guess, answer) == pattern_code(guess, answer)
+    assert table_path(word_list).exists()
+
+
+def test_cached_table_is_reused_and_invalidated(tmp_path):
+    write_lists(tmp_path, ANSWERS, ALLOWED)
+    original = WordList(tmp_path)
+    first_path = table_path(original)
+    load_pattern_table(original)
+    assert load_pattern_table(original, build=False) is not None
+
+    write_lists(tmp_path, ANSWERS + ["zonal"], ALLOWED)
+    changed = WordList(tmp_path)
+    assert table_path(changed) != first_path
+    assert load_pattern_table(changed, build=False) is None
+
+    table = load_pattern_table(changed)
+    assert table.shape == (7, 5)
+    assert not first_path.exists()
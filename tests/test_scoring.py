@@ -0,0 +1,55 @@
+from itertools import product
+import random
+
+import numpy as np
+
+from src.batch_scoring import encode_words, letter_counts, score_batch, score_guess_batch
+from src.feedback import decode_pattern, encode_pattern, pattern_code, score_guess
+from src.word_list import get_word_list
+
+
+def test_duplicate_letters():
+    assert score_guess("speed", "abide") == ['absent', 'absent', 'present', 'absent', 'present']
+    assert score_guess("eerie", "there") == ['present', 'absent', 'present', 'absent', 'correct']
+
+
+def test_pattern_round_trip():
+    statuses = ['correct', 'absent', 'present', 'present', 'absent']
+    assert decode_pattern(encode_pattern(statuses)) == statuses
+    assert pattern_code("crane", "crane") == 242
+
+
+def test_batch_matches_scalar_exhaustively_on_small_alphabet():
+    words = ["".join(letters) for letters in product("abc", repeat=5)]
+    codes = score_batch(words, words)
+    expected = np.array([[pattern_code(g, a) for a in words] for g in words], dtype=np.uint8)
+    assert np.array_equal(codes, expected)
+
+
+def test_single_guess_batch_matches_full_batch():
+    words = ["".join(letters) for letters in product("abc", repeat=5)]
+    answers = encode_words(words)
+    counts = letter_counts(answers)
+    codes = score_batch(answers, answers)
+    for i in range(0, len(words), 7):
+        assert np.array_equal(score_guess_batch(answers[i], answers, counts), codes[i])
+
+
+def test_long_words_get_wider_codes():
+    words = ["".join(letters) for letters in product("ab", repeat=8)]
+    codes = score_batch(words, words)
+    assert codes.dtype == np.uint16
+    assert codes[0, 0] == 3 ** 8 - 1
+    assert all(codes[i, j] == pattern_code(words[i], words[j]) for i in range(0, 256, 17) for j in range(256))
+    assert decode_pattern(int(codes[3, 200]), 8) == score_guess(words[3], words[200])
+
+
+def test_batch_matches_scalar_on_real_words():
+    word_list = get_word_list()
+    rng = random.Random(3)
+    guesses = rng.sample(list(word_list.allowed_guesses), 150) + ["speed", "eerie"]
+    answers = rng.sample(list(word_list.answers), 150)
+    codes = score_batch(encode_words(guesses), answers, chunk_size=7)
+    for i, guess in enumerate(guesses):
+        for j, answer in enumerate(answers):
+            assert codes[i, j] == pattern_code(guess, answer)
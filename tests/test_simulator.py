@@ -0,0 +1,33 @@
+from src.simulator import STRATEGIES, play_game, simulate
+from src.word_list import WordList
+
+from .test_word_list import write_lists
+
+
+def test_play_game_with_each_strategy(tmp_path):
+    write_lists(tmp_path, ["abide", "crane", "slate", "speed", "there"], ["geese"])
+    word_list = WordList(tmp_path)
+    for name, factory in STRATEGIES.items():
+        strategy = factory(word_list, 0)
+        for answer in word_list.answers:
+            assert 1 <= play_game(answer, strategy, word_list) <= 6, name
+
+
+def test_simulate_summary():
+    summary = simulate("entropy", workers=1, limit=5)
+    assert summary["games"] == 5
+    assert sum(summary["histogram"].values()) == 5
+    assert summary["wins"] == 5 - summary["histogram"].get(0, 0)
+
+
+def test_hard_mode_games_follow_the_rules(tmp_path):
+    write_lists(tmp_path, ["abide", "crane", "slate", "speed", "there"], ["geese", "trace"])
+    word_list = WordList(tmp_path)
+    for name, factory in STRATEGIES.items():
+        strategy = factory(word_list, 0)
+        for answer in word_list.answers:
+            # play_game raises if a strategy breaks the hard mode rules
+            assert 1 <= play_game(answer, strategy, word_list, hard_mode=True) <= 6, name
+
+    summary = simulate("entropy", workers=1, limit=20, hard_mode=True)
+    assert summary["hard_mode"] and summary["games"] == 20
@@ -0,0 +1,52 @@
+from src.feedback import pattern_code
+from src.game import WordleGame
+from src.solver import Solver
+from src.word_list import WordList
+
+from .test_word_list import write_lists
+
+ANSWERS = ["abide", "about", "crane", "slate", "speed", "there", "eerie"]
+ALLOWED = ["soare", "geese", "zonal"]
+
+
+def make_solver(tmp_path):
+    write_lists(tmp_path, ANSWERS, ALLOWED)
+    return Solver(WordList(tmp_path))
+
+
+def test_sync_keeps_candidates_consistent(tmp_path):
+    solver = make_solver(tmp_path)
+    game = WordleGame("speed", solver.word_list)
+
+    game.make_guess("geese")
+    solver.sync(game)
+    expected = [a for a in sorted(ANSWERS) if pattern_code("geese", a) == pattern_code("geese", "speed")]
+    assert solver.remaining_answers() == expected
+
+    game.make_guess("crane")
+    solver.sync(game)
+    assert solver.history == [("geese", pattern_code("geese", "speed")), ("crane", pattern_code("crane", "speed"))]
+    assert "speed" in solver.remaining_answers()
+
+
+def test_sync_resets_for_a_new_game(tmp_path):
+    solver = make_solver(tmp_path)
+    first = WordleGame("speed", solver.word_list)
+    first.make_guess("crane")
+    solver.sync(first)
+
+    second = WordleGame("crane", solver.word_list)
+    solver.sync(second)
+    assert solver.history == []
+    assert len(solver.remaining_answers()) == len(ANSWERS)
+
+
+def test_suggestions(tmp_path):
+    solver = make_solver(tmp_path)
+    opening = solver.suggest(3)
+    assert len(opening) == 3
+    assert [word for word, _ in opening] == [word for word, _ in solver.suggest(3)]
+    assert list((tmp_path / "cache").glob("first-guess-*.npy"))
+
+    solver.update("crane", pattern_code("crane", "crane"))
+    assert solver.suggest(1)[0][0] == "crane"
@@ -0,0 +1,153 @@
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from flask import Flask
+
+from src.service import GameService
+from src.sqlite_store import MAX_WRITE_ATTEMPTS, SQLiteStatsStore
+from src.stats_store import game_record
+from src.web import init_api
+
+
+def test_aggregates_are_materialized_per_user(tmp_path):
+    store = SQLiteStatsStore(tmp_path / "stats.db")
+    store.append([
+        game_record("crane", ["slate", "crane"], True, 30, user="ada"),
+        game_record("crane", ["slate"] * 6, False, 90, user="ada"),
+        game_record("slate", ["slate"], True, 5, user="bob"),
+    ])
+    store.record_game("crane", ["crane"] * 3, True, user="ada")
+
+    ada = store.get_stats("ada")
+    assert (ada.games_played, ada.games_won, ada.current_streak, ada.max_streak) == (3, 2, 1, 1)
+    assert ada.distribution == [0, 1, 1, 0, 0, 0]
+    assert store.get_stats("bob").distribution == [1, 0, 0, 0, 0, 0]
+    assert store.get_stats("nobody").games_played == 0
+    assert [len(record["guesses"]) for record in store.history("ada")] == [2, 6, 3]
+
+    with store.pool.connection() as connection:
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    store.close()
+    assert SQLiteStatsStore(tmp_path / "stats.db").get_stats("ada").games_played == 3
+
+
+def test_buffered_records_from_many_threads(tmp_path):
+    store = SQLiteStatsStore(tmp_path / "stats.db", batch_size=8)
+
+    def play(user):
+        for _ in range(50):
+            store.submit(game_record("crane", ["crane"], True, user=user))
+
+    threads = [threading.Thread(target=play, args=(f"user{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert [store.get_stats(f"user{i}").current_streak for i in range(4)] == [50] * 4
+    store.close()
+
+
+def test_failed_batch_stays_buffered_and_reads_do_not_write(tmp_path):
+    store = SQLiteStatsStore(tmp_path / "stats.db", flush_interval=60)
+    store.submit(game_record("crane", ["crane"], True, user="ada"))
+    store.submit(game_record("slate", ["crane", "slate"], True, user="ada"))
+
+    # Buffered games are read without being written
+    assert store.get_stats("ada").games_won == 2
+    assert [record["answer"] for record in store.history("ada")] == ["crane", "slate"]
+    assert len(store.games_between(0, float("inf"))) == 2
+    with store.pool.connection() as connection:
+        assert connection.execute("SELECT COUNT(*) FROM games").fetchone()[0] == 0
+
+    def locked(records, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    append, store.append = store.append, locked
+    with pytest.raises(sqlite3.OperationalError):
+        store.flush()
+    assert store.get_stats("ada").games_won == 2
+
+    store.append = append
+    store.close()
+    assert SQLiteStatsStore(tmp_path / "stats.db").get_stats("ada").distribution[:2] == [1, 1]
+
+
+def test_bad_record_does_not_stop_the_writer(tmp_path):
+    store = SQLiteStatsStore(tmp_path / "stats.db", flush_interval=60)
+    with pytest.raises(ValueError):
+        store.submit({"user": "ada", "won": True})
+    store.submit(game_record("crane", ["crane"], True, user="ada"))
+    # A record that goes bad after it was buffered is dropped on its own
+    spoiled = game_record("plate", ["plate"], True, user="ada")
+    store.submit(spoiled)
+    del spoiled["answer"]
+    store.submit(game_record("slate", ["crane", "slate"], True, user="ada"))
+    store._wake.set()
+    deadline = time.monotonic() + 5
+    while (store._pending or store._in_flight) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert store._writer.is_alive()
+    store.submit(game_record("trace", ["trace"], False, user="ada"))
+    store.close()
+    assert SQLiteStatsStore(tmp_path / "stats.db").get_stats("ada").games_played == 3
+
+
+def test_reads_see_each_game_once_without_waiting_for_the_writer(tmp_path):
+    store = SQLiteStatsStore(tmp_path / "stats.db", batch_size=4, flush_interval=0.001)
+    with store._flush_lock:
+        # A batch being written does not hold up readers
+        store.submit(game_record("crane", ["crane"], True, user="ada"))
+        assert store.get_stats("ada").games_played == 1
+
+    seen = []
+    done = threading.Event()
+
+    def read():
+        while not done.is_set():
+            seen.append(store.get_stats("ada").games_played)
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    for i in range(200):
+        store.submit(game_record("crane", ["crane"], True, user="ada"))
+    store.flush()
+    done.set()
+    reader.join()
+    assert seen == sorted(seen) and max(seen) <= 201
+    assert store.get_stats("ada").games_played == 201
+    assert len(list(store.history("ada"))) == 201
+    store.close()
+
+
+def test_batch_is_dropped_after_its_last_attempt(tmp_path):
+    store = SQLiteStatsStore(tmp_path / "stats.db", flush_interval=60)
+    store.submit(game_record("crane", ["crane"], True, user="ada"))
+
+    def locked(records, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    append, store.append = store.append, locked
+    for _ in range(MAX_WRITE_ATTEMPTS):
+        with pytest.raises(sqlite3.OperationalError):
+            store.flush()
+    assert store._pending == []
+    store.append = append
+    store.close()
+
+
+def test_web_api_serves_user_stats(tmp_path):
+    store = SQLiteStatsStore(tmp_path / "stats.db")
+    service = GameService(stats=store)
+    client = init_api(Flask(__name__), service).test_client()
+
+    game_id = client.post("/api/games", json={"user": "ada"}).get_json()["id"]
+    answer = service.store.get(game_id).word
+    client.post(f"/api/games/{game_id}/guess", json={"guess": answer})
+
+    stats = client.get("/api/users/ada/stats").get_json()
+    assert (stats["games_played"], stats["distribution"][0], stats["win_rate"]) == (1, 1, 1.0)
+    assert client.post("/api/games", json={"user": ""}).status_code == 400
+    store.close()
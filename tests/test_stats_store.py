@@ -0,0 +1,125 @@
+import json
+
+import pytest
+
+from src.stats_store import GameStats, StatsStore, game_record, snapshot_path_for
+
+
+def play(store, results):
+    for guesses, won in results:
+        store.record_game("crane", ["slate"] * (guesses - 1) + ["crane"], won, duration=1.5)
+
+
+def test_aggregates_are_updated_incrementally(tmp_path):
+    store = StatsStore(tmp_path / "stats.jsonl")
+    play(store, [(3, True), (4, True), (6, False), (3, True)])
+
+    stats = store.stats
+    assert (stats.games_played, stats.games_won) == (4, 3)
+    assert (stats.current_streak, stats.max_streak) == (1, 2)
+    assert stats.distribution == [0, 0, 2, 1, 0, 0]
+    assert stats.total_duration == 6.0
+    assert [len(record["guesses"]) for record in store.history()] == [3, 4, 6, 3]
+    store.close()
+
+
+def test_reopen_uses_snapshot_and_replays_the_rest(tmp_path):
+    log_path = tmp_path / "stats.jsonl"
+    store = StatsStore(log_path, compact_every=2)
+    play(store, [(2, True), (5, True), (1, False)])
+    store._file.flush()
+
+    # The snapshot covers the first two games; the third is replayed from the log
+    snapshot = json.loads(store.snapshot_path.read_text())
+    assert snapshot["stats"]["games_played"] == 2
+
+    reopened = StatsStore(log_path)
+    assert reopened.stats.to_dict() == store.stats.to_dict()
+    store.close()
+
+
+def test_torn_write_is_truncated_without_losing_earlier_games(tmp_path):
+    log_path = tmp_path / "stats.jsonl"
+    store = StatsStore(log_path)
+    play(store, [(3, True), (4, True)])
+    store.close()
+    good_size = log_path.stat().st_size
+
+    with open(log_path, "ab") as f:
+        f.write(b'{"answer":"crane","guesses":["cr')
+
+    reopened = StatsStore(log_path)
+    assert reopened.stats.games_won == 2
+    assert log_path.stat().st_size == good_size
+
+    play(reopened, [(1, True)])
+    reopened.close()
+    assert [record["won"] for record in StatsStore(log_path).history()] == [True] * 3
+
+
+def test_legacy_statistics_are_carried_over(tmp_path):
+    legacy = tmp_path / "statistics.json"
+    legacy.write_text(json.dumps({"games_played": 10, "games_won": 7, "current_streak": 2, "max_streak": 5}))
+
+    store = StatsStore(tmp_path / "stats.jsonl", legacy_path=legacy)
+    play(store, [(4, True)])
+    assert (store.stats.games_played, store.stats.current_streak, store.stats.max_streak) == (11, 3, 5)
+    store.close()
+    assert StatsStore(tmp_path / "stats.jsonl", legacy_path=legacy).stats.games_played == 11
+
+
+def test_legacy_statistics_survive_a_crash_before_the_first_snapshot(tmp_path):
+    legacy = tmp_path / "statistics.json"
+    legacy.write_text(json.dumps({"games_played": 50, "games_won": 40}))
+
+    store = StatsStore(tmp_path / "stats.jsonl", legacy_path=legacy)
+    play(store, [(4, True)])
+    store._file.flush()  # Crash here: no close(), no compaction snapshot
+
+    assert StatsStore(tmp_path / "stats.jsonl", legacy_path=legacy).stats.games_played == 51
+
+
+def test_corrupt_line_does_not_drop_later_games(tmp_path):
+    log_path = tmp_path / "stats.jsonl"
+    store = StatsStore(log_path)
+    play(store, [(3, True)])
+    store.close()
+    with open(log_path, "ab") as f:
+        f.write(b"not json\n")
+    store = StatsStore(log_path)
+    play(store, [(2, True), (5, True)])
+    store.close()
+    size = log_path.stat().st_size
+
+    snapshot_path_for(log_path).unlink()  # Force a full replay
+    reopened = StatsStore(log_path)
+    assert reopened.stats.games_won == 3
+    assert log_path.stat().st_size == size
+    assert len(list(reopened.history())) == 3
+
+
+def test_json_that_is_not_a_game_record_is_skipped(tmp_path):
+    log_path = tmp_path / "stats.jsonl"
+    store = StatsStore(log_path)
+    play(store, [(3, True)])
+    store.close()
+    with open(log_path, "ab") as f:
+        f.write(b'{}\n123\n{"won": true}\n["crane"]\n')
+        f.write(b'{"answer":"crane","guesses":[],"won":true,"finished_at":1}\n')
+    store = StatsStore(log_path)
+    play(store, [(2, True)])
+    store.close()
+
+    snapshot_path_for(log_path).unlink()
+    reopened = StatsStore(log_path)
+    assert (reopened.stats.games_played, reopened.stats.distribution[:3]) == (2, [0, 1, 1])
+    assert len(list(reopened.history())) == 2
+
+
+def test_invalid_records_are_rejected():
+    stats = GameStats()
+    for record in ({}, 123, {**game_record("crane", [], True)}, {**game_record("crane", ["crane"], True), "won": 1}):
+        with pytest.raises(ValueError):
+            stats.add(record)
+    stats.add(game_record("crane", [], False))
+    assert (stats.games_played, stats.distribution) == (1, [0] * 6)
@@ -0,0 +1,244 @@
+import os
+
+import pytest
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+pytest.importorskip("kivy")
+
+from src.ui.tile import CORRECT_COLOR, DEFAULT_COLOR, Tile
+
+
+def test_tile_status_changes_reuse_canvas_instructions():
+    tile = Tile()
+    instructions = list(tile.canvas.before.children)
+
+    tile.set_status("correct")
+    assert tuple(tile._bg_color.rgba) == pytest.approx(CORRECT_COLOR)
+    assert tile._border_color.a == 0
+
+    tile.set_status("default")
+    tile.pos = (10, 20)
+    tile.size = (40, 40)
+    assert list(tile.canvas.before.children) == instructions
+    assert tuple(tile._bg_color.rgba) == pytest.approx(DEFAULT_COLOR)
+    assert tuple(tile._bg.pos) == (10, 20)
+    assert tuple(tile._shadow.pos) == (12, 18)
+
+
+def count_tiles(widget):
+    return sum(1 for child in widget.walk() if isinstance(child, Tile))
+
+
+@pytest.fixture
+def created_tiles(monkeypatch):
+    """Every Tile a TileGrid creates from now on."""
+    from src.ui import grid as grid_module
+    created = []
+
+    class CountedTile(Tile):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            created.append(self)
+
+    monkeypatch.setattr(grid_module, "Tile", CountedTile)
+    return created
+
+
+def test_tile_grid_builds_one_set_of_tiles(created_tiles):
+    from kivy.clock import Clock
+    from src.ui.grid import TileGrid
+
+    grid = TileGrid()
+    # Properties set after construction (as a KV rule does) cost no extra builds
+    grid.word_length = 4
+    grid.num_attempts = 7
+    assert count_tiles(grid) == 0
+    assert [len(row) for row in grid.rows_of_tiles] == [4] * 7
+    assert count_tiles(grid) == len(created_tiles) == 28
+
+    grid.word_length = 6
+    Clock.tick()
+    assert count_tiles(grid) == 42 and len(created_tiles) == 28 + 42
+
+
+def test_game_ui_creates_exactly_one_grid_of_tiles():
+    from kivy.lang import Builder
+    from src.ui.app import KV_FILE, NUM_ATTEMPTS, WORD_LENGTH, WordleGameUI
+
+    Builder.load_file(str(KV_FILE))
+    try:
+        ui = WordleGameUI()
+        assert count_tiles(ui) == WORD_LENGTH * NUM_ATTEMPTS
+        assert ui.tiles[0][0] is ui.ids.tile_grid.children[-1]
+    finally:
+        Builder.unload_file(str(KV_FILE))
+
+
+def test_game_ui_plays_other_word_lengths(tmp_path, created_tiles):
+    from kivy.lang import Builder
+    from src.ui.app import KV_FILE, NUM_ATTEMPTS, WordleGameUI
+    from src.word_list import WordList, set_word_list
+    from tests.test_word_list import write_lists
+
+    for length, words in [(6, ["planet"]), (4, ["lamp"])]:
+        (tmp_path / str(length)).mkdir()
+        write_lists(tmp_path / str(length), words, [])
+        set_word_list(WordList(tmp_path / str(length), length))
+    Builder.load_file(str(KV_FILE))
+    try:
+        ui = WordleGameUI(word_length=6)
+        assert count_tiles(ui) == 6 * NUM_ATTEMPTS
+        assert len(created_tiles) == 6 * NUM_ATTEMPTS  # No default 5-letter grid built first
+        assert ui.answer == "PLANET"
+        for letter in "PLANETS":
+            ui.on_keyboard_input(letter)
+        assert ui.current_guess == "PLANET"
+
+        ui.word_length = 4
+        assert count_tiles(ui) == 4 * NUM_ATTEMPTS
+        assert (ui.answer, ui.current_guess) == ("LAMP", "")
+        assert len(ui.tile_grid.rows_of_tiles[0]) == 4
+    finally:
+        Builder.unload_file(str(KV_FILE))
+        set_word_list(None)
+
+
+def test_multi_board_ui_scores_every_board_and_paints_keys(tmp_path):
+    from kivy.lang import Builder
+    from src.ui.app import KV_FILE, MultiBoardGameUI
+    from src.word_list import WordList, set_word_list
+    from tests.test_word_list import write_lists
+
+    write_lists(tmp_path, ["crane", "slate", "there", "speed"], ["eerie"])
+    set_word_list(WordList(tmp_path))
+    Builder.load_file(str(KV_FILE))
+    try:
+        ui = MultiBoardGameUI(boards=4)
+        assert count_tiles(ui) == 4 * 5 * ui.game.max_attempts
+        assert sorted(ui.game.words) == ["crane", "slate", "speed", "there"]
+        for letter in "CRANE":
+            ui.on_keyboard_input(letter)
+        assert all(grid.rows_of_tiles[0][4].text == "E" for grid in ui.board_grid.grids)
+        ui.on_enter()
+
+        crane = ui.game.words.index("crane")
+        assert [tile.status for tile in ui.board_grid.grids[crane].rows_of_tiles[0]] == ["correct"] * 5
+        assert ui.key_status.painted[crane, ord("c") - 97] == 2
+        assert (ui.key_status.painted == ui.game.keyboard).all()
+        # The solved board takes no more letters
+        ui.on_keyboard_input("S")
+        assert ui.board_grid.grids[crane].rows_of_tiles[1][0].text == ""
+        assert sum(grid.rows_of_tiles[1][0].text == "S" for grid in ui.board_grid.grids) == 3
+
+        ui.reset_game()
+        assert not (ui.key_status.painted >= 0).any()
+        assert all(tile.text == "" for tile in ui.board_grid.iter_tiles())
+    finally:
+        Builder.unload_file(str(KV_FILE))
+        set_word_list(None)
+
+
+def test_reveal_scheduler_steps_through_the_row():
+    from src.ui.reveal import RevealScheduler
+
+    tiles = [Tile(text=letter) for letter in "CRANE"]
+    statuses = ["correct", "absent", "present", "absent", "correct"]
+    scheduler = RevealScheduler(instant=False)
+    revealed, completed = [], []
+    scheduler.bind(on_tile_revealed=lambda _, tile, status: revealed.append((tile.text, status)))
+    scheduler.bind(on_complete=lambda _: completed.append(True))
+
+    scheduler.reveal(tiles, statuses)
+    scheduler.step(0.1)
+    assert tiles[0].opacity == pytest.approx(1 / 3)
+    assert tiles[0].status == "default" and tiles[1].opacity == 1
+
+    scheduler.step(0.1)
+    assert revealed == [("C", "correct")]
+    assert tiles[0].status == "correct" and tiles[1].status == "default"
+
+    while scheduler.step(0.1):
+        pass
+    assert revealed == list(zip("CRANE", statuses))
+    assert completed == [True]
+    assert [tile.opacity for tile in tiles] == [1] * 5
+    scheduler.cancel()
+
+
+def test_reveal_scheduler_instant_mode():
+    from src.ui.reveal import RevealScheduler
+
+    tiles = [Tile(text=letter) for letter in "SLATE"]
+    scheduler = RevealScheduler(instant=True)
+    completed = []
+    scheduler.bind(on_complete=lambda _: completed.append(True))
+
+    scheduler.reveal(tiles, ["absent"] * 5)
+    assert not scheduler.active and completed == [True]
+    assert [tile.status for tile in tiles] == ["absent"] * 5
+
+
+def test_reveal_scheduler_empty_and_mismatched_rows():
+    from src.ui.reveal import RevealScheduler
+
+    scheduler = RevealScheduler(instant=False)
+    completed = []
+    scheduler.bind(on_complete=lambda _: completed.append(True))
+    scheduler.reveal([], [])
+    assert not scheduler.active and completed == [True]
+
+    tiles = [Tile(text=letter) for letter in "SLATE"]
+    with pytest.raises(ValueError):
+        scheduler.reveal(tiles, ["absent"] * 4)
+    assert not scheduler.active and [tile.status for tile in tiles] == ["default"] * 5
+
+
+def test_game_over_check_waits_for_the_reveal(monkeypatch):
+    from kivy.lang import Builder
+    from src.ui.app import CORRECT_COLOR, KV_FILE, WordleGameUI
+
+    Builder.load_file(str(KV_FILE))
+    try:
+        ui = WordleGameUI()
+        ui.reveal.instant = False
+        checks = []
+        monkeypatch.setattr(ui, "check_game_status", lambda: checks.append(ui.game.is_won()))
+
+        for letter in ui.answer:
+            ui.on_keyboard_input(letter)
+        ui.on_enter()
+        assert checks == [] and ui.reveal.active
+
+        ui.reveal.finish()
+        assert checks == [True]
+        assert tuple(ui.keys[ui.answer[0]].background_color) == CORRECT_COLOR
+    finally:
+        Builder.unload_file(str(KV_FILE))
+
+
+def test_resize_events_coalesce_into_one_relayout_per_frame():
+    from kivy.clock import Clock
+    from kivy.lang import Builder
+    from src.ui.app import KV_FILE, WordleGameUI, compute_layout
+
+    Builder.load_file(str(KV_FILE))
+    try:
+        ui = WordleGameUI()
+        Clock.tick()  # Bring the clock's frame time up to date
+        for width in range(300, 400, 2):
+            ui._on_window_resize(None, width, 700)
+        assert ui.resize_stats == {'resize_events': 50, 'relayouts': 0}
+
+        Clock.tick_draw()  # Runs the callbacks due before the next frame
+        layout = compute_layout(398, 700)
+        assert ui.resize_stats == {'resize_events': 50, 'relayouts': 1}
+        assert tuple(ui.tile_grid.size) == layout['grid_size']
+        assert all(tuple(tile.size) == layout['tile_size'] for tile in ui.tile_grid.iter_tiles())
+        assert ui.keys['Q'].width == layout['key_width']
+
+        ui._end_resize_gesture(0)
+        assert ui.last_resize_gesture['relayouts'] == 1
+        assert ui.resize_stats['resize_events'] == 0
+    finally:
+        Builder.unload_file(str(KV_FILE))
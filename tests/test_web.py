@@ -0,0 +1,141 @@
+from flask import Flask
+
+from src.game import WordleGame
+from src.service import GameService
+from src.session_store import LRUSessionStore
+from src.sqlite_store import SQLiteStatsStore
+from src import stats_store
+from src.stats_store import StatsStore, set_stats_store
+from src.web import init_api
+
+
+def make_client(capacity=10):
+    service = GameService(LRUSessionStore(capacity))
+    app = init_api(Flask(__name__), service)
+    return app.test_client(), service
+
+
+def test_play_a_game_over_http():
+    client, service = make_client()
+    response = client.post("/api/games")
+    assert response.status_code == 201
+    game_id = response.get_json()["id"]
+    answer = service.store.get(game_id).word
+
+    response = client.post(f"/api/games/{game_id}/guess", json={"guess": answer.upper()})
+    body = response.get_json()
+    assert response.status_code == 200
+    assert [item["status"] for item in body["feedback"]] == ["correct"] * 5
+    assert body["won"] and body["over"] and body["answer"] == answer
+
+    state = client.get(f"/api/games/{game_id}").get_json()
+    assert state["attempts"] == [{"guess": answer, "statuses": ["correct"] * 5}]
+
+    response = client.post(f"/api/games/{game_id}/guess", json={"guess": answer})
+    assert response.status_code == 400
+
+
+def test_errors():
+    client, _ = make_client()
+    game_id = client.post("/api/games").get_json()["id"]
+    assert client.post(f"/api/games/{game_id}/guess", json={"guess": "zzzzz"}).status_code == 400
+    assert client.post(f"/api/games/{game_id}/guess", data="not json").status_code == 400
+    assert client.post(f"/api/games/{game_id}/guess", json=["crane"]).status_code == 400
+    for body in ([1], "crane", 5):
+        response = client.post("/api/games", json=body)
+        assert response.status_code == 400 and "error" in response.get_json()
+    assert client.get("/api/games/missing").status_code == 404
+
+
+def test_lru_store_evicts_oldest():
+    store = LRUSessionStore(capacity=2)
+    store.put("a", 1)
+    store.put("b", 2)
+    store.get("a")
+    store.put("c", 3)
+    assert store.get("b") is None
+    assert store.get("a") == 1 and store.get("c") == 3
+
+
+def test_hard_mode_over_http():
+    client, service = make_client()
+    state = client.post("/api/games", json={"hard_mode": True}).get_json()
+    assert state["hard_mode"]
+    assert not client.post("/api/games", json={"hard_mode": False}).get_json()["hard_mode"]
+    for value in ("false", "0", 1, None):
+        assert client.post("/api/games", json={"hard_mode": value}).status_code == 400
+    service.store.put(state["id"], WordleGame("crane", service.word_list, hard_mode=True))
+
+    assert client.post(f"/api/games/{state['id']}/guess", json={"guess": "trace"}).status_code == 200
+    response = client.post(f"/api/games/{state['id']}/guess", json={"guess": "slate"})
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "2nd letter must be R"
+    assert client.post(f"/api/games/{state['id']}/guess", json={"guess": "zzzzz"}).get_json()["error"] == "Not in word list"
+
+
+def test_word_length_over_http():
+    client, _ = make_client()
+    assert client.post("/api/games", json={"word_length": 5}).get_json()["word_length"] == 5
+    assert client.post("/api/games", json={"word_length": 11}).status_code == 400
+    assert client.post("/api/games", json={"word_length": "6"}).status_code == 400
+
+
+def play_one_game(client, app, user):
+    game_id = client.post("/api/games", json={"user": user}).get_json()["id"]
+    answer = app.extensions["wordle_service"].store.get(game_id).word
+    client.post(f"/api/games/{game_id}/guess", json={"guess": answer})
+
+
+def test_web_games_only_use_a_per_user_stats_backend(tmp_path):
+    saved = stats_store._shared_stats_store
+    try:
+        # The desktop player's JSON-lines log is left alone
+        set_stats_store(StatsStore(tmp_path / "stats.jsonl"))
+        app = init_api(Flask(__name__))
+        client = app.test_client()
+        play_one_game(client, app, "alice")
+        assert not (tmp_path / "stats.jsonl").exists()
+        assert client.get("/api/users/bob/stats").status_code == 404
+
+        store = SQLiteStatsStore(tmp_path / "stats.db")
+        set_stats_store(store)
+        app = init_api(Flask(__name__))
+        client = app.test_client()
+        play_one_game(client, app, "alice")
+        assert client.get("/api/users/alice/stats").get_json()["games_played"] == 1
+        assert client.get("/api/users/bob/stats").get_json()["games_played"] == 0
+        store.close()
+    finally:
+        set_stats_store(saved)
+
+
+def test_concurrent_guesses_on_one_game_are_serialised(monkeypatch):
+    import threading
+    import time
+
+    from src.service import InvalidGuess
+
+    finished = []
+    service = GameService(LRUSessionStore(10), on_finished=finished.append)
+    game_id = service.start_game()["id"]
+    game = service.store.get(game_id)
+    is_valid_guess = WordleGame.is_valid_guess
+
+    def slow_is_valid_guess(self, guess):
+        time.sleep(0.01)  # Widens the window between the checks and the guess
+        return is_valid_guess(self, guess)
+    monkeypatch.setattr(WordleGame, "is_valid_guess", slow_is_valid_guess)
+
+    outcomes = []
+    def guess():
+        try:
+            outcomes.append(service.submit_guess(game_id, game.word)["won"])
+        except InvalidGuess:
+            outcomes.append("rejected")
+    threads = [threading.Thread(target=guess) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(outcomes, key=str) == [True] + ["rejected"] * 7
+    assert len(finished) == 1 and game.attempts == [game.word]
@@ -0,0 +1,110 @@
+import os
+
+import pytest
+
+from src import word_list as word_list_module
+from src.game import WordleGame
+from src.packed_words import COMPILED_FILE, compile_word_lists
+from src.word_list import (
+    ALLOWED_GUESSES_FILE, ANSWERS_FILE, WordList, available_lengths,
+    get_word_list, partition_dir, reload_word_list_if_changed, set_word_list,
+)
+
+
+def write_lists(data_dir, answers, allowed):
+    (data_dir / ANSWERS_FILE).write_text("\n".join(answers) + "\n")
+    (data_dir / ALLOWED_GUESSES_FILE).write_text("\n".join(allowed) + "\n")
+
+
+def test_games_share_one_word_list():
+    set_word_list(None)
+    first = WordleGame("crane")
+    second = WordleGame("slate")
+    assert first.word_list is second.word_list is get_word_list()
+
+
+def test_injected_word_list(tmp_path):
+    write_lists(tmp_path, ["crane", "slate"], ["aahed"])
+    word_list = WordList(tmp_path)
+    game = WordleGame("crane", word_list)
+    assert game.word_list is word_list
+    assert list(word_list.answers) == ["crane", "slate"]
+    assert word_list.is_valid_word("AAHED")
+    assert not word_list.is_valid_word("zzzzz")
+
+
+def test_reload_on_change(tmp_path):
+    write_lists(tmp_path, ["crane"], ["aahed"])
+    original = WordList(tmp_path)
+    set_word_list(original)
+    try:
+        assert reload_word_list_if_changed() is original
+
+        write_lists(tmp_path, ["crane", "slate"], ["aahed"])
+        mtime = os.stat(tmp_path / ANSWERS_FILE).st_mtime_ns + 1_000_000
+        os.utime(tmp_path / ANSWERS_FILE, ns=(mtime, mtime))
+
+        reloaded = reload_word_list_if_changed()
+        assert reloaded is not original
+        assert list(reloaded.answers) == ["crane", "slate"]
+        assert list(original.answers) == ["crane"]
+    finally:
+        set_word_list(None)
+
+
+def test_compiled_word_list_matches_text(tmp_path):
+    write_lists(tmp_path, ["slate", "crane"], ["aahed", "zonal"])
+    text = WordList(tmp_path)
+    compile_word_lists(["slate", "crane"], ["aahed", "zonal"], tmp_path / COMPILED_FILE)
+    compiled = WordList(tmp_path)
+
+    assert (text.source, compiled.source) == ("text", "compiled")
+    assert list(compiled.answers) == list(text.answers) == ["crane", "slate"]
+    assert list(compiled.allowed_guesses) == ["aahed", "zonal"]
+    assert compiled.is_valid_word("zonal") and not compiled.is_valid_word("zonk")
+    assert compiled.answers.find("slate") == 1
+
+
+def test_corrupt_compiled_file_falls_back_to_text(tmp_path, capsys):
+    write_lists(tmp_path, ["crane"], ["aahed"])
+    compile_word_lists(["crane"], ["aahed"], tmp_path / COMPILED_FILE)
+    blob = bytearray((tmp_path / COMPILED_FILE).read_bytes())
+    blob[-1] ^= 0xFF
+    (tmp_path / COMPILED_FILE).write_bytes(bytes(blob))
+
+    word_list = WordList(tmp_path)
+    assert word_list.source == "text"
+    assert "checksum" in capsys.readouterr().out
+
+
+def test_word_lengths_load_lazily_from_their_own_partitions(tmp_path, monkeypatch):
+    monkeypatch.setattr(word_list_module, "DATA_DIR", tmp_path)
+    write_lists(tmp_path, ["crane"], ["aahed"])
+    for length, answers in [(4, ["lamp", "wolf"]), (6, ["planet", "orange"])]:
+        partition_dir(length).mkdir()
+        write_lists(partition_dir(length), answers, [])
+    compile_word_lists(["planet", "orange"], [], partition_dir(6) / COMPILED_FILE, 6)
+    set_word_list(None)
+    try:
+        assert available_lengths() == [4, 5, 6]
+        assert word_list_module._shared_word_lists == {}
+        six = get_word_list(6)
+        assert list(word_list_module._shared_word_lists) == [6]
+        assert (six.source, six.word_length, list(six.answers)) == ("compiled", 6, ["orange", "planet"])
+
+        game = WordleGame("wolf")
+        assert game.word_list is get_word_list(4)
+        assert game.is_valid_guess("lamp") and not game.is_valid_guess("crane")
+        assert [status for _, status in game.make_guess("lamp")] == ["present", "absent", "absent", "absent"]
+        with pytest.raises(ValueError):
+            get_word_list(7)
+    finally:
+        set_word_list(None)
+
+
+def test_compiled_file_of_another_length_is_ignored(tmp_path):
+    write_lists(tmp_path, ["planet"], [])
+    compile_word_lists(["crane"], [], tmp_path / COMPILED_FILE)
+    word_list = WordList(tmp_path, 6)
+    assert word_list.source == "text"
+    assert list(word_list.answers) == ["planet"]